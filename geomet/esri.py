@@ -26,7 +26,7 @@ def load(source_file):
          A GeoJSON `dict` representing the geometry read from the file.
 
     """
-    return json.load(source_file)
+    return loads(json.load(source_file))
 
 
 def loads(string):
@@ -34,12 +34,17 @@ def loads(string):
     Construct a GeoJSON `dict` from Esri JSON (string/dict).
 
     :param string:
-        The Esri JSON geometry representation
+        The Esri JSON geometry representation, either as a string, or
+        already parsed into a `dict` (like the geometries of an Esri
+        FeatureSet), which is converted without any JSON round trip.
 
     :returns:
          A GeoJSON `dict` representing the geometry read from the file.
     """
-    data = json.loads(string)
+    if isinstance(string, dict):
+        data = string
+    else:
+        data = json.loads(string)
 
     if "rings" in data:
         return _esri_to_geojson_convert["rings"](data)
@@ -215,7 +220,11 @@ def _to_gj_multipoint(data):
     :returns: `dict`
     """
 
-    return {"type": "MultiPoint", "coordinates": [pt for pt in data["points"]]}
+    # Copy the points, which may belong to a caller's `dict`.
+    return {
+        "type": "MultiPoint",
+        "coordinates": [list(pt) for pt in data["points"]],
+    }
 
 
 def _to_gj_polyline(data):
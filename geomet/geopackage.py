@@ -12,17 +12,22 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import collections.abc as _collections
+import contextlib as _contextlib
+import itertools as _itertools
+import pathlib as _pathlib
+import sqlite3 as _sqlite3
 import struct as _struct
 
 from geomet.util import (
-    as_bin_str as _as_bin_str,
-    take as _take,
-    endian_token as _endian_token
+    block_splitter as _block_splitter,
+    endian_token as _endian_token,
+    is_empty as _is_empty_coords
 )
 from geomet import wkb as _wkb
 
 
-def dump(obj, dest_file, big_endian=True):
+def dump(obj, dest_file, big_endian=True, compute_envelope=False):
     """
     Dump GeoJSON-like `dict` to GeoPackage binary
     and write it to the `dest_file`.
@@ -34,10 +39,12 @@ def dump(obj, dest_file, big_endian=True):
         Open and writable file-like object.
     :param bool big_endian:
         specify endianess of the dumped object.
+    :param bool compute_envelope:
+        See :func:`dumps`.
 
     :return:
     """
-    dest_file.write(dumps(obj, big_endian))
+    dest_file.write(dumps(obj, big_endian, compute_envelope))
 
 
 def load(source_file):
@@ -54,7 +61,7 @@ def load(source_file):
     return loads(source_file.read())
 
 
-def dumps(obj, big_endian=True):
+def dumps(obj, big_endian=True, compute_envelope=False):
     """
     Dump a GeoJSON-like dict to a GeoPackage bytestring.
 
@@ -78,9 +85,20 @@ def dumps(obj, big_endian=True):
     with this information.
 
 
-    If the geometry's coordinates are empty (an empty list)
-    then the geopackage header's "empty" flag will be set,
-    denoting that this geometry has no coordinates.
+    Alternatively, if `compute_envelope` is True, the envelope
+    is computed from the coordinates of the geometry, and covers
+    all of its dimensions: the envelope indicator is set to
+    1 for 2D (XY) geometries, 2 for 3D (XYZ) geometries, 3 for
+    3D (XYM) geometries and 4 for 4D (XYZM) geometries. Any
+    'bbox' key is ignored then.
+    This makes the geometry cheap to filter by envelope for
+    any GeoPackage reader (see :func:`envelope`).
+
+
+    If the geometry's coordinates are empty (an empty list),
+    or it is a GeometryCollection of such geometries, then the
+    geopackage header's "empty" flag will be set, denoting that
+    this geometry has no coordinates.
 
     Please note that while this library can parse geopackages
     with a mixed byte-order in the header, it will only produce
@@ -93,17 +111,24 @@ def dumps(obj, big_endian=True):
     :param bool big_endian:
         if True, the geopackage binary will use big-endian
         byte order, little-endian otherwise.
+    :param bool compute_envelope:
+        if True, compute the envelope from the coordinates.
 
     :return bytes:
         bytestring representing the geometry in geopackage
         format.
     """
-    header = _build_geopackage_header(obj, not big_endian)
     result = _wkb._dumps(obj, big_endian, include_meta=False)
+    envelope = None
+    is_m = False
+    if compute_envelope:
+        # Scan the packed WKB, rather than the nested coordinate lists.
+        envelope, is_m = _scan_envelope(memoryview(result))
+    header = _build_geopackage_header(obj, not big_endian, envelope, is_m)
     return header + result
 
 
-def loads(string):
+def loads(string, as_numpy=False):
     """
     Construct a GeoJSON `dict` from geopackage (string).
 
@@ -123,12 +148,14 @@ def loads(string):
 
     :param bytes string:
         geopackage byte string.
+    :param bool as_numpy:
+        If `True`, give the coordinates as NumPy arrays. See
+        `geomet.wkb.loads`.
     :return dict:
         GeoJSON represented the parsed geopackage binary.
     """
-    string = iter(string)
-
-    header = _as_bin_str(_take(_GeoPackage.HEADER_LEN, string))
+    data = _wkb._as_buffer(string)
+    header = bytes(data[:_GeoPackage.HEADER_LEN])
 
     _check_is_valid(header)
     g, p, version, empty, envelope_indicator, is_little_endian, srid = (
@@ -136,15 +163,14 @@ def loads(string):
     )
 
     wkb_offset = _get_wkb_offset(envelope_indicator)
-    left_to_take = (wkb_offset - _GeoPackage.HEADER_LEN)
-    envelope_data = _as_bin_str(_take(left_to_take, string))
+    envelope_data = bytes(data[_GeoPackage.HEADER_LEN:wkb_offset])
 
     if envelope_data:
         envelope = _parse_envelope(
             envelope_indicator, envelope_data, is_little_endian
         )
 
-    result = _wkb.loads(string)
+    result = _wkb.loads(data[wkb_offset:], as_numpy)
 
     if srid:
         result['meta'] = {'srid': int(srid)}
@@ -159,6 +185,852 @@ def loads(string):
     return result
 
 
+def to_wkb(string):
+    """
+    Convert a GeoPackage geometry blob to WKB.
+
+    Only the GeoPackage header and envelope are stripped off: the WKB
+    geometry which follows them is copied as it is, without decoding any
+    coordinates. If the header has an SRID, it is written into the WKB
+    header, giving EWKB; otherwise, any SRID of the WKB is kept.
+
+    >>> gpkg = dumps({'type': 'Point', 'coordinates': [0.0, 1.0],
+    ...               'meta': {'srid': 4326}})
+    >>> to_wkb(gpkg) == _wkb.dumps({'type': 'Point',
+    ...                             'coordinates': [0.0, 1.0],
+    ...                             'meta': {'srid': 4326}})
+    True
+
+    :param bytes string:
+        geopackage byte string.
+
+    :return bytes:
+        (E)WKB representing the same geometry.
+    """
+    data = _wkb._as_buffer(string)
+    header = bytes(data[:_GeoPackage.HEADER_LEN])
+
+    _check_is_valid(header)
+    _, _, _, _, envelope_indicator, _, srid = _parse_header(header)
+
+    # Like `loads`, a non-zero SRID in the geopackage header takes
+    # precedence over any SRID in the WKB header, which is kept otherwise.
+    wkb_data = data[_get_wkb_offset(envelope_indicator):]
+    if not srid:
+        return bytes(wkb_data)
+    return _wkb._replace_srid(wkb_data, srid)
+
+
+def from_wkb(string, srid=None, bbox=None):
+    """
+    Convert a WKB (or EWKB) geometry to a GeoPackage geometry blob.
+
+    Only a GeoPackage header is added in front of the WKB geometry, which is
+    copied as it is, without decoding any coordinates. The header uses the
+    byte order of the WKB.
+
+    :param bytes string:
+        WKB byte string.
+    :param int srid:
+        SRID to put in the geopackage header. Defaults to the SRID of the
+        EWKB, if there is one. Any SRID is removed from the WKB header, as
+        geopackage geometries carry it in their own header instead.
+    :param bbox:
+        Optional envelope to put in the geopackage header, in the same form
+        as the 'bbox' key described in :func:`dumps`. The envelope of an
+        XYM geometry covers M values rather than Z values.
+
+    :return bytes:
+        bytestring representing the geometry in geopackage format.
+    """
+    data = _wkb._as_buffer(string)
+    info = _wkb._peek(data, 0)
+    if srid is None:
+        srid = info['srid'] or 0
+
+    header = _pack_header(
+        info['num_vertices'] == 0, bbox or [], srid, not info['big_endian'],
+        is_m=info['dims'] == 'M',
+    )
+    return header + _wkb._replace_srid(data, None)
+
+
+def envelope(string):
+    """
+    Read the envelope of a GeoPackage geometry blob, without decoding the
+    geometry.
+
+    The envelope is given in the order in which it is stored in the
+    geopackage header, which is also how :func:`loads` gives it as the
+    'bbox': ``(minx, maxx, miny, maxy)``, followed by ``(minz, maxz)`` and/or
+    ``(minm, maxm)``, if the envelope covers Z and/or M values. Envelopes
+    which cover M values but no Z values are given a Z range of ``(0.0,
+    0.0)``, to match the XYZM coordinates :func:`loads` gives XYM
+    geometries, so the fifth and sixth values are always the Z range.
+
+    If the blob has no envelope, one is computed by scanning the coordinate
+    values of the WKB geometry, run by run, without building any coordinate
+    lists. It covers all of the dimensions of the geometry.
+
+    >>> envelope(dumps({'type': 'LineString',
+    ...                 'coordinates': [[0.0, 5.0], [-1.0, 2.5]]}))
+    (-1.0, 0.0, 2.5, 5.0)
+
+    :param bytes string:
+        geopackage byte string.
+
+    :return tuple[float]:
+        Geometry envelope, or `None` if the geometry is empty and has no
+        envelope.
+    """
+    data = _wkb._as_buffer(string)
+    header = bytes(data[:_GeoPackage.HEADER_LEN])
+    _check_is_valid(header)
+
+    flags = header[3]
+    unpack = _envelope_unpackers.get(flags)
+    if unpack is not None:
+        return unpack(data, _GeoPackage.HEADER_LEN)
+
+    empty, _, _ = _parse_flags(flags)
+    if empty:
+        return None
+    values, is_m = _scan_envelope(data[_GeoPackage.HEADER_LEN:])
+    if is_m:
+        values = _insert_z_range(values)
+    return values
+
+
+def envelopes(blobs):
+    """
+    Read the envelope of each of the GeoPackage geometry ``blobs``, like
+    :func:`envelope`.
+
+    This is meant for filtering many rows by their envelopes before decoding
+    any of them. Blobs with an envelope in their header, which is normally
+    the case, take a fast path which unpacks it straight from the blob.
+
+    :param blobs:
+        Iterable of geopackage byte strings.
+
+    :return list:
+        The envelope of each blob (or `None`, for empty geometries without an
+        envelope), in the same order as ``blobs``.
+    """
+    unpackers = _envelope_unpackers
+    result = []
+    for blob in blobs:
+        unpack = unpackers.get(blob[3])
+        if unpack is not None and blob[:3] == _MAGIC_AND_VERSION:
+            result.append(unpack(blob, _GeoPackage.HEADER_LEN))
+        else:
+            result.append(envelope(blob))
+    return result
+
+
+def feature_tables(source):
+    """
+    List the feature tables of a GeoPackage file, as registered in its
+    ``gpkg_contents`` and ``gpkg_geometry_columns`` tables.
+
+    :param source:
+        Path of a GeoPackage file, or an open `sqlite3.Connection` to one.
+
+    :return list:
+        Names of the feature tables, sorted.
+    """
+    with _connect(source) as conn:
+        return sorted(_geometry_columns(conn))
+
+
+def iter_features(source, table=None, batch_size=1000, as_numpy=False):
+    """
+    Iterate over the rows of a GeoPackage feature table as GeoJSON-like
+    Features.
+
+    Rows are fetched from the database in batches of ``batch_size``, and
+    each Feature only decodes its geometry when its 'geometry' key is
+    accessed, so filtering rows on their properties, or on the envelope of
+    :attr:`Feature.blob` (see :func:`envelope`), does not pay for
+    decoding the geometries of the rows that are skipped.
+
+    :param source:
+        Path of a GeoPackage file, or an open `sqlite3.Connection` to one.
+        A path is opened read-only, and closed once the iteration ends.
+    :param str table:
+        Name of the feature table to read. May be omitted if the GeoPackage
+        has a single feature table.
+    :param int batch_size:
+        Number of rows to fetch from the database at a time.
+    :param bool as_numpy:
+        If True, decode coordinates into NumPy arrays. See :func:`loads`.
+
+    :return:
+        Generator of :class:`Feature` mappings, with the keys 'type', 'id',
+        'geometry' and 'properties'. The 'id' is the value of the primary
+        key of the table, and 'geometry' is `None` for rows without one.
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be positive, got %r' % batch_size)
+
+    with _connect(source) as conn:
+        table, geom_column = _feature_table(conn, table)
+        pk_column, columns = _feature_columns(conn, table, geom_column)
+        query = _select_features(table, pk_column, geom_column, columns)
+        yield from _fetch_features(conn, query, (), columns, batch_size,
+                                   as_numpy)
+
+
+def query_bbox(source, table, bbox, batch_size=1000, as_numpy=False):
+    """
+    Iterate over the rows of a GeoPackage feature table whose geometry
+    envelope intersects ``bbox``, like :func:`iter_features`.
+
+    Candidate rows are looked up in the ``rtree_<table>_<column>`` R-tree
+    index of the table (see :func:`write_features`), and checked against
+    the exact envelope in their geometry header; no geometry is decoded
+    until the 'geometry' of a Feature is accessed. Tables without an R-tree
+    index are scanned, checking the envelope of every geometry.
+
+    :param source:
+        Path of a GeoPackage file, or an open `sqlite3.Connection` to one.
+    :param str table:
+        Name of the feature table to query, or `None` if the GeoPackage
+        has a single feature table.
+    :param bbox:
+        Bounding box to query, in GeoJSON order, like
+        :func:`geomet.wkb.bounds`: ``(minx, miny, maxx, maxy)``. The
+        bounding box may also have 6 or 8 values, with the minimum and
+        maximum of further (Z or M) axes, which are ignored.
+    :param int batch_size:
+        Number of rows to fetch from the database at a time.
+    :param bool as_numpy:
+        If True, decode coordinates into NumPy arrays. See :func:`loads`.
+
+    :return:
+        Generator of :class:`Feature` mappings. Rows without a geometry,
+        or with an empty geometry, are never returned.
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be positive, got %r' % batch_size)
+    if len(bbox) not in (4, 6, 8):
+        raise ValueError('bbox must have 4, 6 or 8 values, got %r'
+                         % (bbox,))
+    num_dims = len(bbox) // 2
+    minx, miny = bbox[:2]
+    maxx, maxy = bbox[num_dims:num_dims + 2]
+
+    with _connect(source) as conn:
+        table, geom_column = _feature_table(conn, table)
+        pk_column, columns = _feature_columns(conn, table, geom_column)
+        query = _select_features(table, pk_column, geom_column, columns)
+        rtree = _rtree_name(table, geom_column)
+        if _table_exists(conn, rtree):
+            query += (
+                ' WHERE %s IN (SELECT id FROM %s WHERE minx <= ? AND '
+                'maxx >= ? AND miny <= ? AND maxy >= ?)'
+                % (_quote_identifier(pk_column), _quote_identifier(rtree))
+            )
+            params = (maxx, minx, maxy, miny)
+        else:
+            query += ' WHERE %s NOT NULL' % _quote_identifier(geom_column)
+            params = ()
+        yield from _fetch_features(conn, query, params, columns, batch_size,
+                                   as_numpy, (minx, maxx, miny, maxy))
+
+
+def write_features(dest, table, features, srid=None,
+                   geometry_type='GEOMETRY',
+                   geometry_column='geom', columns=None, batch_size=10000,
+                   spatial_index=True, big_endian=True):
+    """
+    Write GeoJSON-like Features into a feature table of a GeoPackage file.
+
+    The GeoPackage core tables are created if they do not exist yet, and so
+    is ``table``, with an integer primary key ``fid``, the geometry column
+    and the ``columns`` given; if ``table`` exists, the features are
+    appended to it.
+
+    Features are encoded with their envelope (see :func:`dumps`), and
+    inserted ``batch_size`` rows at a time, all in a single transaction
+    which is rolled back if anything fails. With ``spatial_index``, the
+    standard ``rtree_<table>_<geometry_column>`` R-tree index and its
+    triggers are created if needed, but the triggers are only put in place
+    after the new features have been added to the index, all at once,
+    rather than one row at a time.
+
+    The R-tree triggers call the ``ST_IsEmpty``, ``ST_MinX``, ``ST_MaxX``,
+    ``ST_MinY`` and ``ST_MaxY`` SQL functions, which SQLite does not
+    provide. They are only registered on the connection used here, so
+    any other `sqlite3.Connection` which inserts or updates rows of the
+    table fails with "no such function: ST_IsEmpty", unless it calls
+    :func:`register_sql_functions` first.
+
+    :param dest:
+        Path of a GeoPackage file, or an open `sqlite3.Connection` to one.
+    :param str table:
+        Name of the feature table.
+    :param features:
+        Iterable of GeoJSON-like Feature dicts. Features with an integer
+        'id' are inserted with it as their ``fid``, the others are
+        numbered after the largest ``fid`` so far. Features without a
+        'geometry' get a NULL geometry, and empty geometries are written
+        as 2D geometries with the "empty" flag set in their header, and
+        no envelope.
+    :param int srid:
+        SRS ID of the geometries, which is written into each geometry,
+        regardless of their 'meta' key. When appending, it defaults to the
+        SRS ID of the geometry column of ``table``, and must match it if
+        given. For a new table, it defaults to 0, and a placeholder
+        definition is added to the ``gpkg_spatial_ref_sys`` table for an
+        unknown SRS ID.
+    :param str geometry_type:
+        Geometry type name of the geometry column of a new table.
+    :param str geometry_column:
+        Name of the geometry column of a new table.
+    :param dict columns:
+        Mapping of property names to SQL column types, for a new table. If
+        not given, the columns are guessed from the 'properties' of the
+        first feature. Properties without a matching column are ignored.
+        A `ValueError` is raised if a column has the name of the primary
+        key ``fid`` or of the geometry column.
+    :param int batch_size:
+        Number of rows to insert at a time.
+    :param bool spatial_index:
+        If True, create and fill the R-tree index of the table.
+    :param bool big_endian:
+        specify endianess of the written geometries.
+
+    :return int:
+        The number of features written.
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be positive, got %r' % batch_size)
+
+    features = iter(features)
+    first = next(features, None)
+    if first is not None:
+        features = _itertools.chain([first], features)
+    if columns is None:
+        columns = _column_types((first or {}).get('properties') or {})
+
+    with _connect(dest, read_only=False) as conn:
+        register_sql_functions(conn)
+
+        conn.execute('SAVEPOINT geomet_write_features')
+        try:
+            count = _write_features(
+                conn, table, features, srid, geometry_type, geometry_column,
+                columns, batch_size, spatial_index, big_endian,
+            )
+        except BaseException:
+            conn.execute('ROLLBACK TO geomet_write_features')
+            conn.execute('RELEASE geomet_write_features')
+            raise
+        conn.execute('RELEASE geomet_write_features')
+    return count
+
+
+def register_sql_functions(conn):
+    """
+    Register the SQL functions used by the triggers of GeoPackage R-tree
+    spatial indexes on an `sqlite3.Connection`: ``ST_IsEmpty``,
+    ``ST_MinX``, ``ST_MaxX``, ``ST_MinY`` and ``ST_MaxY``, which read the
+    header of geometry blobs.
+
+    Call this before inserting or updating the rows of a feature table
+    with an R-tree index, such as those written by :func:`write_features`.
+
+    :param conn:
+        Open `sqlite3.Connection` to a GeoPackage.
+    """
+    for name, func in _sql_functions.items():
+        conn.create_function(name, 1, func)
+
+
+class Feature(_collections.Mapping):
+    """
+    A row of a GeoPackage feature table, as read by :func:`iter_features`.
+
+    It behaves as a read-only GeoJSON-like Feature `dict`, but its
+    geometry is only decoded the first time it is accessed.
+    """
+    __slots__ = ('_id', '_blob', '_properties', '_as_numpy', '_geometry')
+
+    _keys = ('type', 'id', 'geometry', 'properties')
+    _undecoded = object()
+
+    def __init__(self, id, blob, properties, as_numpy=False):
+        self._id = id
+        self._blob = blob
+        self._properties = properties
+        self._as_numpy = as_numpy
+        self._geometry = self._undecoded
+
+    @property
+    def blob(self):
+        """
+        The GeoPackage binary geometry of the row, as stored in the
+        database, or `None`.
+        """
+        return self._blob
+
+    def __getitem__(self, key):
+        if key == 'geometry':
+            if self._geometry is self._undecoded:
+                if self._blob is None:
+                    self._geometry = None
+                else:
+                    self._geometry = loads(self._blob, self._as_numpy)
+            return self._geometry
+        elif key == 'type':
+            return 'Feature'
+        elif key == 'id':
+            return self._id
+        elif key == 'properties':
+            return self._properties
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return 'Feature(id=%r, properties=%r)' % (self._id, self._properties)
+
+
+@_contextlib.contextmanager
+def _connect(source, read_only=True):
+    """
+    Yield an `sqlite3.Connection` to the GeoPackage ``source``: either
+    ``source`` itself, if it is a connection already, or a connection to the
+    file at path ``source``, which is closed on exit. Unless ``read_only``
+    is False, the file is opened read-only; otherwise, it is created if it
+    does not exist.
+    """
+    if isinstance(source, _sqlite3.Connection):
+        yield source
+        return
+
+    uri = _pathlib.Path(source).absolute().as_uri()
+    uri += '?mode=ro' if read_only else '?mode=rwc'
+    conn = _sqlite3.connect(uri, uri=True)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _write_features(conn, table, features, srid, geometry_type,
+                    geometry_column, columns, batch_size, spatial_index,
+                    big_endian):
+    """
+    Do the work of :func:`write_features`, in the current transaction.
+    """
+    _create_core_tables(conn)
+
+    geom_columns = _geometry_columns(conn)
+    if table in geom_columns:
+        geometry_column = geom_columns[table]
+        [table_srid] = conn.execute(
+            'SELECT srs_id FROM gpkg_geometry_columns WHERE table_name = ?',
+            (table,)
+        ).fetchone()
+        if srid is None:
+            srid = table_srid
+        elif srid != table_srid:
+            raise ValueError(
+                'Cannot write geometries with SRS ID %s into table %r, '
+                'whose geometry column has SRS ID %s'
+                % (srid, table, table_srid)
+            )
+        pk_column, columns = _feature_columns(conn, table, geometry_column)
+    else:
+        if srid is None:
+            srid = 0
+        conn.execute(
+            "INSERT OR IGNORE INTO gpkg_spatial_ref_sys VALUES "
+            "(?, ?, 'EPSG', ?, 'undefined', NULL)",
+            ('EPSG:%s' % srid, srid, srid),
+        )
+        _create_feature_table(conn, table, geometry_type, geometry_column,
+                              srid, columns)
+        pk_column, columns = 'fid', list(columns)
+
+    # The envelopes of the new geometries are staged in a temporary
+    # table, to update the R-tree index all at once at the end.
+    conn.execute('CREATE TEMP TABLE _geomet_envelopes '
+                 '(id INTEGER, minx, maxx, miny, maxy)')
+    if spatial_index:
+        _prepare_rtree(conn, table, geometry_column, pk_column)
+
+    qtable = _quote_identifier(table)
+    insert = 'INSERT INTO %s (%s) VALUES (%s)' % (
+        qtable,
+        ', '.join(map(_quote_identifier,
+                      [pk_column, geometry_column] + columns)),
+        ', '.join('?' * (len(columns) + 2)),
+    )
+    [next_fid] = conn.execute('SELECT coalesce(max(%s), 0) + 1 FROM %s' % (
+        _quote_identifier(pk_column), qtable)).fetchone()
+    is_little_endian = not big_endian
+
+    count = 0
+    for batch in _block_splitter(features, batch_size):
+        rows = []
+        entries = []
+        for feature in batch:
+            fid = feature.get('id')
+            if not isinstance(fid, int) or isinstance(fid, bool):
+                fid = next_fid
+            next_fid = max(next_fid, fid + 1)
+
+            geom = feature.get('geometry')
+            blob = None
+            if geom is not None and _is_empty(geom):
+                blob = _pack_header(True, [], srid, is_little_endian) + (
+                    _empty_wkb(geom['type'], big_endian)
+                )
+            elif geom is not None:
+                data = _wkb._dumps(geom, big_endian, include_meta=False)
+                envelope, is_m = _scan_envelope(memoryview(data))
+                blob = _pack_header(False, envelope, srid,
+                                    is_little_endian, is_m) + data
+                entries.append((fid,) + envelope[:4])
+
+            properties = feature.get('properties') or {}
+            row = [fid, blob]
+            row.extend(properties.get(name) for name in columns)
+            rows.append(row)
+
+        conn.executemany(insert, rows)
+        conn.executemany('INSERT INTO temp._geomet_envelopes '
+                         'VALUES (?, ?, ?, ?, ?)', entries)
+        count += len(rows)
+
+    if spatial_index:
+        conn.execute('INSERT INTO %s SELECT * FROM temp._geomet_envelopes'
+                     % _quote_identifier(_rtree_name(table, geometry_column)))
+        _create_rtree_triggers(conn, table, geometry_column, pk_column)
+
+    # Grow the extent of the table in gpkg_contents to cover the new
+    # geometries (and the existing ones, for a new R-tree index).
+    extent = conn.execute(
+        'SELECT min(minx), max(maxx), min(miny), max(maxy) '
+        'FROM temp._geomet_envelopes'
+    ).fetchone()
+    if extent[0] is not None:
+        conn.execute(
+            'UPDATE gpkg_contents SET '
+            'min_x = min(coalesce(min_x, ?1), ?1), '
+            'max_x = max(coalesce(max_x, ?2), ?2), '
+            'min_y = min(coalesce(min_y, ?3), ?3), '
+            'max_y = max(coalesce(max_y, ?4), ?4) '
+            'WHERE table_name = ?5',
+            extent + (table,),
+        )
+    conn.execute("UPDATE gpkg_contents SET last_change = "
+                 "strftime('%Y-%m-%dT%H:%M:%fZ', 'now') "
+                 "WHERE table_name = ?", (table,))
+    conn.execute('DROP TABLE temp._geomet_envelopes')
+    return count
+
+
+def _create_core_tables(conn):
+    """
+    Create the GeoPackage core tables, and the ``gpkg_extensions`` table,
+    if the GeoPackage does not have them yet.
+    """
+    exists = _table_exists(conn, 'gpkg_contents')
+    for statement in _CORE_TABLES_SQL:
+        conn.execute(statement)
+    if not exists:
+        conn.executemany(
+            'INSERT OR IGNORE INTO gpkg_spatial_ref_sys VALUES '
+            '(?, ?, ?, ?, ?, ?)',
+            _DEFAULT_SPATIAL_REF_SYS,
+        )
+        conn.execute('PRAGMA application_id = %d' % _APPLICATION_ID)
+        conn.execute('PRAGMA user_version = %d' % _USER_VERSION)
+
+
+def _create_feature_table(conn, table, geometry_type, geometry_column, srid,
+                          columns):
+    """
+    Create a feature table, and register it in ``gpkg_contents`` and
+    ``gpkg_geometry_columns``.
+    """
+    # SQLite column names are case insensitive.
+    reserved = {'fid': 'primary key', geometry_column.lower(): 'geometry'}
+    for name in columns:
+        if name.lower() in reserved:
+            raise ValueError(
+                'Cannot write property %r into table %r: it is the name of '
+                'its %s column' % (name, table, reserved[name.lower()])
+            )
+
+    column_defs = [
+        'fid INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL',
+        '%s %s' % (_quote_identifier(geometry_column), geometry_type),
+    ]
+    column_defs.extend('%s %s' % (_quote_identifier(name), column_type)
+                       for name, column_type in columns.items())
+    conn.execute('CREATE TABLE %s (%s)' % (
+        _quote_identifier(table), ', '.join(column_defs)))
+    conn.execute(
+        "INSERT INTO gpkg_contents (table_name, data_type, identifier, "
+        "srs_id) VALUES (?, 'features', ?, ?)",
+        (table, table, srid),
+    )
+    # z and m are "optional" (2): geometries may or may not have them.
+    conn.execute(
+        'INSERT INTO gpkg_geometry_columns VALUES (?, ?, ?, ?, 2, 2)',
+        (table, geometry_column, geometry_type.upper(), srid),
+    )
+
+
+def _column_types(properties):
+    """
+    Guess the SQL column types for the ``properties`` of a feature.
+    """
+    return {name: _sql_types.get(type(value), 'TEXT')
+            for name, value in properties.items()}
+
+
+def _rtree_name(table, geometry_column):
+    return 'rtree_%s_%s' % (table, geometry_column)
+
+
+def _prepare_rtree(conn, table, geometry_column, pk_column):
+    """
+    Create the R-tree index of a feature table, or drop its triggers if it
+    exists already, so that it can be updated from the staged envelopes.
+    If the index is new, the existing rows of the table are staged.
+    """
+    rtree = _rtree_name(table, geometry_column)
+    if _table_exists(conn, rtree):
+        for suffix in _RTREE_TRIGGERS_SQL:
+            conn.execute('DROP TRIGGER IF EXISTS %s'
+                         % _quote_identifier('%s_%s' % (rtree, suffix)))
+        return
+
+    conn.execute('CREATE VIRTUAL TABLE %s USING rtree(id, minx, maxx, '
+                 'miny, maxy)' % _quote_identifier(rtree))
+    conn.execute(
+        "INSERT OR IGNORE INTO gpkg_extensions VALUES (?, ?, "
+        "'gpkg_rtree_index', "
+        "'http://www.geopackage.org/spec120/#extension_rtree', "
+        "'write-only')",
+        (table, geometry_column),
+    )
+    qcolumn = _quote_identifier(geometry_column)
+    conn.execute(
+        'INSERT INTO temp._geomet_envelopes SELECT %s, ST_MinX(%s), '
+        'ST_MaxX(%s), ST_MinY(%s), ST_MaxY(%s) FROM %s '
+        'WHERE %s NOT NULL AND NOT ST_IsEmpty(%s)' % (
+            (_quote_identifier(pk_column),) + (qcolumn,) * 4
+            + (_quote_identifier(table),) + (qcolumn,) * 2
+        )
+    )
+
+
+def _create_rtree_triggers(conn, table, geometry_column, pk_column):
+    """
+    Create the triggers which keep the R-tree index of a feature table up to
+    date, as defined by the GeoPackage R-tree spatial index extension.
+    """
+    rtree = _rtree_name(table, geometry_column)
+    names = {
+        't': _quote_identifier(table),
+        'c': _quote_identifier(geometry_column),
+        'i': _quote_identifier(pk_column),
+        'rtree': _quote_identifier(rtree),
+    }
+    for suffix, body in _RTREE_TRIGGERS_SQL.items():
+        names['trigger'] = _quote_identifier('%s_%s' % (rtree, suffix))
+        conn.execute(body % names)
+
+
+def _sql_envelope_value(index):
+    """
+    Make an SQL function returning the value at ``index`` of the envelope of
+    a geometry blob.
+    """
+    def func(blob):
+        if blob is None:
+            return None
+        value = envelope(blob)
+        return None if value is None else value[index]
+    return func
+
+
+def _sql_is_empty(blob):
+    if blob is None:
+        return None
+    _check_is_valid(blob)
+    empty, _, _ = _parse_flags(blob[3])
+    return bool(empty)
+
+
+def _select_features(table, pk_column, geom_column, columns):
+    """
+    Make the ``SELECT`` statement for the rows of a feature table, with the
+    primary key, the geometry and the property ``columns``, in that order.
+    """
+    return 'SELECT %s FROM %s' % (
+        ', '.join(map(_quote_identifier,
+                      [pk_column, geom_column] + columns)),
+        _quote_identifier(table),
+    )
+
+
+def _fetch_features(conn, query, params, columns, batch_size, as_numpy,
+                    bbox=None):
+    """
+    Run a query made by :func:`_select_features`, and yield its rows as
+    :class:`Feature` mappings, fetching ``batch_size`` rows at a time.
+
+    If ``bbox`` is given, as ``(minx, maxx, miny, maxy)``, only the rows
+    with a geometry envelope which intersects it are yielded.
+    """
+    cursor = conn.execute(query, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            if bbox is not None:
+                minx, maxx, miny, maxy = bbox
+                blobs = [row[1] for row in rows]
+                rows = [
+                    row for row, env in zip(rows, envelopes(blobs))
+                    if env is not None and env[0] <= maxx
+                    and env[1] >= minx and env[2] <= maxy and env[3] >= miny
+                ]
+            for row in rows:
+                yield Feature(row[0], row[1],
+                              dict(zip(columns, row[2:])), as_numpy)
+    finally:
+        cursor.close()
+
+
+def _table_exists(conn, name):
+    [exists] = conn.execute(
+        'SELECT count(*) FROM sqlite_master WHERE name = ?', (name,)
+    ).fetchone()
+    return bool(exists)
+
+
+def _quote_identifier(name):
+    """
+    Quote a table or column name for use in an SQL statement.
+    """
+    return '"%s"' % name.replace('"', '""')
+
+
+def _geometry_columns(conn):
+    """
+    Map the name of each feature table of the GeoPackage to the name of its
+    geometry column.
+    """
+    rows = conn.execute(
+        "SELECT c.table_name, g.column_name FROM gpkg_contents AS c "
+        "JOIN gpkg_geometry_columns AS g ON g.table_name = c.table_name "
+        "WHERE c.data_type = 'features'"
+    )
+    return dict(rows)
+
+
+def _feature_table(conn, table):
+    """
+    Find the feature ``table`` of the GeoPackage, or its only feature table
+    if ``table`` is `None`.
+
+    :return tuple:
+        The table name and the name of its geometry column.
+    """
+    geom_columns = _geometry_columns(conn)
+    if table is None:
+        if len(geom_columns) != 1:
+            raise ValueError(
+                'GeoPackage has %s feature tables, a table name is required'
+                % len(geom_columns)
+            )
+        [table] = geom_columns
+    elif table not in geom_columns:
+        raise ValueError('GeoPackage has no feature table %r' % table)
+    return table, geom_columns[table]
+
+
+def _feature_columns(conn, table, geom_column):
+    """
+    Find the primary key column of a feature table, and its property
+    columns (all of the other columns, besides the geometry column).
+
+    :return tuple:
+        The name of the primary key column, which is ``rowid`` if the table
+        does not declare one, and the list of property column names.
+    """
+    pk_column = 'rowid'
+    columns = []
+    for _, name, _, _, _, pk in conn.execute(
+            'PRAGMA table_info(%s)' % _quote_identifier(table)):
+        if pk == 1:
+            pk_column = name
+        elif name != geom_column:
+            columns.append(name)
+    return pk_column, columns
+
+
+def _scan_envelope(data):
+    """
+    Compute the envelope of the WKB geometry in ``data`` from its coordinate
+    values, in geopackage envelope order.
+
+    :return tuple:
+        2-tuple of the geometry envelope, or `None` if the geometry has no
+        vertices, and `True` if the geometry is XYM, in which case the last
+        two values of the envelope are the M range rather than the Z range.
+    """
+    extent = None
+    is_m = False
+    for endian_token, num_dims, is_m, offset, num_verts in (
+            _wkb._iter_vertex_runs(data, 0)):
+        run_struct = _wkb._coord_struct(endian_token, num_dims, num_verts)
+        extent = _wkb._extend_extent(
+            extent, run_struct.unpack_from(data, offset), num_dims
+        )
+
+    if extent is None:
+        return None, is_m
+    return tuple(value for min_max in extent for value in min_max), is_m
+
+
+def _insert_z_range(values):
+    """
+    Give the XYM envelope ``values`` a Z range of ``(0.0, 0.0)``, like the
+    XYZM coordinates :func:`geomet.wkb.loads` gives XYM geometries.
+    """
+    return values[:4] + (0.0, 0.0) + values[4:]
+
+
+def _envelope_unpacker(flags):
+    """
+    Make a function unpacking the envelope from a geopackage binary with
+    the "flags" byte ``flags``, as :func:`envelope` gives it.
+    """
+    envelope_indicator = (flags & _GeoPackage.ENVELOPE_MASK) >> 1
+    unpack = _struct.Struct(
+        _endian_token(flags & _GeoPackage.ENDIANNESS_MASK) +
+        'd' * _indicator_to_dim[envelope_indicator]
+    ).unpack_from
+    if envelope_indicator != 3:
+        return unpack
+    return lambda data, offset: _insert_z_range(unpack(data, offset))
+
+
 class _GeoPackage:
     """
     Much more information on geopackage structure
@@ -170,7 +1042,8 @@ class _GeoPackage:
     MAGIC2 = 0x50
     VERSION1 = 0x00
     HEADER_LEN = 8
-    HEADER_PACK_FMT = "BBBBI"
+    # The srs_id is a signed int32: -1 is the undefined cartesian SRS.
+    HEADER_PACK_FMT = "BBBBi"
     ENVELOPE_2D_LEN = 32
     ENVELOPE_3D_LEN = 48
     ENVELOPE_4D_LEN = 64
@@ -191,10 +1064,24 @@ _indicator_to_dim = {
     4: 8,
 }
 
+# Functions to unpack the envelope from a geopackage binary,
+# keyed by the "flags" byte of the header, for all of the flags
+# which indicate that there is an envelope.
+_envelope_unpackers = {
+    flags: _envelope_unpacker(flags)
+    for flags in range(256)
+    if 1 <= (flags & _GeoPackage.ENVELOPE_MASK) >> 1 <= 4
+}
+
+# The "magic" and version bytes at the start of every geopackage binary.
+_MAGIC_AND_VERSION = bytes(
+    [_GeoPackage.MAGIC1, _GeoPackage.MAGIC2, _GeoPackage.VERSION1]
+)
+
 # Map the dimensionality of our envelope to the indicator
 # integer we will use in the geopackage binary header.
-# because we have no way to tell between Z and M values,
-# if the geometry has 3 dimensions we default to assume Z.
+# If the geometry has 3 dimensions, this assumes Z values:
+# the indicator of XYM envelopes is 3 (see `_pack_header`).
 _dim_to_indicator = {
     0: 0,
     4: 1,
@@ -203,6 +1090,121 @@ _dim_to_indicator = {
 }
 
 
+_NAN = float('nan')
+
+#: ``PRAGMA application_id`` of GeoPackage files ('GPKG').
+_APPLICATION_ID = 0x47504B47
+#: ``PRAGMA user_version`` of the GeoPackage files we write (1.3.0).
+_USER_VERSION = 10300
+
+_CORE_TABLES_SQL = (
+    "CREATE TABLE IF NOT EXISTS gpkg_spatial_ref_sys ("
+    "srs_name TEXT NOT NULL, srs_id INTEGER PRIMARY KEY, "
+    "organization TEXT NOT NULL, organization_coordsys_id INTEGER NOT NULL, "
+    "definition TEXT NOT NULL, description TEXT)",
+    "CREATE TABLE IF NOT EXISTS gpkg_contents ("
+    "table_name TEXT NOT NULL PRIMARY KEY, data_type TEXT NOT NULL, "
+    "identifier TEXT UNIQUE, description TEXT DEFAULT '', "
+    "last_change DATETIME NOT NULL "
+    "DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')), "
+    "min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, "
+    "srs_id INTEGER, CONSTRAINT fk_gc_r_srs_id FOREIGN KEY (srs_id) "
+    "REFERENCES gpkg_spatial_ref_sys(srs_id))",
+    "CREATE TABLE IF NOT EXISTS gpkg_geometry_columns ("
+    "table_name TEXT NOT NULL, column_name TEXT NOT NULL, "
+    "geometry_type_name TEXT NOT NULL, srs_id INTEGER NOT NULL, "
+    "z TINYINT NOT NULL, m TINYINT NOT NULL, "
+    "CONSTRAINT pk_geom_cols PRIMARY KEY (table_name, column_name), "
+    "CONSTRAINT uk_gc_table_name UNIQUE (table_name), "
+    "CONSTRAINT fk_gc_tn FOREIGN KEY (table_name) "
+    "REFERENCES gpkg_contents(table_name), "
+    "CONSTRAINT fk_gc_srs FOREIGN KEY (srs_id) "
+    "REFERENCES gpkg_spatial_ref_sys (srs_id))",
+    "CREATE TABLE IF NOT EXISTS gpkg_extensions ("
+    "table_name TEXT, column_name TEXT, extension_name TEXT NOT NULL, "
+    "definition TEXT NOT NULL, scope TEXT NOT NULL, "
+    "CONSTRAINT ge_tce UNIQUE (table_name, column_name, extension_name))",
+)
+
+#: The spatial reference systems every GeoPackage must define.
+_DEFAULT_SPATIAL_REF_SYS = (
+    ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined',
+     'undefined cartesian coordinate reference system'),
+    ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined',
+     'undefined geographic coordinate reference system'),
+    ('WGS 84 geodetic', 4326, 'EPSG', 4326,
+     'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,'
+     '298.257223563,AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],'
+     'PRIMEM["Greenwich",0,AUTHORITY["EPSG","8901"]],'
+     'UNIT["degree",0.0174532925199433,AUTHORITY["EPSG","9122"]],'
+     'AUTHORITY["EPSG","4326"]]',
+     'longitude/latitude coordinates in decimal degrees on the WGS 84 '
+     'spheroid'),
+)
+
+_sql_types = {
+    bool: 'BOOLEAN',
+    int: 'INTEGER',
+    float: 'DOUBLE',
+    str: 'TEXT',
+    bytes: 'BLOB',
+}
+
+#: SQL functions used by the R-tree index triggers.
+_sql_functions = {
+    'ST_IsEmpty': _sql_is_empty,
+    'ST_MinX': _sql_envelope_value(0),
+    'ST_MaxX': _sql_envelope_value(1),
+    'ST_MinY': _sql_envelope_value(2),
+    'ST_MaxY': _sql_envelope_value(3),
+}
+
+_RTREE_INSERT_SQL = (
+    'INSERT OR REPLACE INTO %(rtree)s VALUES (NEW.%(i)s, '
+    'ST_MinX(NEW.%(c)s), ST_MaxX(NEW.%(c)s), '
+    'ST_MinY(NEW.%(c)s), ST_MaxY(NEW.%(c)s));'
+)
+
+#: R-tree index triggers, by name suffix.
+_RTREE_TRIGGERS_SQL = {
+    'insert': (
+        'CREATE TRIGGER %(trigger)s AFTER INSERT ON %(t)s '
+        'WHEN (NEW.%(c)s NOT NULL AND NOT ST_IsEmpty(NEW.%(c)s)) '
+        'BEGIN ' + _RTREE_INSERT_SQL + ' END'
+    ),
+    'update1': (
+        'CREATE TRIGGER %(trigger)s AFTER UPDATE OF %(c)s ON %(t)s '
+        'WHEN OLD.%(i)s = NEW.%(i)s AND '
+        '(NEW.%(c)s NOTNULL AND NOT ST_IsEmpty(NEW.%(c)s)) '
+        'BEGIN ' + _RTREE_INSERT_SQL + ' END'
+    ),
+    'update2': (
+        'CREATE TRIGGER %(trigger)s AFTER UPDATE OF %(c)s ON %(t)s '
+        'WHEN OLD.%(i)s = NEW.%(i)s AND '
+        '(NEW.%(c)s ISNULL OR ST_IsEmpty(NEW.%(c)s)) '
+        'BEGIN DELETE FROM %(rtree)s WHERE id = OLD.%(i)s; END'
+    ),
+    'update3': (
+        'CREATE TRIGGER %(trigger)s AFTER UPDATE ON %(t)s '
+        'WHEN OLD.%(i)s != NEW.%(i)s AND '
+        '(NEW.%(c)s NOTNULL AND NOT ST_IsEmpty(NEW.%(c)s)) '
+        'BEGIN DELETE FROM %(rtree)s WHERE id = OLD.%(i)s; '
+        + _RTREE_INSERT_SQL + ' END'
+    ),
+    'update4': (
+        'CREATE TRIGGER %(trigger)s AFTER UPDATE ON %(t)s '
+        'WHEN OLD.%(i)s != NEW.%(i)s AND '
+        '(NEW.%(c)s ISNULL OR ST_IsEmpty(NEW.%(c)s)) '
+        'BEGIN DELETE FROM %(rtree)s WHERE id IN (OLD.%(i)s, NEW.%(i)s); END'
+    ),
+    'delete': (
+        'CREATE TRIGGER %(trigger)s AFTER DELETE ON %(t)s '
+        'WHEN OLD.%(c)s NOT NULL '
+        'BEGIN DELETE FROM %(rtree)s WHERE id = OLD.%(i)s; END'
+    ),
+}
+
+
 def is_valid(data):
     """
     Check if the data represents a valid geopackage
@@ -319,7 +1321,8 @@ def _build_flags(empty, envelope_indicator, is_little_endian=1):
     return (flags << 1) | is_little_endian
 
 
-def _build_geopackage_header(obj, is_little_endian):
+def _build_geopackage_header(obj, is_little_endian, envelope=None,
+                             is_m=False):
     """
     Create the geopackage header for the input object.
     Looks for a 'bbox' key on the geometry to use
@@ -331,20 +1334,77 @@ def _build_geopackage_header(obj, is_little_endian):
     :param bool is_little_endian:
         which endianness to use when
         encoding the data.
+    :param envelope:
+        envelope to use instead of the 'bbox'
+        of the geometry, if not None.
+    :param bool is_m:
+        whether ``envelope`` covers M values
+        rather than Z values.
 
     :return bytes: geopackage header.
     """
     # Collect geometry metadata.
-    empty = 1 if len(obj['coordinates']) == 0 else 0
-    envelope = obj.get('bbox', [])
+    empty = 1 if _is_empty(obj) else 0
+    if envelope is None:
+        envelope = obj.get('bbox', [])
     srid = obj.get('meta', {}).get('srid', 0)
 
+    return _pack_header(empty, envelope, srid, is_little_endian, is_m)
+
+
+def _is_empty(obj):
+    """
+    Check whether the geojson geometry ``obj`` has no coordinates: either
+    its coordinates are empty, or it is a GeometryCollection of such
+    geometries.
+    """
+    if obj['type'] == 'GeometryCollection':
+        return all(_is_empty(geom) for geom in obj['geometries'])
+    return _is_empty_coords(obj['coordinates'])
+
+
+def _empty_wkb(geom_type, big_endian):
+    """
+    Make the WKB of an empty 2D geometry of type ``geom_type``, to go with
+    a geopackage header with the "empty" flag set. As the GeoPackage
+    specification recommends, empty Points have NaN coordinates; other
+    geometries have no vertices, rings or parts.
+    """
+    header, _, byte_order = _wkb._header_bytefmt_byteorder(
+        geom_type, 2, big_endian, {}
+    )
+    if geom_type == 'Point':
+        return header + _struct.pack(byte_order + 'dd', _NAN, _NAN)
+    return header + _struct.pack(byte_order + 'l', 0)
+
+
+def _pack_header(empty, envelope, srid, is_little_endian, is_m=False):
+    """
+    Pack the geopackage header, including the envelope.
+
+    :param bool empty:
+        whether the geometry is empty.
+    :param envelope:
+        sequence of envelope values, which may be empty.
+    :param int srid:
+        SRID of the geometry, or 0.
+    :param bool is_little_endian:
+        which endianness to use when
+        encoding the data.
+    :param bool is_m:
+        whether a 6 value ``envelope`` covers
+        M values rather than Z values.
+
+    :return bytes: geopackage header.
+    """
     try:
         envelope_indicator = _dim_to_indicator[len(envelope)]
     except KeyError:
         raise ValueError("Bounding box must be of length 2*n where "
                          "n is the number of dimensions represented "
                          "in the contained geometries.")
+    if is_m and envelope_indicator == 2:
+        envelope_indicator = 3
 
     pack_args = [
         _GeoPackage.MAGIC1,
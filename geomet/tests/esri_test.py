@@ -128,11 +128,7 @@ class TestIOReaderWriter(unittest.TestCase):
             with open(fp, 'r') as r:
                 self.assertEqual(
                     esri.load(r),
-                    {
-                        'spatialReference': {'wkid': 4326},
-                        'x': 25282,
-                        'y': 43770,
-                    }
+                    {'type': 'Point', 'coordinates': (25282, 43770)}
                 )
 
 
@@ -159,6 +155,18 @@ class TestEsriJSONtoGeoJSON(unittest.TestCase):
         self.assertEqual(esri.loads(json.dumps(esri_json_pt)),
                          {'type': 'Point', 'coordinates': (25282, 43770)})
 
+    def test_loads_dict(self):
+        """Tests Loading already parsed Esri JSON geometries"""
+        for esri_json in (esri_json_pt, esri_json_mpt, esri_json_polylines,
+                          esri_json_polygon):
+            self.assertEqual(esri.loads(json.dumps(esri_json)),
+                             esri.loads(esri_json))
+
+    def test_loads_dict_unsupported_geom_type(self):
+        """Tests loading an invalid, already parsed geometry"""
+        with self.assertRaises(InvalidGeoJSONException):
+            esri.loads({'spatialReference': {'wkid': 4326}})
+
     def test_loads_to_geojson_multipoint(self):
         """Tests Loading Esri MultiPoint Geometry to MultiPoint GeoJSON"""
         self.assertEqual(
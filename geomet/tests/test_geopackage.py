@@ -11,12 +11,21 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import os
+import sqlite3
 import struct
+import tempfile
 import unittest
 
 from io import BytesIO
 
 from geomet import geopackage
+from geomet import wkb
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 def build_header(
@@ -28,6 +37,30 @@ def build_header(
     return struct.pack("<BBBBI", magic1, magic2, version, flags, srid)
 
 
+def build_gpkg(conn, tables):
+    """
+    Create the GeoPackage tables needed to read features, and a feature
+    table with an integer primary key 'fid', a geometry column 'geom' and a
+    'name' column for each item of ``tables``, which maps table names to
+    lists of (name, blob) rows.
+    """
+    conn.execute('CREATE TABLE gpkg_contents '
+                 '(table_name TEXT PRIMARY KEY, data_type TEXT NOT NULL)')
+    conn.execute('CREATE TABLE gpkg_geometry_columns '
+                 '(table_name TEXT, column_name TEXT)')
+    conn.execute("INSERT INTO gpkg_contents VALUES ('attrs', 'attributes')")
+    for table, rows in tables.items():
+        conn.execute('CREATE TABLE "%s" (fid INTEGER PRIMARY KEY, '
+                     'geom BLOB, name TEXT)' % table)
+        conn.execute('INSERT INTO gpkg_contents VALUES (?, ?)',
+                     (table, 'features'))
+        conn.execute('INSERT INTO gpkg_geometry_columns VALUES (?, ?)',
+                     (table, 'geom'))
+        conn.executemany('INSERT INTO "%s" (name, geom) VALUES (?, ?)'
+                         % table, rows)
+    conn.commit()
+
+
 class TestGeoPackageLoads(unittest.TestCase):
     def test_loads_noenvelope_with_srid(self):
         gpkg = (
@@ -134,6 +167,19 @@ class TestGeoPackageLoads(unittest.TestCase):
         }
         self.assertEqual(expected, geopackage.loads(gpkg))
 
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_loads_as_numpy(self):
+        gpkg = geopackage.dumps({
+            'type': 'LineString',
+            'coordinates': [[1.0, 2.0], [3.0, 4.0]],
+            'bbox': [1.0, 3.0, 2.0, 4.0],
+        })
+        result = geopackage.loads(gpkg, as_numpy=True)
+        self.assertIsInstance(result['coordinates'], numpy.ndarray)
+        self.assertEqual([[1.0, 2.0], [3.0, 4.0]],
+                         result['coordinates'].tolist())
+        self.assertEqual((1.0, 3.0, 2.0, 4.0), result['bbox'])
+
 
 class TestRoundTrip(unittest.TestCase):
     def test_without_envelope_with_srid_little_endian(self):
@@ -238,6 +284,661 @@ class TestRoundTrip(unittest.TestCase):
         self.assertEqual(expected_dumps, dumps_result)
 
 
+class TestWKBConversion(unittest.TestCase):
+    def setUp(self):
+        self.polygon = {
+            'type': 'Polygon',
+            'coordinates': [[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]],
+            'bbox': [0.0, 1.0, 0.0, 1.0],
+        }
+        self.polygon_srid = dict(self.polygon, meta={'srid': 4326})
+
+    def test_to_wkb(self):
+        for big_endian in (True, False):
+            gpkg = geopackage.dumps(self.polygon, big_endian=big_endian)
+            self.assertEqual(wkb.dumps(self.polygon, big_endian=big_endian),
+                             geopackage.to_wkb(gpkg))
+
+    def test_to_wkb_with_srid(self):
+        for big_endian in (True, False):
+            gpkg = geopackage.dumps(self.polygon_srid, big_endian=big_endian)
+            self.assertEqual(
+                wkb.dumps(self.polygon_srid, big_endian=big_endian),
+                geopackage.to_wkb(gpkg),
+            )
+
+    def test_to_wkb_keeps_ewkb_srid(self):
+        # A geopackage header srs_id of 0 does not override the SRID of
+        # the EWKB payload, in `loads` and `to_wkb` alike.
+        for big_endian in (True, False):
+            ewkb = wkb.dumps(self.polygon_srid, big_endian=big_endian)
+            header = geopackage._pack_header(False, [], 0, not big_endian)
+            gpkg = header + ewkb
+            self.assertEqual(ewkb, geopackage.to_wkb(gpkg))
+            self.assertEqual({'srid': 4326}, geopackage.loads(gpkg)['meta'])
+            self.assertEqual(geopackage.loads(gpkg),
+                             wkb.loads(geopackage.to_wkb(gpkg)))
+
+    def test_from_wkb(self):
+        for big_endian in (True, False):
+            wkb_str = wkb.dumps(self.polygon, big_endian=big_endian)
+            self.assertEqual(
+                geopackage.dumps(self.polygon, big_endian=big_endian),
+                geopackage.from_wkb(wkb_str, bbox=self.polygon['bbox']),
+            )
+
+    def test_from_ewkb(self):
+        for big_endian in (True, False):
+            ewkb = wkb.dumps(self.polygon_srid, big_endian=big_endian)
+            self.assertEqual(
+                geopackage.dumps(self.polygon_srid, big_endian=big_endian),
+                geopackage.from_wkb(ewkb, bbox=self.polygon['bbox']),
+            )
+
+    def test_from_wkb_m(self):
+        # LINESTRING M (1 2 3, 4 5 6): the envelope indicator is 3 (XYM).
+        wkb_str = bytes.fromhex(
+            '00000007d200000002'
+            '3ff0000000000000' '4000000000000000' '4008000000000000'
+            '4010000000000000' '4014000000000000' '4018000000000000'
+        )
+        gpkg = geopackage.from_wkb(wkb_str,
+                                   bbox=[1.0, 4.0, 2.0, 5.0, 3.0, 6.0])
+        self.assertEqual(0b00000110, gpkg[3])
+        self.assertEqual((1.0, 4.0, 2.0, 5.0, 0.0, 0.0, 3.0, 6.0),
+                         geopackage.envelope(gpkg))
+
+    def test_from_wkb_srid(self):
+        wkb_str = wkb.dumps(self.polygon)
+        result = geopackage.loads(geopackage.from_wkb(wkb_str, srid=3857))
+        self.assertEqual({'srid': 3857}, result['meta'])
+        self.assertNotIn('bbox', result)
+
+    def test_negative_srid(self):
+        # -1 is the SRS ID of undefined cartesian coordinates.
+        for big_endian in (True, False):
+            wkb_str = wkb.dumps(self.polygon, big_endian=big_endian)
+            gpkg = geopackage.from_wkb(wkb_str, srid=-1)
+            self.assertEqual({'srid': -1}, geopackage.loads(gpkg)['meta'])
+            self.assertEqual(
+                gpkg, geopackage.dumps(dict(self.polygon, bbox=[],
+                                            meta={'srid': -1}),
+                                       big_endian=big_endian)
+            )
+
+    def test_loads_buffer(self):
+        gpkg = geopackage.dumps(self.polygon_srid)
+        expected = geopackage.loads(gpkg)
+        self.assertEqual(expected, geopackage.loads(bytearray(gpkg)))
+        self.assertEqual(expected, geopackage.loads(memoryview(gpkg)))
+
+
+class TestEnvelope(unittest.TestCase):
+    def test_stored_envelope(self):
+        for big_endian in (True, False):
+            gpkg = geopackage.dumps({
+                'type': 'Point',
+                'coordinates': [1.0, 2.0, 3.0],
+                'bbox': [1.0, 1.0, 2.0, 2.0, 3.0, 3.0],
+            }, big_endian=big_endian)
+            self.assertEqual((1.0, 1.0, 2.0, 2.0, 3.0, 3.0),
+                             geopackage.envelope(gpkg))
+
+    def test_computed_envelope(self):
+        gpkg = geopackage.dumps({
+            'type': 'MultiLineString',
+            'coordinates': [[[0.0, 5.0, 1.0], [-1.0, 2.5, 2.0]],
+                            [[3.0, 4.0, 0.0], [1.0, 1.0, 1.0]]],
+        })
+        self.assertEqual((-1.0, 3.0, 1.0, 5.0, 0.0, 2.0),
+                         geopackage.envelope(gpkg))
+
+    def test_computed_envelope_m(self):
+        # LINESTRING M (1 2 3, 4 5 6)
+        gpkg = geopackage.from_wkb(
+            b'\x00\x00\x00\x07\xd2\x00\x00\x00\x02'
+            b'?\xf0\x00\x00\x00\x00\x00\x00@\x00\x00\x00\x00\x00\x00\x00'
+            b'@\x08\x00\x00\x00\x00\x00\x00@\x10\x00\x00\x00\x00\x00\x00'
+            b'@\x14\x00\x00\x00\x00\x00\x00@\x18\x00\x00\x00\x00\x00\x00'
+        )
+        # The M range follows a Z range of 0.0, like the coordinates of
+        # `loads`.
+        self.assertEqual((1.0, 4.0, 2.0, 5.0, 0.0, 0.0, 3.0, 6.0),
+                         geopackage.envelope(gpkg))
+
+    def test_stored_envelope_m(self):
+        # XYM envelope (indicator 3) of POINT M (1 2 3)
+        gpkg = build_header(flags=0b00000111, srid=0) + struct.pack(
+            '<6d', 1.0, 1.0, 2.0, 2.0, 3.0, 3.0
+        ) + bytes.fromhex('01d1070000000000000000f03f'
+                          '00000000000000400000000000000840')
+        self.assertEqual((1.0, 1.0, 2.0, 2.0, 0.0, 0.0, 3.0, 3.0),
+                         geopackage.envelope(gpkg))
+        self.assertEqual([(1.0, 1.0, 2.0, 2.0, 0.0, 0.0, 3.0, 3.0)],
+                         geopackage.envelopes([gpkg]))
+
+    def test_empty(self):
+        gpkg = build_header(flags=0b00010001, srid=0) + (
+            b'\x01\x02\x00\x00\x00\x00\x00\x00\x00'
+        )
+        self.assertIsNone(geopackage.envelope(gpkg))
+
+    def test_sql_is_empty(self):
+        # ST_IsEmpty reads the "empty" flag of the header, even if there is
+        # an envelope.
+        empty = build_header(flags=0b00010011, srid=0) + struct.pack(
+            '<4d', *[float('nan')] * 4
+        ) + b'\x01\x04\x00\x00\x00\x00\x00\x00\x00'
+        self.assertTrue(geopackage._sql_is_empty(empty))
+        point = geopackage.dumps({'type': 'Point',
+                                  'coordinates': [1.0, 2.0]})
+        self.assertFalse(geopackage._sql_is_empty(point))
+        self.assertIsNone(geopackage._sql_is_empty(None))
+
+    def test_envelopes(self):
+        geoms = [
+            {'type': 'Point', 'coordinates': [1.0, 2.0],
+             'bbox': [1.0, 1.0, 2.0, 2.0]},
+            {'type': 'LineString', 'coordinates': [[0.0, 1.0], [2.0, 3.0]]},
+        ]
+        blobs = [geopackage.dumps(geom, big_endian=big_endian)
+                 for geom in geoms for big_endian in (True, False)]
+        self.assertEqual(
+            [(1.0, 1.0, 2.0, 2.0)] * 2 + [(0.0, 2.0, 1.0, 3.0)] * 2,
+            geopackage.envelopes(blobs),
+        )
+
+    def test_envelopes_invalid(self):
+        gpkg = build_header(magic1=0x50, flags=0b00000011) + bytes(32)
+        with self.assertRaises(ValueError):
+            geopackage.envelopes([gpkg])
+
+
+class TestComputeEnvelope(unittest.TestCase):
+    def _check(self, geom, expected_bbox, expected_flags):
+        for big_endian in (True, False):
+            gpkg = geopackage.dumps(geom, big_endian=big_endian,
+                                    compute_envelope=True)
+            flags = expected_flags | (0 if big_endian else 1)
+            self.assertEqual(flags, gpkg[3])
+            result = geopackage.loads(gpkg)
+            self.assertEqual(expected_bbox, result['bbox'])
+            self.assertEqual(geom['coordinates'], result['coordinates'])
+
+    def test_2d(self):
+        geom = {'type': 'LineString',
+                'coordinates': [[3.0, -1.0], [1.0, 4.0], [2.0, 2.0]]}
+        self._check(geom, (1.0, 3.0, -1.0, 4.0), 0b00000010)
+
+    def test_3d(self):
+        geom = {'type': 'MultiPoint',
+                'coordinates': [[0.0, 5.0, 1.0], [-1.0, 2.5, 2.0]]}
+        self._check(geom, (-1.0, 0.0, 2.5, 5.0, 1.0, 2.0), 0b00000100)
+
+    def test_4d(self):
+        geom = {'type': 'Point', 'coordinates': [1.0, 2.0, 3.0, 4.0]}
+        self._check(geom, (1.0, 1.0, 2.0, 2.0, 3.0, 3.0, 4.0, 4.0),
+                    0b00001000)
+
+    def test_geometrycollection(self):
+        geom = {'type': 'GeometryCollection', 'geometries': [
+            {'type': 'Point', 'coordinates': [1.0, 2.0]},
+            {'type': 'LineString', 'coordinates': [[0.0, 0.0], [3.0, 4.0]]},
+        ]}
+        for big_endian in (True, False):
+            gpkg = geopackage.dumps(geom, big_endian=big_endian,
+                                    compute_envelope=True)
+            self.assertEqual(0b00000010 | (0 if big_endian else 1), gpkg[3])
+            result = geopackage.loads(gpkg)
+            self.assertEqual((0.0, 3.0, 0.0, 4.0), result['bbox'])
+            self.assertEqual(geom['geometries'], result['geometries'])
+
+    def test_ignores_bbox(self):
+        geom = {'type': 'Point', 'coordinates': [1.0, 2.0],
+                'bbox': [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]}
+        gpkg = geopackage.dumps(geom, compute_envelope=True)
+        self.assertEqual((1.0, 1.0, 2.0, 2.0), geopackage.envelope(gpkg))
+
+    def test_default_no_envelope(self):
+        geom = {'type': 'Point', 'coordinates': [1.0, 2.0]}
+        self.assertIsNone(geopackage.loads(geopackage.dumps(geom)).get('bbox'))
+
+    def test_dump(self):
+        geom = {'type': 'Point', 'coordinates': [1.0, 2.0],
+                'meta': {'srid': 4326}}
+        buf = BytesIO()
+        geopackage.dump(geom, buf, compute_envelope=True)
+        self.assertEqual(
+            geopackage.dumps(geom, compute_envelope=True), buf.getvalue()
+        )
+
+
+class TestIterFeatures(unittest.TestCase):
+    def setUp(self):
+        self.points = [
+            {'type': 'Point', 'coordinates': [float(i), 2.0 * i],
+             'meta': {'srid': 4326}}
+            for i in range(5)
+        ]
+        self.rows = [('point %s' % i, geopackage.dumps(point))
+                     for i, point in enumerate(self.points)]
+        self.geoms = [geopackage.loads(blob) for _, blob in self.rows]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, 'test.gpkg')
+        conn = sqlite3.connect(self.path)
+        build_gpkg(conn, {'points': self.rows, 'other': []})
+        conn.close()
+
+    def test_feature_tables(self):
+        self.assertEqual(['other', 'points'],
+                         geopackage.feature_tables(self.path))
+
+    def test_iter_features(self):
+        features = list(geopackage.iter_features(self.path, 'points'))
+        self.assertEqual(len(self.points), len(features))
+        for i, feature in enumerate(features, 1):
+            self.assertEqual({
+                'type': 'Feature',
+                'id': i,
+                'geometry': self.geoms[i - 1],
+                'properties': {'name': 'point %s' % (i - 1)},
+            }, dict(feature))
+            self.assertEqual(self.rows[i - 1][1], feature.blob)
+
+    def test_batch_size(self):
+        for batch_size in (1, 2, 5, 100):
+            features = geopackage.iter_features(self.path, 'points',
+                                                batch_size=batch_size)
+            self.assertEqual(self.geoms,
+                             [feature['geometry'] for feature in features])
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            list(geopackage.iter_features(self.path, 'points', batch_size=0))
+
+    def test_lazy_geometry(self):
+        conn = sqlite3.connect(':memory:')
+        self.addCleanup(conn.close)
+        build_gpkg(conn, {'bad': [('invalid', b'not a geometry'),
+                                  ('null', None)]})
+        invalid, null = geopackage.iter_features(conn)
+        self.assertEqual({'name': 'invalid'}, invalid['properties'])
+        with self.assertRaises(ValueError):
+            invalid['geometry']
+        self.assertIsNone(null['geometry'])
+
+    def test_table_required(self):
+        with self.assertRaises(ValueError):
+            list(geopackage.iter_features(self.path))
+
+    def test_unknown_table(self):
+        for table in ('missing', 'attrs'):
+            with self.assertRaises(ValueError):
+                list(geopackage.iter_features(self.path, table))
+
+    def test_connection_left_open(self):
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        self.assertEqual(5, len(list(geopackage.iter_features(conn,
+                                                              'points'))))
+        self.assertEqual([(0,)], conn.execute(
+            'SELECT count(*) FROM other').fetchall())
+
+    def test_read_only(self):
+        features = geopackage.iter_features(os.path.join(self.tmpdir.name,
+                                                         'missing.gpkg'))
+        with self.assertRaises(sqlite3.OperationalError):
+            next(features)
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name,
+                                                     'missing.gpkg')))
+
+    def test_rowid(self):
+        conn = sqlite3.connect(':memory:')
+        self.addCleanup(conn.close)
+        build_gpkg(conn, {})
+        conn.execute('CREATE TABLE t (geom BLOB, name TEXT)')
+        conn.execute("INSERT INTO gpkg_contents VALUES ('t', 'features')")
+        conn.execute("INSERT INTO gpkg_geometry_columns VALUES ('t', 'geom')")
+        conn.executemany('INSERT INTO t VALUES (?, ?)',
+                         [(blob, name) for name, blob in self.rows[:2]])
+        features = list(geopackage.iter_features(conn))
+        self.assertEqual([1, 2], [feature['id'] for feature in features])
+        self.assertEqual(self.geoms[:2],
+                         [feature['geometry'] for feature in features])
+
+
+class TestWriteFeatures(unittest.TestCase):
+    def setUp(self):
+        self.features = [
+            {'type': 'Feature',
+             'geometry': {'type': 'LineString',
+                          'coordinates': [[float(i), 0.0], [i + 1.0, -i]]},
+             'properties': {'name': 'line %s' % i, 'length': i + 1.0}}
+            for i in range(7)
+        ]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, 'test.gpkg')
+
+    def connect(self):
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        return conn
+
+    def test_write_features(self):
+        count = geopackage.write_features(self.path, 'lines', self.features,
+                                          srid=4326, batch_size=3)
+        self.assertEqual(7, count)
+        self.assertEqual(['lines'], geopackage.feature_tables(self.path))
+        features = list(geopackage.iter_features(self.path))
+        self.assertEqual(list(range(1, 8)), [f['id'] for f in features])
+        for expected, feature in zip(self.features, features):
+            self.assertEqual(expected['properties'], feature['properties'])
+            geom = feature['geometry']
+            self.assertEqual(expected['geometry']['coordinates'],
+                             geom['coordinates'])
+            self.assertEqual({'srid': 4326}, geom['meta'])
+            self.assertEqual(geopackage.envelope(feature.blob), geom['bbox'])
+
+        conn = self.connect()
+        self.assertEqual(
+            [(1196444487, 10300)],
+            [conn.execute('PRAGMA application_id').fetchone()
+             + conn.execute('PRAGMA user_version').fetchone()],
+        )
+        self.assertEqual(
+            [(-1,), (0,), (4326,)],
+            conn.execute('SELECT srs_id FROM gpkg_spatial_ref_sys').fetchall()
+        )
+        self.assertEqual(
+            [('lines', 'features', 4326, 0.0, -6.0, 7.0, 0.0)],
+            conn.execute('SELECT table_name, data_type, srs_id, min_x, '
+                         'min_y, max_x, max_y FROM gpkg_contents').fetchall()
+        )
+        self.assertEqual(
+            [('lines', 'geom', 'GEOMETRY', 4326, 2, 2)],
+            conn.execute('SELECT * FROM gpkg_geometry_columns').fetchall()
+        )
+        self.assertEqual(
+            [('lines', 'geom', 'gpkg_rtree_index')],
+            conn.execute('SELECT table_name, column_name, extension_name '
+                         'FROM gpkg_extensions').fetchall()
+        )
+        self.assertEqual(
+            [(i + 1, float(i), i + 1.0, -float(i), 0.0) for i in range(7)],
+            conn.execute('SELECT * FROM rtree_lines_geom').fetchall()
+        )
+
+    def test_rtree_triggers(self):
+        conn = self.connect()
+        geopackage.write_features(conn, 'lines', self.features[:2])
+        conn.execute('DELETE FROM lines WHERE fid = 1')
+        conn.execute('UPDATE lines SET fid = 5 WHERE fid = 2')
+        conn.execute('INSERT INTO lines (geom) VALUES (?)', (
+            geopackage.dumps({'type': 'Point', 'coordinates': [9.0, 8.0]}),
+        ))
+        conn.execute('INSERT INTO lines (geom) VALUES (NULL)')
+        self.assertEqual(
+            [(5, 1.0, 2.0, -1.0, 0.0), (6, 9.0, 9.0, 8.0, 8.0)],
+            conn.execute('SELECT * FROM rtree_lines_geom').fetchall()
+        )
+
+    def test_register_sql_functions(self):
+        geopackage.write_features(self.path, 'lines', self.features[:2])
+        conn = self.connect()
+        blob = geopackage.dumps({'type': 'Point', 'coordinates': [9.0, 8.0]})
+        with self.assertRaises(sqlite3.OperationalError) as ar:
+            conn.execute('INSERT INTO lines (geom) VALUES (?)', (blob,))
+        self.assertEqual('no such function: ST_IsEmpty', str(ar.exception))
+        conn.rollback()
+
+        geopackage.register_sql_functions(conn)
+        conn.execute('INSERT INTO lines (geom) VALUES (?)', (blob,))
+        conn.execute('UPDATE lines SET geom = NULL WHERE fid = 1')
+        conn.commit()
+        self.assertEqual(
+            [(2, 1.0, 2.0, -1.0, 0.0), (3, 9.0, 9.0, 8.0, 8.0)],
+            conn.execute('SELECT * FROM rtree_lines_geom').fetchall()
+        )
+
+    def test_append(self):
+        geopackage.write_features(self.path, 'lines', self.features[:4],
+                                  srid=4326)
+        self.features[4]['id'] = 10
+        geopackage.write_features(self.path, 'lines', self.features[4:])
+        features = list(geopackage.iter_features(self.path))
+        self.assertEqual([1, 2, 3, 4, 10, 11, 12],
+                         [f['id'] for f in features])
+        self.assertEqual([4326] * 7,
+                         [f['geometry']['meta']['srid'] for f in features])
+        conn = self.connect()
+        self.assertEqual(
+            [(-1,), (0,), (4326,)],
+            conn.execute('SELECT srs_id FROM gpkg_spatial_ref_sys').fetchall()
+        )
+        self.assertEqual(
+            [1, 2, 3, 4, 10, 11, 12],
+            [i for i, in conn.execute('SELECT id FROM rtree_lines_geom')]
+        )
+        self.assertEqual([(0.0, -6.0, 7.0, 0.0)], conn.execute(
+            'SELECT min_x, min_y, max_x, max_y FROM gpkg_contents'
+        ).fetchall())
+
+    def test_append_conflicting_srid(self):
+        geopackage.write_features(self.path, 'lines', self.features[:4],
+                                  srid=4326)
+        with self.assertRaises(ValueError) as ar:
+            geopackage.write_features(self.path, 'lines', self.features[4:],
+                                      srid=3857)
+        self.assertEqual(
+            "Cannot write geometries with SRS ID 3857 into table 'lines', "
+            "whose geometry column has SRS ID 4326", str(ar.exception)
+        )
+        self.assertEqual(
+            4, len(list(geopackage.iter_features(self.path)))
+        )
+        geopackage.write_features(self.path, 'lines', self.features[4:],
+                                  srid=4326)
+        self.assertEqual(
+            7, len(list(geopackage.iter_features(self.path)))
+        )
+
+    def test_spatial_index_added_later(self):
+        geopackage.write_features(self.path, 'lines', self.features[:4],
+                                  spatial_index=False)
+        conn = self.connect()
+        self.assertEqual([], conn.execute(
+            "SELECT * FROM sqlite_master WHERE name LIKE 'rtree%'"
+        ).fetchall())
+        geopackage.write_features(conn, 'lines', self.features[4:])
+        self.assertEqual(
+            list(range(1, 8)),
+            [i for i, in conn.execute('SELECT id FROM rtree_lines_geom')]
+        )
+
+    def test_columns(self):
+        features = [
+            {'geometry': None, 'properties': {'a': 1, 'b': 'x'}},
+            {'geometry': None, 'properties': {'b': 'y', 'c': 2}},
+        ]
+        geopackage.write_features(self.path, 'points', features,
+                                  geometry_type='POINT',
+                                  columns={'a': 'INTEGER', 'b': 'TEXT'})
+        self.assertEqual(
+            [{'a': 1, 'b': 'x'}, {'a': None, 'b': 'y'}],
+            [f['properties'] for f in geopackage.iter_features(self.path)]
+        )
+        conn = self.connect()
+        self.assertEqual(
+            [('fid', 'INTEGER'), ('geom', 'POINT'), ('a', 'INTEGER'),
+             ('b', 'TEXT')],
+            [row[1:3] for row in conn.execute('PRAGMA table_info(points)')]
+        )
+        self.assertEqual([], conn.execute(
+            'SELECT * FROM rtree_points_geom').fetchall())
+
+    def test_guessed_columns(self):
+        features = [{'geometry': None, 'properties': {
+            'i': 1, 'f': 1.5, 's': 's', 'b': True, 'n': None}}]
+        geopackage.write_features(self.path, 't', features)
+        conn = self.connect()
+        self.assertEqual(
+            [('i', 'INTEGER'), ('f', 'DOUBLE'), ('s', 'TEXT'),
+             ('b', 'BOOLEAN'), ('n', 'TEXT')],
+            [row[1:3] for row in conn.execute('PRAGMA table_info(t)')][2:]
+        )
+
+    def test_rollback(self):
+        geopackage.write_features(self.path, 'lines', self.features[:2])
+        features = self.features[2:] + [
+            {'geometry': {'type': 'Curve', 'coordinates': [[0.0, 1.0]]}},
+        ]
+        with self.assertRaises(ValueError):
+            geopackage.write_features(self.path, 'lines', features,
+                                      batch_size=2)
+        with self.assertRaises(ValueError):
+            geopackage.write_features(self.path, 'other', features)
+        self.assertEqual(['lines'], geopackage.feature_tables(self.path))
+        self.assertEqual(
+            [1, 2], [f['id'] for f in geopackage.iter_features(self.path)]
+        )
+        conn = self.connect()
+        self.assertEqual([(2,)], conn.execute(
+            'SELECT count(*) FROM rtree_lines_geom').fetchall())
+        self.assertEqual(6, conn.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger'"
+        ).fetchone()[0])
+
+    def test_empty_geometries(self):
+        features = [
+            {'geometry': {'type': 'Point', 'coordinates': []}},
+            {'geometry': {'type': 'MultiPolygon', 'coordinates': [[]]}},
+            {'geometry': {'type': 'GeometryCollection', 'geometries': []}},
+            self.features[0],
+        ]
+        self.assertEqual(4, geopackage.write_features(self.path, 'lines',
+                                                      features))
+        blobs = [f.blob for f in geopackage.iter_features(self.path)]
+        for blob in blobs[:3]:
+            self.assertEqual(0b00010000, blob[3])
+            self.assertIsNone(geopackage.envelope(blob))
+        self.assertEqual([], geopackage.loads(blobs[1])['coordinates'])
+        self.assertEqual([], geopackage.loads(blobs[2])['geometries'])
+
+        # Empty geometries are left out of the R-tree index.
+        conn = self.connect()
+        self.assertEqual(
+            [(4, 0.0, 1.0, 0.0, 0.0)],
+            conn.execute('SELECT * FROM rtree_lines_geom').fetchall()
+        )
+
+    def test_bool_id(self):
+        self.features[0]['id'] = True
+        self.features[1]['id'] = 5
+        self.features[2]['id'] = False
+        geopackage.write_features(self.path, 'lines', self.features[:3])
+        self.assertEqual(
+            [1, 5, 6], [f['id'] for f in geopackage.iter_features(self.path)]
+        )
+
+    def test_reserved_column_names(self):
+        for name in ('fid', 'FID', 'geom'):
+            self.features[0]['properties'][name] = 1
+            with self.assertRaises(ValueError) as ar:
+                geopackage.write_features(self.path, 'lines', self.features)
+            self.assertIn('Cannot write property %r into table' % name,
+                          str(ar.exception))
+            del self.features[0]['properties'][name]
+        self.assertEqual([(0,)], self.connect().execute(
+            "SELECT count(*) FROM sqlite_master WHERE name = 'lines'"
+        ).fetchall())
+
+    def test_undefined_cartesian_srid(self):
+        geopackage.write_features(self.path, 'lines', self.features,
+                                  srid=-1)
+        geoms = [f['geometry'] for f in geopackage.iter_features(self.path)]
+        self.assertEqual([{'srid': -1}] * 7, [g['meta'] for g in geoms])
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            geopackage.write_features(self.path, 'lines', self.features,
+                                      batch_size=0)
+
+
+class TestQueryBBox(unittest.TestCase):
+    def setUp(self):
+        # A 10x10 grid of triangles, with unit square envelopes.
+        self.features = [
+            {'geometry': {'type': 'Polygon', 'coordinates': [[
+                [float(x), float(y)], [x + 1.0, float(y)],
+                [x + 1.0, y + 1.0], [float(x), float(y)],
+            ]]}, 'properties': {'x': x, 'y': y}}
+            for y in range(10) for x in range(10)
+        ]
+        self.features.append({'geometry': None, 'properties': {}})
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, 'test.gpkg')
+
+    def query(self, bbox, **kwargs):
+        return sorted(
+            (f['properties']['x'], f['properties']['y'])
+            for f in geopackage.query_bbox(self.path, 'grid', bbox, **kwargs)
+        )
+
+    def check_queries(self):
+        self.assertEqual([(2, 3), (2, 4), (3, 3), (3, 4)],
+                         self.query((2.5, 3.5, 3.5, 4.5)))
+        # Touching envelopes intersect.
+        self.assertEqual([(0, 0), (1, 0)], self.query((1.0, 0.0, 1.0, 0.5)))
+        # The Z range of a 3D bbox is ignored.
+        self.assertEqual([(9, 9)],
+                         self.query((9.5, 9.5, 5.0, 20.0, 20.0, 6.0)))
+        self.assertEqual([], self.query((10.5, 0.0, 11.0, 10.0)))
+        self.assertEqual([(3, 0), (3, 1), (3, 2)],
+                         self.query((3.2, 0.0, 3.8, 2.5)))
+        self.assertEqual(100, len(self.query((-1.0, -1.0, 11.0, 11.0),
+                                             batch_size=7)))
+
+    def test_query_bbox(self):
+        geopackage.write_features(self.path, 'grid', self.features)
+        self.check_queries()
+
+        feature = next(geopackage.query_bbox(self.path, 'grid',
+                                             (0.1, 0.1, 0.2, 0.2)))
+        self.assertEqual(1, feature['id'])
+        self.assertEqual(self.features[0]['geometry']['coordinates'],
+                         feature['geometry']['coordinates'])
+
+    def test_uses_rtree(self):
+        geopackage.write_features(self.path, 'grid', self.features)
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        conn.execute('DELETE FROM rtree_grid_geom WHERE id = 1')
+        conn.commit()
+        self.assertEqual([(1, 0)], self.query((0.1, 0.1, 1.5, 0.2)))
+
+    def test_rtree_candidates_checked(self):
+        geopackage.write_features(self.path, 'grid', self.features)
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        conn.execute('UPDATE rtree_grid_geom SET maxx = 50.0 WHERE id = 1')
+        conn.commit()
+        self.assertEqual([], self.query((20.0, 0.0, 30.0, 0.5)))
+
+    def test_without_rtree(self):
+        geopackage.write_features(self.path, 'grid', self.features,
+                                  spatial_index=False)
+        self.check_queries()
+
+    def test_invalid_bbox(self):
+        geopackage.write_features(self.path, 'grid', self.features)
+        for bbox in ((0.0, 1.0, 0.0), (0.0, 0.0, 1.0, 1.0, 2.0)):
+            with self.assertRaises(ValueError):
+                self.query(bbox)
+
+
 class TestLoadsInvalidGPB(unittest.TestCase):
     def test_no_magic(self):
         gpkg = (
@@ -680,6 +1381,33 @@ class TestBuildGeoPackageHeader(unittest.TestCase):
 
         self.assertEqual(expected, header)
 
+    def test_build_header_m_envelope(self):
+        geom = {'type': 'Point', 'coordinates': [1.0, 2.0, 0.0, 3.0]}
+        envelope = (1.0, 1.0, 2.0, 2.0, 3.0, 3.0)
+        header = geopackage._build_geopackage_header(
+            geom, is_little_endian=True, envelope=envelope, is_m=True
+        )
+        self.assertEqual(
+            build_header(flags=0b00000111, srid=0)
+            + struct.pack('<6d', *envelope),
+            header,
+        )
+
+    def test_build_header_empty_geometrycollection(self):
+        geom = {'type': 'GeometryCollection', 'geometries': [
+            {'type': 'LineString', 'coordinates': []},
+            {'type': 'GeometryCollection', 'geometries': []},
+        ]}
+        header = geopackage._build_geopackage_header(geom,
+                                                     is_little_endian=True)
+        self.assertEqual(build_header(flags=0b00010001, srid=0), header)
+
+        geom['geometries'].append({'type': 'Point',
+                                   'coordinates': [1.0, 2.0]})
+        header = geopackage._build_geopackage_header(geom,
+                                                     is_little_endian=True)
+        self.assertEqual(build_header(flags=0b00000001, srid=0), header)
+
     def test_build_header_invalid_envelope(self):
         geom = {
             'coordinates': [1.0, 1.0],
@@ -0,0 +1,180 @@
+#  Copyright 2013 Lars Butler & individual contributors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import unittest
+
+from geomet import transcode
+from geomet import wkb
+from geomet import wkt
+
+
+class WKBToWKTTestCase(unittest.TestCase):
+
+    geoms = [
+        dict(type='Point', coordinates=[0.0, 1.0]),
+        dict(type='Point', coordinates=[0.0, 1.0, 2.0, 3.0]),
+        dict(type='LineString', coordinates=[[0.0, 1.5], [-2.25, 3e-7]]),
+        dict(type='Polygon', coordinates=[
+            [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 1.0, 1.0],
+             [0.0, 0.0, 1.0]],
+            [[0.1, 0.1, 1.0], [0.2, 0.1, 1.0], [0.1, 0.2, 1.0],
+             [0.1, 0.1, 1.0]],
+        ]),
+        dict(type='MultiPoint', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+        dict(type='MultiLineString', coordinates=[
+            [[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0], [6.0, 7.0]],
+        ]),
+        dict(type='MultiPolygon', coordinates=[
+            [[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]],
+            [[[2.0, 2.0], [3.0, 2.0], [2.0, 3.0], [2.0, 2.0]]],
+        ]),
+        dict(type='GeometryCollection', geometries=[
+            dict(type='Point', coordinates=[0.0, 1.0]),
+            dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+        ]),
+    ]
+
+    def assertSameAsDumps(self, wkb_str, **kwargs):
+        self.assertEqual(wkt.dumps(wkb.loads(wkb_str), **kwargs),
+                         transcode.wkb_to_wkt(wkb_str, **kwargs))
+
+    def test_same_as_dumps(self):
+        for geom in self.geoms:
+            for big_endian in (True, False):
+                wkb_str = wkb.dumps(geom, big_endian=big_endian)
+                for decimals in (16, 4, 0, None):
+                    self.assertSameAsDumps(wkb_str, decimals=decimals)
+
+    def test_srid(self):
+        ls = dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]],
+                  meta=dict(srid=4326))
+        self.assertEqual(
+            'SRID=4326;LINESTRING (0.0 1.0, 2.0 3.0)',
+            transcode.wkb_to_wkt(wkb.dumps(ls), decimals=1),
+        )
+
+    def test_empty(self):
+        # `wkb.dumps` can't write these, so they are spelled out here.
+        cases = [
+            # SRID=4326;LINESTRING EMPTY. Like `wkt.dumps`, EMPTY
+            # geometries are written without an SRID.
+            ('LINESTRING EMPTY', '0020000002000010e600000000'),
+            # MULTIPOLYGON EMPTY
+            ('MULTIPOLYGON EMPTY', '010600000000000000'),
+            # GEOMETRYCOLLECTION (LINESTRING EMPTY, POINT (0 1))
+            ('GEOMETRYCOLLECTION (LINESTRING EMPTY,POINT (0.0 1.0))',
+             '0000000007000000020000000002000000000000000001'
+             '00000000000000003ff0000000000000'),
+            # GEOMETRYCOLLECTION EMPTY
+            ('GEOMETRYCOLLECTION EMPTY', '000000000700000000'),
+        ]
+        for expected, wkb_hex in cases:
+            wkb_str = bytes.fromhex(wkb_hex)
+            self.assertEqual(expected,
+                             transcode.wkb_to_wkt(wkb_str, decimals=1))
+
+    def test_m(self):
+        # LINESTRING M (1 2 3, 4 5 6)
+        ls_wkb = bytes.fromhex(
+            '00000007d200000002'
+            '3ff0000000000000' '4000000000000000' '4008000000000000'
+            '4010000000000000' '4014000000000000' '4018000000000000'
+        )
+        self.assertEqual('LINESTRING (1.0 2.0 0.0 3.0, 4.0 5.0 0.0 6.0)',
+                         transcode.wkb_to_wkt(ls_wkb, decimals=1))
+        self.assertSameAsDumps(ls_wkb)
+
+    def test_truncated(self):
+        # Truncated WKB fails like `wkb.loads`, with a ValueError rather
+        # than a `struct.error`.
+        for geom in self.geoms:
+            wkb_str = wkb.dumps(geom)
+            for end in range(1, len(wkb_str)):
+                with self.assertRaises(ValueError) as ar:
+                    transcode.wkb_to_wkt(wkb_str[:end])
+                self.assertTrue(str(ar.exception).startswith('Truncated WKB'))
+
+    def test_negative_count(self):
+        # LINESTRING with a vertex count of -1
+        ls_wkb = bytes.fromhex('0000000002ffffffff') + bytes(32)
+        with self.assertRaises(ValueError) as ar:
+            transcode.wkb_to_wkt(ls_wkb)
+        self.assertEqual('Invalid WKB: negative count -1 at offset 5',
+                         str(ar.exception))
+
+    def test_unsupported_geom_type(self):
+        with self.assertRaises(ValueError) as ar:
+            transcode.wkb_to_wkt(b'\x00\x00\x00\x00\x08')
+        self.assertEqual("Unsupported geometry type 'None'",
+                         str(ar.exception))
+
+
+class WKTToWKBTestCase(unittest.TestCase):
+
+    wkts = [
+        'POINT (0 1)',
+        'POINT (0 1 2 3)',
+        'LINESTRING (0 1.5, -2.25 3e-7)',
+        'POLYGON ((0 0 1, 1 0 1, 0 1 1, 0 0 1), '
+        '(0.1 0.1 1, 0.2 0.1 1, 0.1 0.2 1, 0.1 0.1 1))',
+        'POLYGON (((0 0, 1 0, 0 1, 0 0)))',
+        'MULTIPOINT ((0 1), (2 3))',
+        'MULTIPOINT (0 1, 2 3)',
+        'MULTILINESTRING ((0 1, 2 3), (4 5, 6 7))',
+        'MULTILINESTRING ((0 1, 2 3), EMPTY)',
+        'MULTIPOLYGON (((0 0, 1 0, 0 1, 0 0)), ((2 2, 3 2, 2 3, 2 2)))',
+        'GEOMETRYCOLLECTION (POINT (0 1), LINESTRING (0 1 2, 3 4 5))',
+        'SRID=4326;GEOMETRYCOLLECTION (POINT (0 1))',
+    ]
+
+    def test_same_as_dumps(self):
+        for wkt_str in self.wkts:
+            for big_endian in (True, False):
+                self.assertEqual(
+                    wkb.dumps(wkt.loads(wkt_str), big_endian=big_endian),
+                    transcode.wkt_to_wkb(wkt_str, big_endian=big_endian),
+                )
+
+    def test_srid(self):
+        self.assertEqual(
+            b'\x01\x01\x00\x00\x20\xe6\x10\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\xf0\x3f',
+            transcode.wkt_to_wkb('SRID=4326;POINT (0 1)', big_endian=False),
+        )
+
+    def test_empty(self):
+        for wkt_str in ('POINT EMPTY', 'SRID=4326;LINESTRING EMPTY',
+                        'MULTIPOINT ()', 'GEOMETRYCOLLECTION (POINT EMPTY)',
+                        'MULTILINESTRING (EMPTY, (0 1, 2 3))'):
+            with self.assertRaises(ValueError) as ar:
+                transcode.wkt_to_wkb(wkt_str)
+            self.assertEqual(
+                'Empty geometries cannot be represented in WKB. Reason: The '
+                'dimensionality of the WKB would be ambiguous.',
+                str(ar.exception))
+
+    def test_mixed_dims(self):
+        for wkt_str in ('LINESTRING (0 1, 2 3 4)',
+                        'POLYGON ((0 0, 1 0, 0 0), (0 0 0, 1 0 0, 0 0 0))',
+                        'MULTIPOINT (0 1, 2 3 4)'):
+            with self.assertRaises(ValueError) as ar:
+                transcode.wkt_to_wkb(wkt_str)
+            self.assertEqual('Cannot mix dimensionality in a geometry',
+                             str(ar.exception))
+
+    def test_invalid_wkt(self):
+        with self.assertRaises(ValueError) as ar:
+            transcode.wkt_to_wkb('LINESTRING 0 1, 2 3')
+        self.assertEqual('Invalid WKT: `LINESTRING 0 1, 2 3`',
+                         str(ar.exception))
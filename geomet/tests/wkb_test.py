@@ -11,10 +11,18 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import io
+import mmap
+import struct
 import unittest
 
 from geomet import wkb
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class WKBTestCase(unittest.TestCase):
 
@@ -225,6 +233,23 @@ class LineStringTestCase(unittest.TestCase):
     def test_loads_2d_srid1234(self):
         self.assertEqual(self.ls2d_srid1234, wkb.loads(self.ls2d_srid1234_wkb))
 
+    def test_dumps_mixed_dims(self):
+        # The total number of values matches 3 vertices of 3 values each,
+        # which must not hide the vertices with the wrong dimensions.
+        for coords in ([[0, 1, 5], [2, 3, 4, 5], [1, 2]],
+                       [[0, 1, 5], [2, 3]]):
+            ls = dict(type='LineString', coordinates=coords)
+            with self.assertRaises(ValueError) as ar:
+                wkb.dumps(ls)
+            self.assertEqual('Cannot mix dimensionality in a geometry',
+                             str(ar.exception))
+        poly = dict(type='Polygon', coordinates=[
+            [[0, 0], [1, 0], [0, 1], [0, 0]],
+            [[0, 0, 1], [1, 0], [0, 1, 1], [0, 0]],
+        ])
+        with self.assertRaises(ValueError):
+            wkb.dumps(poly)
+
 
 class PolygonTestCase(unittest.TestCase):
 
@@ -1352,3 +1377,611 @@ class GeometryCollectionTestCase(unittest.TestCase):
 
     def test_loads_2d_srid1234(self):
         self.assertEqual(self.gc2d_srid1234, wkb.loads(self.gc2d_srid1234_wkb))
+
+    def test_round_trip_member_srid(self):
+        gc = dict(type='GeometryCollection', geometries=[
+            dict(type='Point', coordinates=[0.0, 1.0, 2.0]),
+            dict(type='MultiPolygon', coordinates=[
+                [[[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0],
+                  [0.0, 0.0, 0.0]]],
+            ], meta=dict(srid=4326), crs={
+                'type': 'name', 'properties': {'name': 'EPSG4326'},
+            }),
+        ])
+        for big_endian in (True, False):
+            gc_wkb = wkb.dumps(gc, big_endian=big_endian)
+            self.assertEqual(gc, wkb.loads(gc_wkb))
+
+
+class LoadsBufferTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.ls2d = dict(type='LineString',
+                         coordinates=[[2.2, 4.4], [3.1, 5.1], [5.0, 7.0]])
+        self.ls2d_wkb = wkb.dumps(self.ls2d, big_endian=False)
+
+    def test_bytearray(self):
+        self.assertEqual(self.ls2d, wkb.loads(bytearray(self.ls2d_wkb)))
+
+    def test_memoryview(self):
+        data = memoryview(b'\xff\xff' + self.ls2d_wkb)[2:]
+        self.assertEqual(self.ls2d, wkb.loads(data))
+
+    def test_mmap(self):
+        mm = mmap.mmap(-1, len(self.ls2d_wkb))
+        mm.write(self.ls2d_wkb)
+        self.assertEqual(self.ls2d, wkb.loads(mm))
+
+    def test_iterable(self):
+        self.assertEqual(self.ls2d, wkb.loads(iter(self.ls2d_wkb)))
+
+    def test_trailing_bytes_ignored(self):
+        self.assertEqual(self.ls2d, wkb.loads(self.ls2d_wkb + b'\x00' * 7))
+
+    def test_large_polygon(self):
+        ring = [[float(i), float(-i), i / 2.0] for i in range(10000)]
+        poly = dict(type='Polygon', coordinates=[ring, ring[:4]])
+        self.assertEqual(poly, wkb.loads(wkb.dumps(poly)))
+
+    def test_invalid_endian_byte(self):
+        with self.assertRaises(ValueError) as ar:
+            wkb.loads(b'\x02' + self.ls2d_wkb[1:])
+        self.assertEqual("Invalid endian byte: '0x02'. Expected 0x00 or 0x01",
+                         str(ar.exception))
+
+    def test_truncated_point(self):
+        pt_wkb = wkb.dumps(dict(type='Point', coordinates=[0.0, 1.0],
+                                meta=dict(srid=4326)))
+        cases = [
+            (pt_wkb[:3], 'expected 5 bytes at offset 0, but found 3'),
+            (pt_wkb[:7], 'expected 4 bytes at offset 5, but found 2'),
+            (pt_wkb[:-1], 'expected 16 bytes at offset 9, but found 15'),
+        ]
+        for data, msg in cases:
+            with self.assertRaises(ValueError) as ar:
+                wkb.loads(data)
+            self.assertEqual('Truncated WKB: ' + msg, str(ar.exception))
+
+    def test_truncated_linestring(self):
+        cases = [
+            (self.ls2d_wkb[:7], 'expected 4 bytes at offset 5, but found 2'),
+            (self.ls2d_wkb[:-1],
+             'expected 48 bytes at offset 9, but found 47'),
+        ]
+        for data, msg in cases:
+            for as_numpy in ((False, True) if numpy else (False,)):
+                with self.assertRaises(ValueError) as ar:
+                    wkb.loads(data, as_numpy=as_numpy)
+                self.assertEqual('Truncated WKB: ' + msg, str(ar.exception))
+
+    def test_negative_count(self):
+        data = self.ls2d_wkb[:5] + struct.pack('<l', -1) + bytes(32)
+        for as_numpy in ((False, True) if numpy else (False,)):
+            with self.assertRaises(ValueError) as ar:
+                wkb.loads(data, as_numpy=as_numpy)
+            self.assertEqual('Invalid WKB: negative count -1 at offset 5',
+                             str(ar.exception))
+
+    def test_truncated_multi(self):
+        geoms = [
+            dict(type='MultiPoint', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+            dict(type='MultiLineString',
+                 coordinates=[[[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0]]]),
+            dict(type='MultiPolygon', coordinates=[
+                [[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]],
+                [[[2.0, 2.0], [3.0, 2.0], [2.0, 3.0], [2.0, 2.0]]],
+            ]),
+            dict(type='GeometryCollection', geometries=[
+                dict(type='Point', coordinates=[0.0, 1.0]),
+                dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+            ]),
+        ]
+        for geom in geoms:
+            data = wkb.dumps(geom)
+            for end in range(len(data)):
+                with self.assertRaises(ValueError) as ar:
+                    wkb.loads(data[:end])
+                self.assertTrue(str(ar.exception).startswith(
+                    'Truncated WKB: expected '))
+
+
+class DumpsIntoTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.pt2d = dict(type='Point', coordinates=[0.0, 1.0],
+                         meta=dict(srid=4326))
+        self.poly3d = dict(type='Polygon', coordinates=[
+            [[100.001, 0.001, 0.0], [101.12345, 0.001, 1.0],
+             [101.001, 1.001, 2.0], [100.001, 0.001, 0.0]],
+        ])
+
+    def test_back_to_back(self):
+        expected = wkb.dumps(self.pt2d) + wkb.dumps(self.poly3d,
+                                                    big_endian=False)
+        buf = bytearray(len(expected))
+        end = wkb.dumps_into(self.pt2d, buf)
+        end = wkb.dumps_into(self.poly3d, buf, end, big_endian=False)
+        self.assertEqual(len(expected), end)
+        self.assertEqual(expected, buf)
+
+    def test_mmap(self):
+        expected = wkb.dumps(self.poly3d)
+        mm = mmap.mmap(-1, len(expected) + 3)
+        end = wkb.dumps_into(self.poly3d, mm, 3)
+        self.assertEqual(len(expected) + 3, end)
+        self.assertEqual(expected, mm[3:])
+
+    def test_memoryview(self):
+        expected = wkb.dumps(self.pt2d)
+        buf = bytearray(len(expected))
+        wkb.dumps_into(self.pt2d, memoryview(buf))
+        self.assertEqual(expected, buf)
+
+    def test_buffer_too_small(self):
+        buf = bytearray(40)
+        with self.assertRaises(ValueError) as ar:
+            wkb.dumps_into(self.pt2d, buf, 20)
+        self.assertEqual(
+            'Buffer of 40 bytes is too small to hold 25 bytes of WKB at '
+            'offset 20',
+            str(ar.exception),
+        )
+        self.assertEqual(bytearray(40), buf)
+
+    def test_read_only_buffer(self):
+        with self.assertRaises(TypeError):
+            wkb.dumps_into(self.pt2d, bytes(100))
+
+
+class PeekTestCase(unittest.TestCase):
+
+    def assertPeek(self, geom, big_endian=True, **expected):
+        geom_wkb = wkb.dumps(geom, big_endian=big_endian)
+        expected.setdefault('srid', None)
+        expected['big_endian'] = big_endian
+        expected['size'] = len(geom_wkb)
+        self.assertEqual(expected, wkb.peek(geom_wkb))
+
+    def test_point(self):
+        self.assertPeek(
+            dict(type='Point', coordinates=[0.0, 1.0, 2.0, 3.0]),
+            type='Point', dims='ZM', num_parts=1, num_rings=0,
+            num_vertices=1,
+        )
+
+    def test_polygon_srid(self):
+        self.assertPeek(
+            dict(type='Polygon', meta=dict(srid=26918), coordinates=[
+                [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]],
+                [[0.1, 0.1], [0.2, 0.1], [0.1, 0.2], [0.1, 0.1]],
+            ]),
+            big_endian=False, type='Polygon', dims='2D', srid=26918,
+            num_parts=1, num_rings=2, num_vertices=8,
+        )
+
+    def test_multipoint(self):
+        self.assertPeek(
+            dict(type='MultiPoint', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+            type='MultiPoint', dims='2D', num_parts=2, num_rings=0,
+            num_vertices=2,
+        )
+
+    def test_multilinestring(self):
+        self.assertPeek(
+            dict(type='MultiLineString', coordinates=[
+                [[0.0, 1.0, 2.0], [2.0, 3.0, 4.0]],
+                [[0.0, 1.0, 2.0], [2.0, 3.0, 4.0], [5.0, 6.0, 7.0]],
+            ]),
+            type='MultiLineString', dims='Z', num_parts=2, num_rings=0,
+            num_vertices=5,
+        )
+
+    def test_multipolygon(self):
+        ring = [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]
+        self.assertPeek(
+            dict(type='MultiPolygon', coordinates=[[ring, ring], [ring]]),
+            big_endian=False, type='MultiPolygon', dims='2D', num_parts=2,
+            num_rings=3, num_vertices=12,
+        )
+
+    def test_geometrycollection(self):
+        ring = [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]
+        self.assertPeek(
+            dict(type='GeometryCollection', geometries=[
+                dict(type='Point', coordinates=[0.0, 1.0]),
+                dict(type='Polygon', coordinates=[ring],
+                     meta=dict(srid=4326)),
+            ]),
+            type='GeometryCollection', dims='2D', num_parts=2, num_rings=1,
+            num_vertices=5,
+        )
+
+    def test_m(self):
+        ls_wkb = (
+            b'\x01'  # little endian
+            b'\xd2\x07\x00\x00'  # m linestring
+            b'\x01\x00\x00\x00'  # 1 vertex
+            b'\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\xf0?'
+            b'\x00\x00\x00\x00\x00\x00\x00@'
+        )
+        info = wkb.peek(ls_wkb)
+        self.assertEqual('M', info['dims'])
+        self.assertEqual(1, info['num_vertices'])
+
+    def test_truncated(self):
+        ls_wkb = wkb.dumps(dict(type='LineString',
+                                coordinates=[[0.0, 1.0], [2.0, 3.0]]))
+        with self.assertRaises(ValueError) as ar:
+            wkb.peek(ls_wkb[:-1])
+        self.assertEqual('Truncated WKB: expected 41 bytes, but found 40',
+                         str(ar.exception))
+
+    def test_truncated_counts(self):
+        geoms = [
+            dict(type='Polygon', coordinates=[
+                [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]],
+            ]),
+            dict(type='MultiLineString',
+                 coordinates=[[[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0]]]),
+            dict(type='MultiPolygon', coordinates=[
+                [[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]],
+            ]),
+            dict(type='GeometryCollection', geometries=[
+                dict(type='Point', coordinates=[0.0, 1.0]),
+                dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+            ]),
+        ]
+        for geom in geoms:
+            data = wkb.dumps(geom)
+            for end in range(len(data)):
+                with self.assertRaises(ValueError) as ar:
+                    wkb.peek(data[:end])
+                self.assertTrue(str(ar.exception).startswith('Truncated WKB'))
+
+    def test_negative_count(self):
+        ls_wkb = b'\x00\x00\x00\x00\x02\xff\xff\xff\xff'
+        with self.assertRaises(ValueError) as ar:
+            wkb.peek(ls_wkb)
+        self.assertEqual('Invalid WKB: negative count -1 at offset 5',
+                         str(ar.exception))
+
+
+class BoundsTestCase(unittest.TestCase):
+
+    def test_point(self):
+        pt = dict(type='Point', coordinates=[1.0, -2.0, 3.0])
+        self.assertEqual((1.0, -2.0, 3.0, 1.0, -2.0, 3.0),
+                         wkb.bounds(wkb.dumps(pt)))
+
+    def test_polygon(self):
+        poly = dict(type='Polygon', coordinates=[
+            [[0.0, 0.0], [10.0, 0.0], [0.0, 20.0], [0.0, 0.0]],
+            [[1.0, 1.0], [-2.0, 1.0], [1.0, 2.0], [1.0, 1.0]],
+        ])
+        self.assertEqual((-2.0, 0.0, 10.0, 20.0),
+                         wkb.bounds(wkb.dumps(poly, big_endian=False)))
+
+    def test_multipoint(self):
+        mp = dict(type='MultiPoint', coordinates=[[0.0, 1.0], [-3.0, 4.0]])
+        self.assertEqual((-3.0, 1.0, 0.0, 4.0), wkb.bounds(wkb.dumps(mp)))
+
+    def test_multilinestring(self):
+        mls = dict(type='MultiLineString', coordinates=[
+            [[0.0, 1.0, 2.0, 3.0], [1.0, 1.0, 1.0, 1.0]],
+            [[5.0, -1.0, 7.0, 0.5]],
+        ])
+        self.assertEqual((0.0, -1.0, 1.0, 0.5, 5.0, 1.0, 7.0, 3.0),
+                         wkb.bounds(wkb.dumps(mls)))
+
+    def test_multipolygon(self):
+        mpoly = dict(type='MultiPolygon', coordinates=[
+            [[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]],
+            [[[5.0, 5.0], [6.0, 5.0], [5.0, 7.5], [5.0, 5.0]]],
+        ])
+        self.assertEqual((0.0, 0.0, 6.0, 7.5), wkb.bounds(wkb.dumps(mpoly)))
+
+    def test_geometrycollection(self):
+        gc = dict(type='GeometryCollection', geometries=[
+            dict(type='Point', coordinates=[10.0, 20.0],
+                 meta=dict(srid=4326)),
+            dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+        ])
+        self.assertEqual((0.0, 1.0, 10.0, 20.0), wkb.bounds(wkb.dumps(gc)))
+
+    def test_m(self):
+        ls_wkb = (
+            b'\x01'  # little endian
+            b'\xd2\x07\x00\x00'  # m linestring
+            b'\x02\x00\x00\x00'  # 2 vertices
+            b'\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\xf0?'
+            b'\x00\x00\x00\x00\x00\x00\x00@'
+            b'\x00\x00\x00\x00\x00\x00\xf0?'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00'
+        )
+        self.assertEqual((0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0, 2.0),
+                         wkb.bounds(ls_wkb))
+
+    def test_no_vertices(self):
+        ls_wkb = (
+            b'\x00'  # big endian
+            b'\x00\x00\x00\x02'  # 2d linestring
+            b'\x00\x00\x00\x00'  # 0 vertices
+        )
+        self.assertIsNone(wkb.bounds(ls_wkb))
+
+    def test_truncated(self):
+        geoms = [
+            dict(type='Point', coordinates=[0.0, 1.0]),
+            dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+            dict(type='Polygon', coordinates=[
+                [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]],
+            ]),
+            dict(type='MultiPoint', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+            dict(type='MultiLineString',
+                 coordinates=[[[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0]]]),
+            dict(type='MultiPolygon', coordinates=[
+                [[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]],
+            ]),
+        ]
+        for geom in geoms:
+            data = wkb.dumps(geom)
+            for end in range(len(data)):
+                with self.assertRaises(ValueError) as ar:
+                    wkb.bounds(data[:end])
+                self.assertTrue(str(ar.exception).startswith('Truncated WKB'))
+
+    def test_invalid_count(self):
+        ls_header = b'\x00\x00\x00\x00\x02'
+        with self.assertRaises(ValueError) as ar:
+            wkb.bounds(ls_header + b'\xff\xff\xff\xff' + bytes(16))
+        self.assertEqual('Invalid WKB: negative count -1 at offset 5',
+                         str(ar.exception))
+        with self.assertRaises(ValueError) as ar:
+            wkb.bounds(ls_header + b'\x7f\xff\xff\xff' + bytes(16))
+        self.assertEqual(
+            'Truncated WKB: expected 34359738352 bytes at offset 9, but '
+            'found 16', str(ar.exception)
+        )
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class LoadsNumpyTestCase(unittest.TestCase):
+
+    def assertArrayEqual(self, expected, actual):
+        self.assertIsInstance(actual, numpy.ndarray)
+        self.assertEqual(numpy.float64, actual.dtype)
+        self.assertEqual(expected, actual.tolist())
+
+    def test_point(self):
+        pt = dict(type='Point', coordinates=[1.0, 2.0, 3.0])
+        for big_endian in (True, False):
+            result = wkb.loads(wkb.dumps(pt, big_endian), as_numpy=True)
+            self.assertEqual('Point', result['type'])
+            self.assertArrayEqual([1.0, 2.0, 3.0], result['coordinates'])
+
+    def test_linestring(self):
+        ls = dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]])
+        for big_endian in (True, False):
+            result = wkb.loads(wkb.dumps(ls, big_endian), as_numpy=True)
+            self.assertArrayEqual([[0.0, 1.0], [2.0, 3.0]],
+                                  result['coordinates'])
+
+    def test_polygon(self):
+        rings = [
+            [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 1.0, 1.0],
+             [0.0, 0.0, 1.0]],
+            [[0.1, 0.1, 2.0], [0.2, 0.1, 2.0], [0.1, 0.2, 2.0],
+             [0.1, 0.1, 2.0]],
+        ]
+        poly = dict(type='Polygon', coordinates=rings)
+        result = wkb.loads(wkb.dumps(poly), as_numpy=True)
+        self.assertEqual(2, len(result['coordinates']))
+        for expected, actual in zip(rings, result['coordinates']):
+            self.assertArrayEqual(expected, actual)
+
+    def test_multipoint(self):
+        mp = dict(type='MultiPoint', coordinates=[
+            [0.0, 1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0], [8.0, 9.0, 0.0, 1.0],
+        ])
+        for big_endian in (True, False):
+            result = wkb.loads(wkb.dumps(mp, big_endian), as_numpy=True)
+            self.assertArrayEqual(mp['coordinates'], result['coordinates'])
+
+    def test_multipolygon(self):
+        mpoly = dict(type='MultiPolygon', coordinates=[
+            [[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]],
+            [[[5.0, 5.0], [6.0, 5.0], [5.0, 7.5], [5.0, 5.0]]],
+        ])
+        result = wkb.loads(wkb.dumps(mpoly, False), as_numpy=True)
+        for expected, actual in zip(mpoly['coordinates'],
+                                    result['coordinates']):
+            self.assertArrayEqual(expected[0], actual[0])
+
+    def test_geometrycollection(self):
+        gc = dict(type='GeometryCollection', geometries=[
+            dict(type='Point', coordinates=[10.0, 20.0]),
+            dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]]),
+        ])
+        result = wkb.loads(wkb.dumps(gc), as_numpy=True)
+        pt, ls = result['geometries']
+        self.assertArrayEqual([10.0, 20.0], pt['coordinates'])
+        self.assertArrayEqual([[0.0, 1.0], [2.0, 3.0]], ls['coordinates'])
+
+    def test_m(self):
+        mp_wkb = (
+            b'\x01'  # little endian
+            b'\xd4\x07\x00\x00'  # m multipoint
+            b'\x02\x00\x00\x00'  # 2 points
+            b'\x01'  # little endian
+            b'\xd1\x07\x00\x00'  # m point
+            b'\x00\x00\x00\x00\x00\x00\xf0?'
+            b'\x00\x00\x00\x00\x00\x00\x00@'
+            b'\x00\x00\x00\x00\x00\x00\x08@'
+            b'\x01'  # little endian
+            b'\xd1\x07\x00\x00'  # m point
+            b'\x00\x00\x00\x00\x00\x00\x10@'
+            b'\x00\x00\x00\x00\x00\x00\x14@'
+            b'\x00\x00\x00\x00\x00\x00\x18@'
+        )
+        result = wkb.loads(mp_wkb, as_numpy=True)
+        self.assertEqual(wkb.loads(mp_wkb)['coordinates'],
+                         result['coordinates'].tolist())
+        self.assertArrayEqual([[1.0, 2.0, 0.0, 3.0], [4.0, 5.0, 0.0, 6.0]],
+                              result['coordinates'])
+
+    def test_arrays_do_not_share_memory(self):
+        buf = bytearray(wkb.dumps(
+            dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]])
+        ))
+        result = wkb.loads(buf, as_numpy=True)
+        buf[17:25] = b'\x00' * 8
+        self.assertArrayEqual([[0.0, 1.0], [2.0, 3.0]],
+                              result['coordinates'])
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class DumpsNumpyTestCase(unittest.TestCase):
+
+    def assertDumpsLikeLists(self, obj, as_lists):
+        for big_endian in (True, False):
+            self.assertEqual(wkb.dumps(as_lists, big_endian),
+                             wkb.dumps(obj, big_endian))
+
+    def test_linestring(self):
+        coords = [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+        self.assertDumpsLikeLists(
+            dict(type='LineString', coordinates=numpy.array(coords)),
+            dict(type='LineString', coordinates=coords),
+        )
+
+    def test_polygon(self):
+        rings = [
+            [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]],
+            [[0.1, 0.1], [0.2, 0.1], [0.1, 0.2], [0.1, 0.1]],
+        ]
+        self.assertDumpsLikeLists(
+            dict(type='Polygon',
+                 coordinates=[numpy.array(ring) for ring in rings],
+                 meta=dict(srid=4326)),
+            dict(type='Polygon', coordinates=rings, meta=dict(srid=4326)),
+        )
+
+    def test_multipolygon(self):
+        ring = [[0.0, 0.0, 0.0, 1.0], [1.0, 0.0, 0.0, 1.0],
+                [0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 0.0, 1.0]]
+        self.assertDumpsLikeLists(
+            dict(type='MultiPolygon', coordinates=[[numpy.array(ring)]]),
+            dict(type='MultiPolygon', coordinates=[[ring]]),
+        )
+
+    def test_point_and_multipoint(self):
+        self.assertDumpsLikeLists(
+            dict(type='Point', coordinates=numpy.array([1.0, 2.0])),
+            dict(type='Point', coordinates=[1.0, 2.0]),
+        )
+        self.assertDumpsLikeLists(
+            dict(type='MultiPoint',
+                 coordinates=numpy.array([[1.0, 2.0], [3.0, 4.0]])),
+            dict(type='MultiPoint', coordinates=[[1.0, 2.0], [3.0, 4.0]]),
+        )
+
+    def test_non_contiguous_and_other_dtypes(self):
+        coords = numpy.arange(12, dtype='>i4').reshape(4, 3)[::2, :2]
+        self.assertDumpsLikeLists(
+            dict(type='LineString', coordinates=coords),
+            dict(type='LineString', coordinates=coords.tolist()),
+        )
+
+    def test_round_trip(self):
+        coords = numpy.random.default_rng(0).random((100, 2))
+        ls = dict(type='LineString', coordinates=coords)
+        result = wkb.loads(wkb.dumps(ls, big_endian=False), as_numpy=True)
+        numpy.testing.assert_array_equal(coords, result['coordinates'])
+
+    def test_mismatched_dims(self):
+        poly = dict(type='Polygon', coordinates=[
+            numpy.zeros((4, 2)), numpy.zeros((4, 3)),
+        ])
+        with self.assertRaises(ValueError) as ar:
+            wkb.dumps(poly)
+        self.assertEqual('Expected an array of vertices with shape (n, 2), '
+                         'but got an array with shape (4, 3)',
+                         str(ar.exception))
+
+
+class IterLoadTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.geoms = [
+            dict(type='Point', coordinates=[0.0, 1.0]),
+            dict(type='LineString', coordinates=[[0.0, 1.0], [2.0, 3.0]],
+                 meta=dict(srid=4326),
+                 crs=dict(type='name', properties=dict(name='EPSG4326'))),
+            dict(type='GeometryCollection', geometries=[
+                dict(type='Point', coordinates=[1.0, 2.0]),
+                dict(type='Polygon', coordinates=[
+                    [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]],
+                ]),
+            ]),
+        ]
+        self.blobs = [wkb.dumps(geom, big_endian=i % 2 == 0)
+                      for i, geom in enumerate(self.geoms)]
+        self.data = b''.join(self.blobs)
+        self.expected = [
+            (0, self.geoms[0]),
+            (len(self.blobs[0]), self.geoms[1]),
+            (len(self.blobs[0]) + len(self.blobs[1]), self.geoms[2]),
+        ]
+
+    def test_bytes(self):
+        self.assertEqual(self.expected, list(wkb.iter_load(self.data)))
+
+    def test_mmap(self):
+        mm = mmap.mmap(-1, len(self.data))
+        mm.write(self.data)
+        self.assertEqual(self.expected, list(wkb.iter_load(mm)))
+
+    def test_file(self):
+        self.assertEqual(self.expected,
+                         list(wkb.iter_load(io.BytesIO(self.data))))
+
+    def test_file_in_small_chunks(self):
+        for chunk_size in (1, 2, 7, 64):
+            tokens = wkb._iter_load(io.BytesIO(self.data),
+                                    wkb._as_buffer(b''), False, chunk_size)
+            self.assertEqual(self.expected, list(tokens))
+
+    def test_empty(self):
+        self.assertEqual([], list(wkb.iter_load(b'')))
+        self.assertEqual([], list(wkb.iter_load(io.BytesIO())))
+
+    def test_truncated(self):
+        for source in (self.data[:-1], io.BytesIO(self.data[:-1])):
+            with self.assertRaises(ValueError) as ar:
+                list(wkb.iter_load(source))
+            self.assertEqual(
+                'Truncated WKB at offset %s: expected %s bytes, but found %s'
+                % (self.expected[2][0], len(self.blobs[2]),
+                   len(self.blobs[2]) - 1),
+                str(ar.exception))
+
+    def test_truncated_header(self):
+        with self.assertRaises(ValueError) as ar:
+            list(wkb.iter_load(self.data + b'\x00'))
+        self.assertEqual('Truncated WKB at offset %s' % len(self.data),
+                         str(ar.exception))
+
+    def test_invalid(self):
+        # Errors other than truncation are raised at once, without reading
+        # the rest of the stream.
+        stream = io.BytesIO(self.data + b'\x02' + bytes(1000))
+        tokens = wkb._iter_load(stream, wkb._as_buffer(b''), False, 64)
+        with self.assertRaises(ValueError) as ar:
+            list(tokens)
+        self.assertEqual(
+            "Invalid endian byte: '0x02'. Expected 0x00 or 0x01",
+            str(ar.exception))
+        self.assertLess(stream.tell(), len(self.data) + 1000)
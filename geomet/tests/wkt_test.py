@@ -88,6 +88,38 @@ class WKTTestCase(unittest.TestCase):
         self.assertEqual("Unsupported geometry type 'TETRAHEDRON'",
                          str(ar.exception))
 
+    def test_dumps_shortest(self):
+        gc = dict(type='GeometryCollection', geometries=[
+            dict(type='Point', coordinates=[0.1, -2]),
+            dict(type='LineString', coordinates=[[1e-07, 1e16], [3.25, 4]]),
+            dict(type='MultiPolygon', coordinates=[
+                [[[0, 0], [1.5, 0], [0, 1.5], [0, 0]]],
+            ]),
+        ])
+        expected = (
+            'GEOMETRYCOLLECTION (POINT (0.1 -2.0),'
+            'LINESTRING (0.0000001 10000000000000000.0, 3.25 4.0),'
+            'MULTIPOLYGON (((0.0 0.0, 1.5 0.0, 0.0 1.5, 0.0 0.0))))'
+        )
+        self.assertEqual(expected, wkt.dumps(gc, decimals=None))
+
+    def test_dumps_shortest_round_trip(self):
+        coords = [[0.1 + 0.2, 1 / 3.0], [2 ** 0.5, -5e-324]]
+        ls = dict(type='LineString', coordinates=coords)
+        result = wkt.loads(wkt.dumps(ls, decimals=None))
+        self.assertEqual(coords, result['coordinates'])
+
+    def test_dumps_preserve_ints(self):
+        mp = dict(type='MultiPoint', coordinates=[[-10, 77.5], [1, 2.0]])
+        self.assertEqual(
+            'MULTIPOINT ((-10 77.50), (1 2.00))',
+            wkt.dumps(mp, decimals=2, preserve_ints=True),
+        )
+        self.assertEqual(
+            'MULTIPOINT ((-10 77.5), (1 2.0))',
+            wkt.dumps(mp, decimals=None, preserve_ints=True),
+        )
+
     def test_dumps_empty_geoms(self):
         types = [
             'Point',
@@ -161,6 +193,62 @@ class TestFileInteractions(unittest.TestCase):
         expected = 'POINT (0.0000000000000000 0.0000000000000000)'
         self.assertEqual(expected, written)
 
+    def test_dump_in_chunks(self):
+        class ChunkRecorder(object):
+            def __init__(self):
+                self.chunks = []
+
+            def write(self, chunk):
+                self.chunks.append(chunk)
+
+        ring = [[float(i), float(i)] for i in range(10000)]
+        geom = dict(type='MultiPolygon', coordinates=[[ring], [ring, ring]],
+                    meta=dict(srid=4326))
+        fobj = ChunkRecorder()
+        wkt.dump(geom, fobj, decimals=2)
+
+        self.assertEqual(wkt.dumps(geom, decimals=2), ''.join(fobj.chunks))
+        self.assertTrue(fobj.chunks[0].startswith('SRID=4326;'))
+        # No chunk holds more than a few thousand vertices.
+        longest = max(len(chunk) for chunk in fobj.chunks)
+        self.assertLess(longest, len(wkt.dumps(
+            dict(type='LineString', coordinates=ring), decimals=2
+        )))
+
+
+class IterDumpsTestCase(unittest.TestCase):
+
+    def test_geometrycollection(self):
+        gc = dict(type='GeometryCollection', geometries=[
+            dict(type='Point', coordinates=[0, 1]),
+            dict(type='Polygon', coordinates=[
+                [[0, 0], [1, 0], [0, 1], [0, 0]],
+                [[0.1, 0.1], [0.2, 0.1], [0.1, 0.2], [0.1, 0.1]],
+            ]),
+            dict(type='LineString', coordinates=[]),
+        ])
+        chunks = list(wkt.iter_dumps(gc, decimals=1))
+        self.assertEqual(
+            'GEOMETRYCOLLECTION (POINT (0.0 1.0),'
+            'POLYGON ((0.0 0.0, 1.0 0.0, 0.0 1.0, 0.0 0.0), '
+            '(0.1 0.1, 0.2 0.1, 0.1 0.2, 0.1 0.1)),LINESTRING EMPTY)',
+            ''.join(chunks),
+        )
+        self.assertIn('POINT (0.0 1.0)', chunks)
+
+    def test_empty(self):
+        self.assertEqual(['MULTIPOINT EMPTY'], list(wkt.iter_dumps(
+            dict(type='MultiPoint', coordinates=[[]], meta=dict(srid=4326))
+        )))
+
+    def test_raises_eagerly(self):
+        with self.assertRaises(ValueError):
+            wkt.iter_dumps(dict(type='Tetrahedron', coordinates=[[0, 0]]))
+        with self.assertRaises(ValueError):
+            wkt.iter_dumps(dict(type='Point', coordinates=[0, 0],
+                                meta=dict(srid=4326),
+                                crs=dict(properties=dict(name='EPSG4327'))))
+
 
 class PointDumpsTestCase(unittest.TestCase):
 
@@ -461,6 +549,43 @@ class PolygonLoadsTestCase(unittest.TestCase):
         )
         self.assertEqual(expected, wkt.loads(poly))
 
+    def test_raises_unclosed_ring(self):
+        poly = 'POLYGON ((0.0 0.0, 1.0 4.0, 4.0 1.0, 0.0 0.0'
+        with self.assertRaises(ValueError) as ar:
+            wkt.loads(poly)
+        self.assertEqual('Invalid WKT: `%s`' % poly, str(ar.exception))
+
+    def test_raises_values_between_rings(self):
+        poly = 'POLYGON ((0 0, 1 4, 4 1, 0 0) 5)'
+        with self.assertRaises(ValueError) as ar:
+            wkt.loads(poly)
+        self.assertEqual('Invalid WKT: `%s`' % poly, str(ar.exception))
+
+    def test_extra_parens(self):
+        poly = 'POLYGON (((0 0, 1 0, 1 1, 0 0)))'
+        self.assertEqual(
+            dict(type='Polygon', coordinates=[
+                [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]],
+            ]),
+            wkt.loads(poly),
+        )
+        gc = ('GEOMETRYCOLLECTION(POINT(10 20),'
+              'POLYGON(((0 0), (10 30), (30 10), (0 0)))')
+        expected = dict(type='GeometryCollection', geometries=[
+            dict(type='Point', coordinates=[10.0, 20.0]),
+            dict(type='Polygon', coordinates=[
+                [[0.0, 0.0]], [[10.0, 30.0]], [[30.0, 10.0]], [[0.0, 0.0]],
+            ]),
+        ])
+        self.assertEqual(expected, wkt.loads(gc))
+
+    def test_mixed_dimensions(self):
+        poly = 'POLYGON ((0 0, 1 4 2, 4 1, 0 0))'
+        expected = dict(type='Polygon', coordinates=[
+            [[0.0, 0.0], [1.0, 4.0, 2.0], [4.0, 1.0], [0.0, 0.0]]
+        ])
+        self.assertEqual(expected, wkt.loads(poly))
+
 
 class MultiPointLoadsTestCase(unittest.TestCase):
 
@@ -1237,6 +1362,31 @@ class TestRoundAndPad(unittest.TestCase):
         for args, expected in test_cases:
             self.assertEqual(expected, wkt._round_and_pad(*args))
 
+    def test_values_needing_rounding(self):
+        test_cases = [
+            [(0.30000000000000004, 16), '0.3000000000000000'],
+            [(1.23456789, 4), '1.2346'],
+            [(7, 2), '7.00'],
+            [(1e-7, 3), '0.000'],
+            [(2.5, 0), '2'],
+            [(-7.6, 0), '-8'],
+        ]
+
+        for args, expected in test_cases:
+            self.assertEqual(expected, wkt._round_and_pad(*args))
+
+
+class TestFormatVertices(unittest.TestCase):
+    def test(self):
+        fmt = wkt._coord_formatter(2)
+        self.assertEqual('0.00 1.00, 2.50 -3.00',
+                         wkt._format_vertices([[0, 1], (2.5, -3.0)], fmt))
+
+    def test_mixed_dimensions(self):
+        fmt = wkt._coord_formatter(1)
+        self.assertEqual('0.0 1.0, 2.0 3.0 4.0',
+                         wkt._format_vertices([[0, 1], [2, 3, 4]], fmt))
+
 
 class TestMisc(unittest.TestCase):
     def test_assert_next_token(self):
@@ -1253,3 +1403,185 @@ class TestMisc(unittest.TestCase):
 
         expected = 'Expected "b" but found "a"'
         self.assertEqual(expected, str(ar.exception))
+
+
+class TokenizeTestCase(unittest.TestCase):
+
+    def test_numbers(self):
+        tokens = wkt._tokenize_wkt('POINT(-1 +2.5 .5 -7. 1e10 -1.5E-3)')
+        self.assertEqual(
+            ['POINT', '(', '-1', '+2.5', '.5', '-7.', '1e10', '-1.5E-3', ')'],
+            list(tokens),
+        )
+
+    def test_whitespace(self):
+        tokens = wkt._tokenize_wkt('\n  LINESTRING (\n\t0 1,\r\n2 3 )  \n')
+        self.assertEqual(
+            ['LINESTRING', '(', '0', '1', ',', '2', '3', ')'], list(tokens)
+        )
+
+    def test_peek(self):
+        tokens = wkt._tokenize_wkt('POINT EMPTY')
+        self.assertEqual('POINT', next(tokens))
+        self.assertEqual('EMPTY', tokens.peek())
+        self.assertEqual('EMPTY', next(tokens))
+        self.assertRaises(StopIteration, tokens.peek)
+
+    def test_unclosed_parens(self):
+        tokens = wkt._tokenize_wkt('POINT (0 1')
+        self.assertEqual(['POINT', '(', '0', '1'],
+                         [next(tokens) for _ in range(4)])
+        with self.assertRaises(ValueError) as ar:
+            next(tokens)
+        self.assertEqual('Invalid WKT: `POINT (0 1`', str(ar.exception))
+
+    def test_next_values(self):
+        string = 'LINESTRING (0 1, 2.5 -3)'
+        tokens = wkt._tokenize_wkt(string)
+        stream_tokens = wkt._WKTStreamScanner(StringIO.StringIO(string), 3)
+        for toks in (tokens, stream_tokens):
+            self.assertEqual(['LINESTRING', '('], [next(toks), next(toks)])
+            self.assertEqual((2, [0.0, 1.0, 2.5, -3.0]), toks.next_values())
+
+    def test_next_values_mixed_dims(self):
+        string = 'LINESTRING (0 1, 2 3 4)'
+        tokens = wkt._tokenize_wkt(string)
+        stream_tokens = wkt._WKTStreamScanner(StringIO.StringIO(string), 3)
+        for toks in (tokens, stream_tokens):
+            next(toks), next(toks)
+            with self.assertRaises(ValueError) as ar:
+                toks.next_values()
+            self.assertEqual('Cannot mix dimensionality in a geometry',
+                             str(ar.exception))
+
+    def test_loads_multiline(self):
+        poly = 'POLYGON ((0 0,\n  1 0,\n  0 1,\n  0 0))\n'
+        self.assertEqual(
+            dict(type='Polygon',
+                 coordinates=[[[0.0, 0.0], [1.0, 0.0], [0.0, 1.0],
+                               [0.0, 0.0]]]),
+            wkt.loads(poly),
+        )
+
+
+class StreamLoadTestCase(unittest.TestCase):
+
+    wkts = [
+        'SRID=4326;POINT (-0.5 1e3)',
+        'POINT (1e-3 2.5E+2)',
+        'LINESTRING (100.0 0.0, 101.0 1.0, 102.5 -2.25)',
+        'POLYGON ((0 0 1, 10 0 1, 0 10 1, 0 0 1), '
+        '(1 1 2, 2 1 2, 1 2 2, 1 1 2))',
+        'MULTIPOINT ((0 1), (2 3), (4 5))',
+        'MULTILINESTRING ((0 1, 2 3), (4 5, 6 7, 8 9))',
+        'MULTIPOLYGON (((0 0, 1 0, 0 1, 0 0)), ((5 5, 6 5, 5 6, 5 5)))',
+        'GEOMETRYCOLLECTION (POINT (1 2),LINESTRING (3 4, 5 6),'
+        'MULTIPOINT EMPTY)',
+        'POLYGON EMPTY',
+    ]
+
+    def test_load_chunked(self):
+        for string in self.wkts:
+            for chunk_size in (1, 2, 3, 7, 64):
+                tokens = wkt._WKTStreamScanner(StringIO.StringIO(string),
+                                               chunk_size)
+                self.assertEqual(wkt.loads(string),
+                                 wkt._load(tokens, tokens.excerpt))
+
+    def test_load(self):
+        for string in self.wkts:
+            self.assertEqual(wkt.loads(string),
+                             wkt.load(StringIO.StringIO(string)))
+
+    def test_load_raises_unclosed(self):
+        string = 'MULTIPOLYGON (((0 0, 1 0, 0 1, 0 0))'
+        for chunk_size in (1, 5, 64):
+            tokens = wkt._WKTStreamScanner(StringIO.StringIO(string),
+                                           chunk_size)
+            with self.assertRaises(ValueError):
+                wkt._load(tokens, tokens.excerpt)
+
+    def test_load_error_excerpt(self):
+        string = 'LINESTRING (%s' % ', '.join(['1.5 2.5'] * 100)
+        with self.assertRaises(ValueError) as ar:
+            wkt.load(StringIO.StringIO(string))
+        self.assertEqual('Invalid WKT: `%s...`' % string[:80],
+                         str(ar.exception))
+
+    def test_iter_load_parts_multipolygon(self):
+        string = ('SRID=4326;MULTIPOLYGON (((0 0, 1 0, 0 1, 0 0)), '
+                  '((5 5, 6 5, 5 6, 5 5), (5.1 5.1, 5.2 5.1, 5.1 5.1)))')
+        parts = wkt.iter_load_parts(StringIO.StringIO(string))
+        expected = wkt.loads(string)
+        for coords in expected['coordinates']:
+            self.assertEqual(
+                dict(type='Polygon', coordinates=coords,
+                     meta=dict(srid=4326)),
+                next(parts),
+            )
+        self.assertRaises(StopIteration, next, parts)
+
+    def test_iter_load_parts_geometrycollection(self):
+        string = self.wkts[7]
+        parts = list(wkt.iter_load_parts(StringIO.StringIO(string)))
+        self.assertEqual(wkt.loads(string)['geometries'], parts)
+
+    def test_iter_load_parts_single(self):
+        string = self.wkts[2]
+        parts = list(wkt.iter_load_parts(StringIO.StringIO(string)))
+        self.assertEqual([wkt.loads(string)], parts)
+
+    def test_iter_load_parts_empty(self):
+        for string in ('POINT EMPTY', 'MULTIPOLYGON EMPTY'):
+            parts = wkt.iter_load_parts(StringIO.StringIO(string))
+            self.assertEqual([], list(parts))
+
+
+class IterLoadTestCase(unittest.TestCase):
+
+    wkts = StreamLoadTestCase.wkts
+
+    def test_newlines(self):
+        fobj = StringIO.StringIO('\n'.join(self.wkts) + '\n')
+        self.assertEqual([wkt.loads(string) for string in self.wkts],
+                         list(wkt.iter_load(fobj)))
+
+    def test_semicolons(self):
+        fobj = StringIO.StringIO(';\n'.join(self.wkts) + ';')
+        self.assertEqual([wkt.loads(string) for string in self.wkts],
+                         list(wkt.iter_load(fobj)))
+
+    def test_empty_file(self):
+        for string in ('', '  \n', ';'):
+            fobj = StringIO.StringIO(string)
+            self.assertEqual([], list(wkt.iter_load(fobj)))
+
+    def test_many(self):
+        strings = ['SRID=4326;POINT (%s -%s.25)' % (i, i) for i in range(5000)]
+        fobj = StringIO.StringIO('\n'.join(strings))
+        for i, geom in enumerate(wkt.iter_load(fobj)):
+            self.assertEqual(
+                dict(type='Point', coordinates=[float(i), -i - 0.25],
+                     meta=dict(srid=4326)),
+                geom,
+            )
+        self.assertEqual(4999, i)
+
+    def test_raises_invalid(self):
+        fobj = StringIO.StringIO('POINT (0 1)\nLINESTRING 0 1, 2 3\n'
+                                 'POINT (2 3)\n')
+        geoms = wkt.iter_load(fobj)
+        self.assertEqual(dict(type='Point', coordinates=[0.0, 1.0]),
+                         next(geoms))
+        with self.assertRaises(ValueError) as ar:
+            next(geoms)
+        self.assertEqual('Invalid WKT: `LINESTRING 0 1, 2 3`',
+                         str(ar.exception))
+
+    def test_raises_truncated(self):
+        fobj = StringIO.StringIO('POINT (0 1)\nPOINT')
+        geoms = wkt.iter_load(fobj)
+        next(geoms)
+        with self.assertRaises(ValueError) as ar:
+            next(geoms)
+        self.assertEqual('Invalid WKT: `POINT`', str(ar.exception))
@@ -33,7 +33,7 @@ import sys
 
 import click
 
-from geomet import util, wkb, wkt
+from geomet import transcode, util, wkb, wkt
 
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
@@ -44,18 +44,22 @@ def configure_logging(verbosity):
 
 
 def translate(text, output_format='json', indent=None, precision=-1):
+    kwds = {}
+    if precision >= 0:
+        kwds['decimals'] = precision
     if text.startswith('{'):
         geom = json.loads(text)
     elif text.startswith(('G', 'L', 'M', 'P')):
+        if output_format == 'wkb':
+            return b2a_hex(transcode.wkt_to_wkb(text))
         geom = wkt.loads(text)
+    elif output_format == 'wkt':
+        return transcode.wkb_to_wkt(a2b_hex(text), **kwds)
     else:
         geom = wkb.loads(a2b_hex(text))
     if output_format == 'wkb':
         output = b2a_hex(wkb.dumps(geom))
     elif output_format == 'wkt':
-        kwds = {}
-        if precision >= 0:
-            kwds['decimals'] = precision
         output = wkt.dumps(geom, **kwds)
     else:
         if precision >= 0:
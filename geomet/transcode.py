@@ -0,0 +1,575 @@
+#  Copyright 2013 Lars Butler & individual contributors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Direct conversions between the WKB and WKT formats, which don't go through
+GeoJSON `dict` objects.
+"""
+from geomet import wkb as _wkb
+from geomet import wkt as _wkt
+
+
+def wkb_to_wkt(string, decimals=16):
+    """
+    Convert a WKB geometry to WKT.
+
+    The result is the same as ``wkt.dumps(wkb.loads(string), decimals)``,
+    including the SRID of EWKB, which is written as EWKT. The WKB is walked
+    once and the coordinate values are formatted as they are read, without
+    building the nested coordinate lists of a GeoJSON `dict` in between.
+
+    >>> wkb_to_wkt(_wkb.dumps({'type': 'LineString',
+    ...                        'coordinates': [[0.0, 1.0], [2.0, 3.0]],
+    ...                        'meta': {'srid': 4326}}), decimals=2)
+    'SRID=4326;LINESTRING (0.00 1.00, 2.00 3.00)'
+
+    :param string:
+        WKB data. See :func:`geomet.wkb.loads` for the supported input types.
+    :param int decimals:
+        See :func:`geomet.wkt.dumps`.
+
+    :returns:
+        The WKT string.
+    """
+    data = _wkb._as_buffer(string)
+    info = _wkb._peek(data, 0)
+
+    # Like `wkt.dumps`, write geometries without any coordinate values as
+    # EMPTY, without an SRID.
+    if info['type'] == 'GeometryCollection':
+        if info['num_parts'] == 0:
+            return 'GEOMETRYCOLLECTION EMPTY'
+    elif info['num_vertices'] == 0:
+        return '%s EMPTY' % info['type'].upper()
+
+    text, _ = _to_wkt(data, 0, _wkt._coord_formatter(decimals))
+    if info['srid'] is not None:
+        text = 'SRID=%s;%s' % (info['srid'], text)
+    return text
+
+
+def wkt_to_wkb(string, big_endian=True):
+    """
+    Convert a WKT geometry to WKB.
+
+    The result is the same as ``wkb.dumps(wkt.loads(string), big_endian)``,
+    including the SRID of EWKT, which is written as EWKB. The coordinate
+    values of each run of vertices are packed into the WKB as soon as they
+    are parsed, without building a GeoJSON `dict` in between.
+
+    >>> wkt_to_wkb('SRID=4326;POINT (0 1)').hex()
+    '0020000001000010e600000000000000003ff0000000000000'
+
+    :param str string:
+        The WKT.
+    :param bool big_endian:
+        See :func:`geomet.wkb.dumps`.
+
+    :returns:
+        The WKB binary string.
+    """
+    tokens = _wkt._tokenize_wkt(string)
+    srid, geom_type = _wkt._load_header(tokens)
+    buf = bytearray()
+    _to_wkb(tokens, string, geom_type, srid, big_endian, buf)
+    return bytes(buf)
+
+
+def _to_wkt(data, offset, fmt):
+    """
+    Convert the WKB geometry found at ``offset`` in ``data`` to WKT, without
+    an SRID.
+
+    :param data:
+        `memoryview` of the WKB data.
+    :param int offset:
+        Position of the endian byte of the geometry in ``data``.
+    :param fmt:
+        Coordinate formatter (see :func:`geomet.wkt._coord_formatter`).
+
+    :returns:
+        2-tuple of the WKT string and the offset just past the end of the
+        geometry.
+    """
+    big_endian, geom_type, type_bytes, _, offset = _wkb._parse_header(
+        data, offset
+    )
+    transcoder = _wkb_to_wkt_registry.get(geom_type)
+    if transcoder is None:
+        _wkb._unsupported_geom_type(geom_type)
+
+    endian_token = '>' if big_endian else '<'
+    num_dims, is_m = _wkb._get_dims(type_bytes)
+    return transcoder(endian_token, num_dims, is_m, data, offset, fmt)
+
+
+def _format_run(endian_token, num_dims, is_m, data, offset, num_verts, fmt):
+    """
+    Format a run of ``num_verts`` contiguous vertices starting at ``offset``
+    in ``data``, for example ``'0.0 1.0, 2.0 3.0'``.
+
+    XYM vertices are given a Z value of `0.0`, as :func:`geomet.wkb.loads`
+    does.
+
+    :returns:
+        2-tuple of the text and the offset just past the end of the run.
+    :raises ValueError:
+        If the WKB data is truncated.
+    """
+    _wkb._check_size(data, offset, 8 * num_dims * num_verts)
+    run_struct = _wkb._coord_struct(endian_token, num_dims, num_verts)
+    values = map(fmt, run_struct.unpack_from(data, offset))
+    offset += run_struct.size
+
+    if is_m:
+        zero = fmt(0.0)
+        text = ', '.join(' '.join((x, y, zero, m))
+                         for x, y, m in zip(values, values, values))
+    else:
+        text = ', '.join(map(' '.join, zip(*[values] * num_dims)))
+    return text, offset
+
+
+def _format_rings(endian_token, num_dims, is_m, data, offset, fmt,
+                  header_size=0):
+    """
+    Format the rings of a Polygon, or the LineStrings of a MultiLineString,
+    including the enclosing parentheses, like
+    :func:`geomet.wkt._iter_format_rings`.
+
+    :param int offset:
+        Position of the count of rings in ``data``.
+    :param int header_size:
+        Size of the header before the vertex count of each ring: 0 for the
+        rings of a Polygon, or the size of a WKB header (5) for the
+        LineStrings of a MultiLineString.
+
+    :returns:
+        2-tuple of the text and the offset just past the end of the last ring.
+    """
+    num_rings = _count(endian_token, data, offset)
+    offset += 4
+
+    pieces = []
+    for i in range(num_rings):
+        num_verts = _count(endian_token, data, offset + header_size)
+        text, offset = _format_run(endian_token, num_dims, is_m, data,
+                                   offset + header_size + 4, num_verts, fmt)
+        pieces.append(', (' if i else '((')
+        pieces.append(text)
+        pieces.append(')')
+    pieces.append(')')
+    return ''.join(pieces), offset
+
+
+def _count(endian_token, data, offset):
+    return _wkb._unpack_count(endian_token, data, offset)
+
+
+def _point_to_wkt(endian_token, num_dims, is_m, data, offset, fmt):
+    """
+    Convert the coordinates of a WKB Point to WKT.
+
+    :param str endian_token:
+        '>' for big endian data, or '<' for little endian.
+    :param int num_dims:
+        Number of coordinate values per vertex.
+    :param bool is_m:
+        `True` for XYM geometries.
+    :param data:
+        `memoryview` of the WKB data.
+    :param int offset:
+        Position in ``data`` at which the coordinate data starts.
+    :param fmt:
+        Coordinate formatter (see :func:`geomet.wkt._coord_formatter`).
+
+    :returns:
+        2-tuple of the WKT string and the offset just past the end of the
+        Point data.
+    """
+    text, offset = _format_run(endian_token, num_dims, is_m, data, offset, 1,
+                               fmt)
+    return 'POINT (%s)' % text, offset
+
+
+def _linestring_to_wkt(endian_token, num_dims, is_m, data, offset, fmt):
+    num_verts = _count(endian_token, data, offset)
+    if num_verts == 0:
+        return 'LINESTRING EMPTY', offset + 4
+
+    text, offset = _format_run(endian_token, num_dims, is_m, data,
+                               offset + 4, num_verts, fmt)
+    return 'LINESTRING (%s)' % text, offset
+
+
+def _polygon_to_wkt(endian_token, num_dims, is_m, data, offset, fmt):
+    if _count(endian_token, data, offset) == 0:
+        return 'POLYGON EMPTY', offset + 4
+
+    text, offset = _format_rings(endian_token, num_dims, is_m, data, offset,
+                                 fmt)
+    return 'POLYGON ' + text, offset
+
+
+def _multipoint_to_wkt(endian_token, num_dims, is_m, data, offset, fmt):
+    num_points = _count(endian_token, data, offset)
+    offset += 4
+    if num_points == 0:
+        return 'MULTIPOINT EMPTY', offset
+
+    pieces = []
+    for _ in range(num_points):
+        # skip the part header
+        text, offset = _format_run(endian_token, num_dims, is_m, data,
+                                   offset + 5, 1, fmt)
+        pieces.append('(%s)' % text)
+    return 'MULTIPOINT (%s)' % ', '.join(pieces), offset
+
+
+def _multilinestring_to_wkt(endian_token, num_dims, is_m, data, offset,
+                            fmt):
+    if _count(endian_token, data, offset) == 0:
+        return 'MULTILINESTRING EMPTY', offset + 4
+
+    text, offset = _format_rings(endian_token, num_dims, is_m, data, offset,
+                                 fmt, header_size=5)
+    return 'MULTILINESTRING ' + text, offset
+
+
+def _multipolygon_to_wkt(endian_token, num_dims, is_m, data, offset, fmt):
+    num_polys = _count(endian_token, data, offset)
+    offset += 4
+    if num_polys == 0:
+        return 'MULTIPOLYGON EMPTY', offset
+
+    pieces = []
+    for _ in range(num_polys):
+        # skip the part header
+        text, offset = _format_rings(endian_token, num_dims, is_m, data,
+                                     offset + 5, fmt)
+        pieces.append(text)
+    return 'MULTIPOLYGON (%s)' % ', '.join(pieces), offset
+
+
+def _geometrycollection_to_wkt(endian_token, num_dims, is_m, data, offset,
+                               fmt):
+    num_geoms = _count(endian_token, data, offset)
+    offset += 4
+    if num_geoms == 0:
+        return 'GEOMETRYCOLLECTION EMPTY', offset
+
+    pieces = []
+    for _ in range(num_geoms):
+        text, offset = _to_wkt(data, offset, fmt)
+        pieces.append(text)
+    return 'GEOMETRYCOLLECTION (%s)' % ','.join(pieces), offset
+
+
+_wkb_to_wkt_registry = {
+    'Point': _point_to_wkt,
+    'LineString': _linestring_to_wkt,
+    'Polygon': _polygon_to_wkt,
+    'MultiPoint': _multipoint_to_wkt,
+    'MultiLineString': _multilinestring_to_wkt,
+    'MultiPolygon': _multipolygon_to_wkt,
+    'GeometryCollection': _geometrycollection_to_wkt,
+}
+
+
+def _to_wkb(tokens, string, geom_type, srid, big_endian, buf):
+    """
+    Convert the WKT geometry read from ``tokens`` to WKB, and append it to
+    ``buf``.
+
+    The header of the geometry depends on its number of dimensions, which is
+    only known once its first vertex has been read. So room is made for the
+    header first, and it is filled in at the end.
+
+    :param tokens:
+        A :class:`geomet.wkt._WKTScanner` of the WKT, positioned just after
+        the geometry type.
+    :param str string:
+        The WKT, for error messages.
+    :param str geom_type:
+        The upper case WKT geometry type, for example 'POINT'.
+    :param int srid:
+        The SRID of the geometry, or `None`.
+    :param bool big_endian:
+        See :func:`geomet.wkb.dumps`.
+    :param bytearray buf:
+        The WKB written so far.
+
+    :returns:
+        The number of coordinate values per vertex of the geometry.
+    """
+    if tokens.peek() == 'EMPTY':
+        raise ValueError(_wkb._EMPTY_WKB_MSG)
+
+    geom_type = _wkt._type_map_caps_to_mixed[geom_type]
+    start = len(buf)
+    buf += bytes(5 if srid is None else 9)
+    num_dims = _wkt_to_wkb_registry[geom_type](tokens, string, big_endian,
+                                               buf)
+
+    meta = {} if srid is None else {'srid': srid}
+    header, _, _ = _wkb._header_bytefmt_byteorder(geom_type, num_dims,
+                                                  big_endian, meta)
+    buf[start:start + len(header)] = header
+    return num_dims
+
+
+def _assert_open_paren(tokens, string):
+    """
+    Consume the opening parenthesis of a geometry or a part of one.
+    """
+    token = next(tokens)
+    if token == 'EMPTY':
+        raise ValueError(_wkb._EMPTY_WKB_MSG)
+    elif not token == '(':
+        raise ValueError(_wkt.INVALID_WKT_FMT % string)
+
+
+def _pack_run(tokens, endian_token, buf, num_dims=None):
+    """
+    Consume a run of vertices from ``tokens``, and append the vertex count
+    and the coordinate values to ``buf``.
+
+    :param int num_dims:
+        The number of coordinate values per vertex of the rest of the
+        geometry, if any of it has been read yet.
+
+    :returns:
+        The number of coordinate values per vertex of the run.
+    """
+    run_dims, values = tokens.next_values()
+    if run_dims == 0:
+        raise ValueError(_wkb._EMPTY_WKB_MSG)
+    if num_dims is not None and run_dims != num_dims:
+        raise ValueError(_wkt._MIXED_DIMS_MSG)
+
+    num_verts = len(values) // run_dims
+    buf += _wkb._COUNT_STRUCTS[endian_token].pack(num_verts)
+    buf += _wkb._coord_struct(endian_token, run_dims, num_verts).pack(*values)
+    return run_dims
+
+
+def _pack_point(values, big_endian, buf, num_dims=None):
+    """
+    Append a Point of a MultiPoint, with its header, to ``buf``.
+
+    Parameters and return value are similar to :func:`_pack_run`.
+    """
+    if not values:
+        raise ValueError(_wkb._EMPTY_WKB_MSG)
+    if num_dims is not None and len(values) != num_dims:
+        raise ValueError(_wkt._MIXED_DIMS_MSG)
+
+    endian_token = '>' if big_endian else '<'
+    buf += _wkb._part_header('Point', len(values), False, big_endian)
+    buf += _wkb._coord_struct(endian_token, len(values)).pack(*values)
+    return len(values)
+
+
+def _pack_part(part_type, tokens, string, big_endian, buf, num_dims=None):
+    """
+    Convert a part of a multi-geometry (a LineString or a Polygon) to WKB,
+    with its header, and append it to ``buf``.
+
+    Parameters and return value are similar to :func:`_pack_run`.
+    """
+    if tokens.peek() == 'EMPTY' and num_dims is not None:
+        # Like `wkb.dumps`, allow empty parts, once the dimensions of the
+        # geometry are known from the parts before them.
+        next(tokens)
+        buf += _wkb._part_header(part_type, num_dims, False, big_endian)
+        buf += bytes(4)
+        return num_dims
+
+    start = len(buf)
+    buf += bytes(5)
+    part_dims = _wkt_to_wkb_registry[part_type](tokens, string, big_endian,
+                                                buf)
+    if num_dims is not None and part_dims != num_dims:
+        raise ValueError(_wkt._MIXED_DIMS_MSG)
+
+    buf[start:start + 5] = _wkb._part_header(part_type, part_dims, False,
+                                             big_endian)
+    return part_dims
+
+
+def _point_to_wkb(tokens, string, big_endian, buf):
+    """
+    Pack the coordinates of a WKT POINT into ``buf``.
+
+    Parameters and return value are the same as for :func:`_to_wkb`, minus
+    the geometry type and the SRID.
+    """
+    _assert_open_paren(tokens, string)
+
+    coords = []
+    for t in tokens:
+        if t == ')':
+            break
+        coords.append(float(t))
+    if not coords:
+        raise ValueError(_wkb._EMPTY_WKB_MSG)
+
+    endian_token = '>' if big_endian else '<'
+    buf += _wkb._coord_struct(endian_token, len(coords)).pack(*coords)
+    return len(coords)
+
+
+def _linestring_to_wkb(tokens, string, big_endian, buf):
+    _assert_open_paren(tokens, string)
+    return _pack_run(tokens, '>' if big_endian else '<', buf)
+
+
+def _polygon_to_wkb(tokens, string, big_endian, buf):
+    _assert_open_paren(tokens, string)
+    _assert_open_paren(tokens, string)
+
+    endian_token = '>' if big_endian else '<'
+    count_offset = len(buf)
+    buf += bytes(4)
+
+    # Like `wkt.loads`, allow each ring to be wrapped in an extra pair of
+    # parentheses.
+    if tokens.peek() == '(':
+        num_rings, num_dims = 0, None
+    else:
+        num_rings, num_dims = 1, _pack_run(tokens, endian_token, buf)
+
+    for t in tokens:
+        if t == ')':
+            break
+        elif t == '(':
+            num_dims = _pack_run(tokens, endian_token, buf, num_dims)
+            num_rings += 1
+        elif not t == ',':
+            raise ValueError(_wkt.INVALID_WKT_FMT % string)
+
+    _wkb._COUNT_STRUCTS[endian_token].pack_into(buf, count_offset, num_rings)
+    return num_dims
+
+
+def _multipoint_to_wkb(tokens, string, big_endian, buf):
+    _assert_open_paren(tokens, string)
+
+    count_offset = len(buf)
+    buf += bytes(4)
+    num_points, num_dims = 0, None
+
+    # The points may or may not be wrapped in parentheses.
+    pt = []
+    paren_depth = 1
+    for t in tokens:
+        if t == '(':
+            paren_depth += 1
+        elif t == ')':
+            paren_depth -= 1
+            if paren_depth == 0:
+                break
+        elif t == ',':
+            num_dims = _pack_point(pt, big_endian, buf, num_dims)
+            num_points += 1
+            pt = []
+        else:
+            pt.append(float(t))
+
+    if pt:
+        num_dims = _pack_point(pt, big_endian, buf, num_dims)
+        num_points += 1
+    if not num_points:
+        raise ValueError(_wkb._EMPTY_WKB_MSG)
+
+    endian_token = '>' if big_endian else '<'
+    _wkb._COUNT_STRUCTS[endian_token].pack_into(buf, count_offset,
+                                                num_points)
+    return num_dims
+
+
+def _multilinestring_to_wkb(tokens, string, big_endian, buf):
+    return _multi_to_wkb('LineString', tokens, string, big_endian, buf)
+
+
+def _multipolygon_to_wkb(tokens, string, big_endian, buf):
+    return _multi_to_wkb('Polygon', tokens, string, big_endian, buf)
+
+
+def _multi_to_wkb(part_type, tokens, string, big_endian, buf):
+    """
+    Pack the parts of a WKT MULTILINESTRING or MULTIPOLYGON into ``buf``.
+    """
+    _assert_open_paren(tokens, string)
+
+    count_offset = len(buf)
+    buf += bytes(4)
+    num_parts, num_dims = 0, None
+
+    while True:
+        try:
+            num_dims = _pack_part(part_type, tokens, string, big_endian, buf,
+                                  num_dims)
+            num_parts += 1
+            if next(tokens) == ')':
+                break
+        except StopIteration:
+            raise ValueError(_wkt.INVALID_WKT_FMT % string)
+
+    endian_token = '>' if big_endian else '<'
+    _wkb._COUNT_STRUCTS[endian_token].pack_into(buf, count_offset, num_parts)
+    return num_dims
+
+
+def _geometrycollection_to_wkb(tokens, string, big_endian, buf):
+    _assert_open_paren(tokens, string)
+
+    count_offset = len(buf)
+    buf += bytes(4)
+    num_geoms, num_dims = 0, None
+
+    while True:
+        try:
+            t = next(tokens)
+            if t == ')':
+                break
+            elif t == ',':
+                continue
+            if t not in _wkt._loads_registry:
+                _wkt._unsupported_geom_type(t)
+            member_dims = _to_wkb(tokens, string, t, None, big_endian, buf)
+            # Like `wkb.dumps`, give the collection the dimensions of its
+            # first member.
+            if num_dims is None:
+                num_dims = member_dims
+            num_geoms += 1
+        except StopIteration:
+            raise ValueError(_wkt.INVALID_WKT_FMT % string)
+
+    if not num_geoms:
+        raise ValueError(_wkb._EMPTY_WKB_MSG)
+
+    endian_token = '>' if big_endian else '<'
+    _wkb._COUNT_STRUCTS[endian_token].pack_into(buf, count_offset, num_geoms)
+    return num_dims
+
+
+_wkt_to_wkb_registry = {
+    'Point': _point_to_wkb,
+    'LineString': _linestring_to_wkb,
+    'Polygon': _polygon_to_wkb,
+    'MultiPoint': _multipoint_to_wkb,
+    'MultiLineString': _multilinestring_to_wkb,
+    'MultiPolygon': _multipolygon_to_wkb,
+    'GeometryCollection': _geometrycollection_to_wkb,
+}
@@ -121,6 +121,36 @@ def flatten_multi_dim(sequence):
             yield x
 
 
+def is_empty(sequence):
+    """Check if a multi-dimensional array-like contains no values at all.
+
+    This is equivalent to ``len(list(flatten_multi_dim(sequence))) == 0``,
+    but stops as soon as the first value is found.
+
+    >>> is_empty([[], [[]]])
+    True
+    >>> is_empty([[], [[0.0, 1.0]]])
+    False
+    """
+    for _ in flatten_multi_dim(sequence):
+        return False
+    return True
+
+
+def import_numpy():
+    """Import and return NumPy, which is an optional dependency of geomet.
+
+    :raises ImportError:
+        With a helpful message, if NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for NumPy coordinate arrays; "
+                          "install it with `pip install numpy`")
+    return numpy
+
+
 def endian_token(is_little_endian):
     if is_little_endian:
         return '<'
@@ -12,12 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import binascii
+import functools
 import struct
 
-from geomet.util import block_splitter
-from geomet.util import take
 from geomet.util import as_bin_str
-from geomet.util import flatten_multi_dim
+from geomet.util import import_numpy
+from geomet.util import is_empty
 from itertools import chain
 
 #: '\x00': The first byte of any WKB string. Indicates big endian byte
@@ -105,6 +105,55 @@ _BINARY_TO_GEOM_TYPE = dict(
 
 _INT_TO_DIM_LABEL = {2: '2D', 3: 'Z', 4: 'ZM'}
 
+#: Mapping of GeoJSON geometry types to the nesting depth of the vertices in
+#: their `coordinates`.
+_COORDS_DEPTH = {
+    'Point': 0,
+    'LineString': 1,
+    'MultiPoint': 1,
+    'Polygon': 2,
+    'MultiLineString': 2,
+    'MultiPolygon': 3,
+}
+
+#: Mapping of dimension types to the number of coordinate values per vertex,
+#: and whether or not the vertices carry an M ("Measure") component without a
+#: Z component.
+_DIM_LABEL_TO_DIMS = {
+    '2D': (2, False),
+    'Z': (3, False),
+    'M': (3, True),
+    'ZM': (4, False),
+}
+
+#: Compiled structs for the 4-byte integer counts (of vertices, rings, parts,
+#: etc.) found in WKB, keyed by byte order token.
+_COUNT_STRUCTS = {'>': struct.Struct('>l'), '<': struct.Struct('<l')}
+
+#: Error message for geometries without any coordinate values, which have no
+#: WKB representation.
+_EMPTY_WKB_MSG = (
+    'Empty geometries cannot be represented in WKB. Reason: The '
+    'dimensionality of the WKB would be ambiguous.'
+)
+
+#: Number of bytes read at a time by :func:`iter_load` from files.
+_STREAM_CHUNK_SIZE = 65536
+
+
+class _TruncatedWKBError(ValueError):
+    """The WKB data ends before the end of the geometry."""
+
+
+#: Mapping from binary geometry type (as a 4-byte binary string) to the
+#: dimensions, as described in `_DIM_LABEL_TO_DIMS`.
+#: NOTE: Byte ordering is big endian.
+_BINARY_TO_DIMS = {
+    type_bytes: _DIM_LABEL_TO_DIMS[dim]
+    for dim, wkb_map in _WKB.items()
+    for type_bytes in wkb_map.values()
+}
+
 
 def _get_geom_type(type_bytes):
     """Get the GeoJSON geometry type label from a WKB type byte string.
@@ -144,6 +193,163 @@ def _get_geom_type(type_bytes):
     return geom_type, type_bytes, has_srid
 
 
+def _get_dims(type_bytes):
+    """Get the number of coordinate values per vertex from a WKB type byte
+    string.
+
+    :param type_bytes:
+        4 byte string in big endian byte order containing a WKB type number,
+        without the SRID flag.
+    :returns:
+        2-tuple of the number of coordinate values per vertex and a flag
+        indicating whether the geometry is an XYM geometry.
+
+        >>> _get_dims(b'\\x00\\x00\\x07\\xd2')
+        (3, True)
+    """
+    return _BINARY_TO_DIMS[type_bytes]
+
+
+@functools.lru_cache(maxsize=1024)
+def _coord_struct(endian_token, num_dims, count=1):
+    """Get a compiled `struct.Struct` for a run of ``count`` vertices, each
+    with ``num_dims`` coordinate values, in the byte order indicated by
+    ``endian_token`` ('>' or '<').
+
+    Structs are cached, so each format is only compiled once.
+
+        >>> _coord_struct('<', 3, 2).format
+        '<6d'
+    """
+    return struct.Struct('%s%dd' % (endian_token, num_dims * count))
+
+
+def _part_header(geom_type, num_dims, is_m, big_endian):
+    """Get the 5 byte header (endian byte + type) expected on each part of a
+    multi-geometry.
+    """
+    dim = 'M' if is_m else _INT_TO_DIM_LABEL[num_dims]
+    type_bytes = _WKB[dim][geom_type]
+    if big_endian:
+        return BIG_ENDIAN + type_bytes
+    else:
+        return LITTLE_ENDIAN + type_bytes[::-1]
+
+
+def _as_buffer(data):
+    """Get a flat byte `memoryview` over ``data``.
+
+    Objects supporting the buffer protocol (`bytes`, `bytearray`,
+    `memoryview`, `mmap`, etc.) are wrapped without copying. Anything else is
+    assumed to be an iterable of byte values, and is copied into a `bytes`
+    object first.
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        view = memoryview(bytes(data))
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+
+def _check_size(data, offset, size):
+    """Check that ``data`` holds at least ``size`` bytes from ``offset`` on,
+    before they are unpacked.
+
+    :raises ValueError:
+        If the WKB data is truncated.
+    """
+    if offset + size > len(data):
+        raise _TruncatedWKBError(
+            'Truncated WKB: expected %s bytes at offset %s, but found %s'
+            % (size, offset, max(len(data) - offset, 0))
+        )
+
+
+def _unpack_count(endian_token, data, offset):
+    """Unpack the 4-byte count (of vertices, rings, parts, etc.) found at
+    ``offset`` in ``data``.
+
+    :raises ValueError:
+        If the WKB data is truncated, or the count is negative.
+    """
+    _check_size(data, offset, 4)
+    [count] = _COUNT_STRUCTS[endian_token].unpack_from(data, offset)
+    if count < 0:
+        raise ValueError('Invalid WKB: negative count %s at offset %s'
+                         % (count, offset))
+    return count
+
+
+def _parse_header(data, offset):
+    """Parse the header (endian byte, geometry type and optional SRID) of the
+    WKB geometry found at ``offset`` in ``data``.
+
+    :param data:
+        `memoryview` of the WKB data.
+    :param int offset:
+        Position of the endian byte of the geometry in ``data``.
+    :returns:
+        5-tuple of the "big endian" flag, the GeoJSON geometry type label, the
+        4 byte type string (see :func:`_get_geom_type`), the SRID (or `None`,
+        if there is none), and the offset just past the end of the header.
+    """
+    _check_size(data, offset, 5)
+    endianness = bytes(data[offset:offset + 1])
+    if endianness == BIG_ENDIAN:
+        big_endian = True
+    elif endianness == LITTLE_ENDIAN:
+        big_endian = False
+    else:
+        raise ValueError("Invalid endian byte: '0x%s'. Expected 0x00 or 0x01"
+                         % binascii.hexlify(endianness).decode())
+
+    type_bytes = bytes(data[offset + 1:offset + 5])
+    if not big_endian:
+        # To identify the type, order the type bytes in big endian:
+        type_bytes = type_bytes[::-1]
+    offset += 5
+
+    geom_type, type_bytes, has_srid = _get_geom_type(type_bytes)
+    srid = None
+    if has_srid:
+        _check_size(data, offset, 4)
+        [srid] = struct.unpack_from('>i' if big_endian else '<i',
+                                    data, offset)
+        offset += 4
+
+    return big_endian, geom_type, type_bytes, srid, offset
+
+
+def _replace_srid(data, srid):
+    """Copy the WKB geometry in ``data``, with its SRID replaced by ``srid``.
+
+    Only the header of the geometry is rewritten: everything after it is
+    copied as it is, without being decoded.
+
+    :param data:
+        `memoryview` of the WKB data.
+    :param int srid:
+        The new SRID, or `None` to remove the SRID and give plain WKB.
+    :returns:
+        The new WKB binary string.
+    """
+    big_endian, geom_type, type_bytes, _, offset = _parse_header(data, 0)
+    if geom_type is None:
+        _unsupported_geom_type(geom_type)
+
+    if srid is not None:
+        type_bytes = SRID_FLAG + type_bytes[1:]
+    if big_endian:
+        header = BIG_ENDIAN + type_bytes
+    else:
+        header = LITTLE_ENDIAN + type_bytes[::-1]
+    if srid is not None:
+        header += struct.pack('>i' if big_endian else '<i', int(srid))
+    return header + bytes(data[offset:])
+
+
 def dump(obj, dest_file):
     """
     Dump GeoJSON-like `dict` to WKB and write it to the `dest_file`.
@@ -216,42 +422,191 @@ def dumps(obj, big_endian=True):
     return _dumps(obj, big_endian)
 
 
+def dumps_into(obj, buffer, offset=0, big_endian=True):
+    """
+    Dump a GeoJSON-like `dict` as WKB directly into a writable ``buffer``,
+    such as a `bytearray`, a writable `memoryview` or an `mmap`.
+
+    The exact size of the WKB is computed before anything is written. This
+    allows many geometries to be packed back to back into one preallocated
+    buffer, without creating a temporary `bytes` object for each of them:
+
+        >>> buf = bytearray(42)
+        >>> end = dumps_into({'type': 'Point', 'coordinates': [0.0, 1.0]}, buf)
+        >>> dumps_into({'type': 'Point', 'coordinates': [2.0, 3.0]}, buf, end)
+        42
+
+    See :func:`dumps` for details on how the WKB is generated.
+
+    :param dict obj:
+        GeoJson-like `dict` object.
+    :param buffer:
+        Writable object supporting the buffer protocol.
+    :param int offset:
+        Position in ``buffer`` at which to start writing. Defaults to 0.
+    :param bool big_endian:
+        Defaults to `True`. If `True`, data values in the generated WKB will
+        be represented using big endian byte order. Else, little endian.
+
+    :returns:
+        The offset in ``buffer`` just past the end of the written WKB.
+
+    :raises ValueError:
+        If ``buffer`` is too small to hold the WKB at the given ``offset``,
+        in which case nothing is written. Invalid coordinates, such as
+        vertices of mixed dimensions, are only found while the WKB is being
+        written, so on such errors the bytes of ``buffer`` from ``offset``
+        on may be partly overwritten.
+    """
+    return _dumps_into(obj, buffer, offset, big_endian)
+
+
+def _dumps_into(obj, buffer, offset=0, big_endian=True, include_meta=True):
+    """
+    Basically perform the action of dumps_into, but with the same extra
+    flags as :func:`_dumps`.
+    """
+    if include_meta:
+        meta = obj.get('meta', {})
+    else:
+        meta = {}
+
+    buf = memoryview(buffer)
+    if buf.readonly:
+        raise TypeError('Cannot dump WKB into a read-only buffer')
+    buf = buf.cast('B')
+
+    size = _encoded_size(obj, meta)
+    if offset < 0 or offset + size > len(buf):
+        raise ValueError(
+            'Buffer of %s bytes is too small to hold %s bytes of WKB at '
+            'offset %s' % (len(buf), size, offset)
+        )
+
+    return _dump(obj, big_endian, meta, buf, offset)
+
+
 def _dumps(obj, big_endian=True, include_meta=True):
     """
     Basically perform the action of dumps, but with some extra flags for
     behavior specifically needed by the geopackage...package.
     """
-    geom_type = obj['type']
     if include_meta:
         meta = obj.get('meta', {})
     else:
         meta = {}
 
-    exporter = _dumps_registry.get(geom_type)
-    if exporter is None:
+    # The exact size of the WKB is computed up front, so that all of the
+    # geometry (including the members of collections) can be packed into one
+    # preallocated buffer.
+    buf = bytearray(_encoded_size(obj, meta))
+    _dump(obj, big_endian, meta, buf, 0)
+    return bytes(buf)
+
+
+def _dump(obj, big_endian, meta, buf, offset):
+    """
+    Dump a GeoJSON-like `dict` as WKB into the writable buffer ``buf``,
+    starting at ``offset``.
+
+    :returns:
+        The offset just past the end of the written WKB.
+    """
+    exporter = _dumps_registry[obj['type']]
+    return exporter(obj, big_endian, meta, buf, offset)
+
+
+def _encoded_size(obj, meta):
+    """
+    Compute the exact number of bytes needed to represent a GeoJSON-like
+    `dict` as WKB, without encoding it.
+
+    :param dict obj:
+        GeoJson-like `dict` object.
+    :param dict meta:
+        Metadata associated with the GeoJSON object. See
+        :func:`_dump_point`.
+
+    :returns:
+        The size of the WKB, in bytes.
+    """
+    geom_type = obj['type']
+
+    if geom_type not in _dumps_registry:
         _unsupported_geom_type(geom_type)
 
     # Check for empty geometries. GeometryCollections have a slightly different
     # JSON/dict structure, but that's handled.
     coords_or_geoms = obj.get('coordinates', obj.get('geometries'))
-    if len(list(flatten_multi_dim(coords_or_geoms))) == 0:
-        raise ValueError(
-            'Empty geometries cannot be represented in WKB. Reason: The '
-            'dimensionality of the WKB would be ambiguous.'
-        )
+    if is_empty(coords_or_geoms):
+        raise ValueError(_EMPTY_WKB_MSG)
+
+    # endian byte + type, and the SRID if there is one
+    size = 5 if meta.get('srid') is None else 9
+
+    if geom_type == 'GeometryCollection':
+        return size + 4 + sum(_encoded_size(geom, geom.get('meta', {}))
+                              for geom in coords_or_geoms)
+
+    vert_size = 8 * _infer_num_dims(obj)
+    if geom_type == 'Point':
+        return size + vert_size
+    elif geom_type == 'LineString':
+        return size + 4 + vert_size * len(coords_or_geoms)
+    elif geom_type == 'Polygon':
+        return size + 4 + sum(4 + vert_size * len(ring)
+                              for ring in coords_or_geoms)
+    elif geom_type == 'MultiPoint':
+        return size + 4 + (5 + vert_size) * len(coords_or_geoms)
+    elif geom_type == 'MultiLineString':
+        return size + 4 + sum(9 + vert_size * len(linestring)
+                              for linestring in coords_or_geoms)
+    else:
+        return size + 4 + sum(9 + sum(4 + vert_size * len(ring)
+                                      for ring in polygon)
+                              for polygon in coords_or_geoms)
 
-    return exporter(obj, big_endian, meta)
 
+def _infer_num_dims(obj):
+    """
+    Infer the number of coordinate values per vertex of a GeoJSON-like `dict`
+    from its first vertex. For GeometryCollections, the first member geometry
+    is sampled.
 
-def loads(string):
+    If the vertices are given as a 2-dimensional NumPy array, the number of
+    dimensions is taken from its shape.
+    """
+    if obj['type'] == 'GeometryCollection':
+        return _infer_num_dims(obj['geometries'][0])
+
+    vertex = obj['coordinates']
+    for _ in range(_COORDS_DEPTH[obj['type']]):
+        if getattr(vertex, 'ndim', 0) == 2:
+            return vertex.shape[1]
+        vertex = vertex[0]
+    return len(vertex)
+
+
+def loads(string, as_numpy=False):
     """
     Construct a GeoJSON `dict` from WKB (`string`).
 
+    `string` can be any object supporting the buffer protocol, such as
+    `bytes`, `bytearray`, `memoryview` or `mmap`. The data is decoded in
+    place, without being copied. Any bytes following the end of the geometry
+    are ignored.
+
     The resulting GeoJSON `dict` will include the SRID as an integer in the
     `meta` object. This was an arbitrary decision made by `geomet, the
     discussion of which took place here:
     https://github.com/geomet/geomet/issues/28.
 
+    If ``as_numpy`` is `True`, the coordinates of each Point, and each run of
+    vertices (a LineString, a ring of a Polygon, or the points of a
+    MultiPoint), are given as a NumPy float64 array of shape ``(dims,)`` or
+    ``(n, dims)`` instead of nested `list` objects. This requires NumPy to
+    be installed.
+
     In order to be consistent with other libraries [1] and (deprecated)
     specifications [2], also include the same information in a `crs`
     object. This isn't ideal, but the `crs` member is no longer part of
@@ -283,41 +638,404 @@ def loads(string):
     [3] - https://tools.ietf.org/html/rfc7946#appendix-B.1
     [4] - https://tools.ietf.org/html/rfc7946#section-4
     """  # noqa
-    string = iter(string)
-    # endianness = string[0:1]
-    endianness = as_bin_str(take(1, string))
-    if endianness == BIG_ENDIAN:
-        big_endian = True
-    elif endianness == LITTLE_ENDIAN:
-        big_endian = False
+    result, _ = _loads(_as_buffer(string), 0, as_numpy)
+    return result
+
+
+def iter_load(source, as_numpy=False):
+    """
+    Load each of the WKB geometries stored back to back in ``source``, one at
+    a time.
+
+    WKB is self-delimiting, so no length prefix or separator is needed
+    between the geometries. Each geometry is generated together with its
+    byte offset in ``source``:
+
+        >>> data = (dumps({'type': 'Point', 'coordinates': [0.0, 1.0]}) +
+        ...         dumps({'type': 'Point', 'coordinates': [2.0, 3.0]}))
+        >>> for offset, geom in iter_load(data):
+        ...     print(offset, geom)
+        0 {'type': 'Point', 'coordinates': [0.0, 1.0]}
+        21 {'type': 'Point', 'coordinates': [2.0, 3.0]}
+
+    :param source:
+        Either WKB data supporting the buffer protocol (see :func:`loads`),
+        which is decoded in place, or an open and readable binary file-like
+        object, which is read in chunks.
+    :param bool as_numpy:
+        See :func:`loads`.
+
+    :returns:
+        A generator of 2-tuples of the byte offset of each geometry and the
+        GeoJSON `dict` decoded from it.
+    """
+    try:
+        data = _as_buffer(memoryview(source))
+    except TypeError:
+        if hasattr(source, 'read'):
+            return _iter_load(source, _as_buffer(b''), as_numpy)
+        data = _as_buffer(source)
+    return _iter_load(None, data, as_numpy)
+
+
+def _iter_load(stream, data, as_numpy, chunk_size=_STREAM_CHUNK_SIZE):
+    """
+    Generate the geometries of :func:`iter_load` found in ``data``, followed
+    by those in ``stream``, if it is not `None`.
+
+    Before each geometry is decoded, :func:`_peek` works out its size, so
+    that enough of the ``stream`` can be read to hold all of it. The bytes
+    of the geometries already decoded are dropped whenever more is read.
+    """
+    start = 0  # offset of ``data`` in the source
+    pos = 0
+    while True:
+        available = len(data) - pos
+        try:
+            size = _peek(data, pos)['size'] if available else 0
+        except _TruncatedWKBError:
+            # The headers and counts may continue past the end of what has
+            # been read so far. Any other error is in the data itself, and
+            # reading more cannot fix it.
+            more = _read_more(stream, data, pos, max(chunk_size, available))
+            if more is None:
+                raise ValueError('Truncated WKB at offset %s'
+                                 % (start + pos))
+            start, data, pos = start + pos, more, 0
+            continue
+
+        if available and size <= available:
+            geom, _ = _loads(data, pos, as_numpy)
+            yield start + pos, geom
+            pos += size
+            continue
+
+        more = _read_more(stream, data, pos, max(chunk_size, size - available))
+        if more is None:
+            if available:
+                raise ValueError(
+                    'Truncated WKB at offset %s: expected %s bytes, but '
+                    'found %s' % (start + pos, size, available)
+                )
+            return
+        start, data, pos = start + pos, more, 0
+
+
+def _read_more(stream, data, pos, size):
+    """
+    Read up to ``size`` more bytes from ``stream``, and append them to the
+    bytes of ``data`` from ``pos`` on.
+
+    :returns:
+        A `memoryview` of the combined bytes, or `None` if there is nothing
+        more to read.
+    """
+    chunk = stream.read(size) if stream is not None else None
+    if not chunk:
+        return None
+    return _as_buffer(bytes(data[pos:]) + chunk)
+
+
+def peek(string):
+    """
+    Read the structure of a WKB geometry, without decoding any coordinates.
+
+    Only the headers and the count fields of the WKB are read; the coordinate
+    values are skipped over. This makes it cheap to route, filter or
+    size-budget geometries before deciding whether to decode them with
+    :func:`loads`.
+
+        >>> peek(dumps({'type': 'LineString',
+        ...             'coordinates': [[0.0, 0.0, 1.0], [1.0, 1.0, 2.0]],
+        ...             'meta': {'srid': 4326}})) == {
+        ...     'type': 'LineString', 'dims': 'Z', 'big_endian': True,
+        ...     'srid': 4326, 'num_parts': 1, 'num_rings': 0,
+        ...     'num_vertices': 2, 'size': 61}
+        True
+
+    :param string:
+        WKB data. See :func:`loads` for the supported input types.
+
+    :returns:
+        A `dict` with the following keys:
+
+        - type: GeoJSON geometry type label.
+        - dims: Dimension type of the geometry: '2D', 'Z', 'M' or 'ZM'.
+        - big_endian: `True` if the geometry is encoded in big endian byte
+          order, `False` for little endian.
+        - srid: SRID of the geometry as an integer, or `None` if the WKB has
+          none.
+        - num_parts: Number of member geometries for multi-geometries and
+          GeometryCollections; 1 for other geometry types.
+        - num_rings: Total number of polygon rings.
+        - num_vertices: Total number of vertices.
+        - size: Size of the geometry, in bytes.
+    """
+    data = _as_buffer(string)
+    info = _peek(data, 0)
+    if info['size'] > len(data):
+        raise ValueError(
+            'Truncated WKB: expected %s bytes, but found %s'
+            % (info['size'], len(data))
+        )
+    return info
+
+
+def _peek(data, offset):
+    """
+    Walk the WKB geometry found at ``offset`` in ``data``, reading only its
+    headers and counts. See :func:`peek`.
+
+    The size of the geometry is computed from the counts only; no check is
+    made that ``data`` actually contains all of the coordinate values. The
+    headers and counts themselves are checked, and raise `ValueError` if
+    they are truncated or invalid.
+    """
+    start = offset
+    big_endian, geom_type, type_bytes, srid, offset = _parse_header(
+        data, offset
+    )
+    if geom_type is None:
+        _unsupported_geom_type(geom_type)
+
+    endian_token = '>' if big_endian else '<'
+    num_dims, is_m = _get_dims(type_bytes)
+    vert_size = 8 * num_dims
+
+    num_parts = 1
+    num_rings = 0
+    num_vertices = 0
+
+    if geom_type == 'Point':
+        num_vertices = 1
+        offset += vert_size
+    elif geom_type == 'LineString':
+        num_vertices = _unpack_count(endian_token, data, offset)
+        offset += 4 + vert_size * num_vertices
+    elif geom_type == 'MultiPoint':
+        num_parts = _unpack_count(endian_token, data, offset)
+        num_vertices = num_parts
+        offset += 4 + (5 + vert_size) * num_parts
+    elif geom_type == 'GeometryCollection':
+        num_parts = _unpack_count(endian_token, data, offset)
+        offset += 4
+        for _ in range(num_parts):
+            member = _peek(data, offset)
+            num_rings += member['num_rings']
+            num_vertices += member['num_vertices']
+            offset += member['size']
+    elif geom_type == 'Polygon':
+        num_rings, num_vertices, offset = _peek_rings(
+            endian_token, vert_size, data, offset
+        )
+    elif geom_type == 'MultiLineString':
+        num_parts = _unpack_count(endian_token, data, offset)
+        offset += 4
+        for _ in range(num_parts):
+            # skip the part header
+            num_verts = _unpack_count(endian_token, data, offset + 5)
+            num_vertices += num_verts
+            offset += 9 + vert_size * num_verts
     else:
-        raise ValueError("Invalid endian byte: '0x%s'. Expected 0x00 or 0x01"
-                         % binascii.hexlify(endianness.encode()).decode())
+        num_parts = _unpack_count(endian_token, data, offset)
+        offset += 4
+        for _ in range(num_parts):
+            # skip the part header
+            rings, verts, offset = _peek_rings(
+                endian_token, vert_size, data, offset + 5
+            )
+            num_rings += rings
+            num_vertices += verts
+
+    return dict(
+        type=geom_type,
+        dims='M' if is_m else _INT_TO_DIM_LABEL[num_dims],
+        big_endian=big_endian,
+        srid=srid,
+        num_parts=num_parts,
+        num_rings=num_rings,
+        num_vertices=num_vertices,
+        size=offset - start,
+    )
+
+
+def _peek_rings(endian_token, vert_size, data, offset):
+    """
+    Skip over the rings of a polygon, counting them and their vertices.
+
+    :returns:
+        3-tuple of the number of rings, the total number of vertices, and the
+        offset just past the end of the last ring.
+    """
+    num_rings = _unpack_count(endian_token, data, offset)
+    offset += 4
+    num_vertices = 0
+    for _ in range(num_rings):
+        num_verts = _unpack_count(endian_token, data, offset)
+        num_vertices += num_verts
+        offset += 4 + vert_size * num_verts
+    return num_rings, num_vertices, offset
+
+
+def bounds(string):
+    """
+    Compute the bounding box of a WKB geometry by scanning its coordinate
+    values, without building the nested coordinate lists that :func:`loads`
+    would produce.
+
+    The bounding box follows the GeoJSON convention [1]: the minimum values
+    of all axes, followed by the maximum values of all axes. The axes are the
+    same as those of the coordinates produced by :func:`loads`, so XYM
+    geometries have bounds of the form ``(minx, miny, 0.0, minm, maxx, maxy,
+    0.0, maxm)``.
+
+        >>> bounds(dumps({'type': 'LineString',
+        ...               'coordinates': [[0.0, 5.0], [-1.0, 2.5]]}))
+        (-1.0, 2.5, 0.0, 5.0)
+
+    [1] https://tools.ietf.org/html/rfc7946#section-5
+
+    :param string:
+        WKB data. See :func:`loads` for the supported input types.
+
+    :returns:
+        `tuple` of 4, 6 or 8 floats, or `None` if the geometry has no
+        vertices.
+    """
+    data = _as_buffer(string)
+    extent = None
+    is_m = False
+    for endian_token, num_dims, is_m, offset, num_verts in _iter_vertex_runs(
+            data, 0):
+        run_struct = _coord_struct(endian_token, num_dims, num_verts)
+        extent = _extend_extent(
+            extent, run_struct.unpack_from(data, offset), num_dims
+        )
+
+    if extent is None:
+        return None
+    if is_m:
+        # Match the XYZM coordinates given by `loads` for XYM geometries.
+        extent.insert(2, (0.0, 0.0))
+    mins, maxs = zip(*extent)
+    return mins + maxs
+
+
+def _extend_extent(extent, values, num_dims):
+    """
+    Extend an extent (a `list` of (min, max) tuples, one per dimension, or
+    `None` if nothing has been scanned yet) to cover a flat run of coordinate
+    values.
+    """
+    if not values:
+        return extent
+
+    run_extent = [(min(values[i::num_dims]), max(values[i::num_dims]))
+                  for i in range(num_dims)]
+    if extent is None:
+        return run_extent
+    return [(min(lo, run_lo), max(hi, run_hi))
+            for (lo, hi), (run_lo, run_hi) in zip(extent, run_extent)]
+
+
+def _iter_vertex_runs(data, offset):
+    """
+    Generate the location of each run of contiguous vertices in the WKB
+    geometry found at ``offset`` in ``data``, without decoding them.
+
+    Each run is checked to fit in ``data`` before it is generated, so that
+    its coordinate values can be unpacked without any further check.
+
+    :returns:
+        A generator of 5-tuples of the byte order token, the number of
+        coordinate values per vertex, the "is M" flag (see :func:`_get_dims`),
+        the offset of the first coordinate value of the run, and the number
+        of vertices in the run.
+    :raises ValueError:
+        If the WKB data is truncated, or has a negative count.
+    """
+    big_endian, geom_type, type_bytes, _, offset = _parse_header(data, offset)
+    if geom_type is None:
+        _unsupported_geom_type(geom_type)
 
     endian_token = '>' if big_endian else '<'
-    # type_bytes = string[1:5]
-    type_bytes = as_bin_str(take(4, string))
-    if not big_endian:
-        # To identify the type, order the type bytes in big endian:
-        type_bytes = type_bytes[::-1]
+    num_dims, is_m = _get_dims(type_bytes)
+    vert_size = 8 * num_dims
+    run = (endian_token, num_dims, is_m)
+
+    if geom_type == 'Point':
+        _check_size(data, offset, vert_size)
+        yield run + (offset, 1)
+        return
+
+    count = _unpack_count(endian_token, data, offset)
+    offset += 4
+
+    if geom_type == 'LineString':
+        _check_size(data, offset, vert_size * count)
+        yield run + (offset, count)
+    elif geom_type == 'Polygon':
+        for _ in range(count):
+            num_verts = _unpack_count(endian_token, data, offset)
+            offset += 4
+            _check_size(data, offset, vert_size * num_verts)
+            yield run + (offset, num_verts)
+            offset += vert_size * num_verts
+    elif geom_type == 'MultiPoint':
+        for _ in range(count):
+            # skip the part header
+            _check_size(data, offset, 5 + vert_size)
+            yield run + (offset + 5, 1)
+            offset += 5 + vert_size
+    elif geom_type == 'MultiLineString':
+        for _ in range(count):
+            num_verts = _unpack_count(endian_token, data, offset + 5)
+            offset += 9
+            _check_size(data, offset, vert_size * num_verts)
+            yield run + (offset, num_verts)
+            offset += vert_size * num_verts
+    elif geom_type == 'MultiPolygon':
+        for _ in range(count):
+            num_rings = _unpack_count(endian_token, data, offset + 5)
+            offset += 9
+            for _ in range(num_rings):
+                num_verts = _unpack_count(endian_token, data, offset)
+                offset += 4
+                _check_size(data, offset, vert_size * num_verts)
+                yield run + (offset, num_verts)
+                offset += vert_size * num_verts
+    else:
+        for _ in range(count):
+            yield from _iter_vertex_runs(data, offset)
+            offset += _peek(data, offset)['size']
 
-    geom_type, type_bytes, has_srid = _get_geom_type(type_bytes)
-    srid = None
-    if has_srid:
-        srid_field = as_bin_str(take(4, string))
-        [srid] = struct.unpack('%si' % endian_token, srid_field)
 
-    # data_bytes = string[5:]  # FIXME: This won't work for GeometryCollections
-    data_bytes = string
+def _loads(data, offset, as_numpy=False):
+    """
+    Decode the WKB geometry found at ``offset`` in ``data``.
+
+    :param data:
+        `memoryview` of the WKB data.
+    :param int offset:
+        Position of the endian byte of the geometry in ``data``.
+    :param bool as_numpy:
+        See :func:`loads`.
+
+    :returns:
+        2-tuple of the GeoJSON `dict` and the offset just past the end of the
+        geometry.
+    """
+    big_endian, geom_type, type_bytes, srid, offset = _parse_header(
+        data, offset
+    )
 
     importer = _loads_registry.get(geom_type)
 
     if importer is None:
         _unsupported_geom_type(geom_type)
 
-    data_bytes = iter(data_bytes)
-    result = importer(big_endian, type_bytes, data_bytes)
-    if has_srid:
+    result, offset = importer(big_endian, type_bytes, data, offset, as_numpy)
+    if srid is not None:
         # As mentioned in the docstring above, include both approaches to
         # indicating the SRID.
         result['meta'] = {'srid': int(srid)}
@@ -325,7 +1043,7 @@ def loads(string):
             'type': 'name',
             'properties': {'name': 'EPSG%s' % srid},
         }
-    return result
+    return result, offset
 
 
 def _unsupported_geom_type(geom_type):
@@ -373,9 +1091,9 @@ def _header_bytefmt_byteorder(geom_type, num_dims, big_endian, meta=None):
     return header, byte_fmt, byte_order
 
 
-def _dump_point(obj, big_endian, meta):
+def _dump_point(obj, big_endian, meta, buf, offset):
     """
-    Dump a GeoJSON-like `dict` to a point WKB string.
+    Dump a GeoJSON-like `dict` as a point WKB into ``buf``.
 
     :param dict obj:
         GeoJson-like `dict` object.
@@ -393,203 +1111,256 @@ def _dump_point(obj, big_endian, meta):
           binary.
 
         Any other meta data objects will simply be ignored by this function.
+    :param buf:
+        Writable buffer, large enough to hold the WKB (see
+        :func:`_encoded_size`).
+    :param int offset:
+        Position in ``buf`` at which to start writing.
 
     :returns:
-        A WKB binary string representing of the Point ``obj``.
+        The offset just past the end of the WKB written for the Point
+        ``obj``.
     """
     coords = obj['coordinates']
     num_dims = len(coords)
 
-    wkb_string, byte_fmt, _ = _header_bytefmt_byteorder(
+    header, _, byte_order = _header_bytefmt_byteorder(
         'Point', num_dims, big_endian, meta
     )
+    offset = _dump_bytes(header, buf, offset)
 
-    wkb_string += struct.pack(byte_fmt, *coords)
-    return wkb_string
+    point_struct = _coord_struct(byte_order, num_dims)
+    point_struct.pack_into(buf, offset, *coords)
+    return offset + point_struct.size
 
 
-def _dump_linestring(obj, big_endian, meta):
+def _dump_linestring(obj, big_endian, meta, buf, offset):
     """
-    Dump a GeoJSON-like `dict` to a linestring WKB string.
+    Dump a GeoJSON-like `dict` as a linestring WKB into ``buf``.
 
     Input parameters and output are similar to :func:`_dump_point`.
     """
     coords = obj['coordinates']
-    vertex = coords[0]
-    # Infer the number of dimensions from the first vertex
-    num_dims = len(vertex)
+    num_dims = _infer_num_dims(obj)
 
-    wkb_string, byte_fmt, byte_order = _header_bytefmt_byteorder(
+    header, _, byte_order = _header_bytefmt_byteorder(
         'LineString', num_dims, big_endian, meta
     )
-    # append number of vertices in linestring
-    wkb_string += struct.pack('%sl' % byte_order, len(coords))
-
-    for vertex in coords:
-        wkb_string += struct.pack(byte_fmt, *vertex)
-
-    return wkb_string
+    offset = _dump_bytes(header, buf, offset)
+    return _dump_vertices(byte_order, num_dims, coords, buf, offset)
 
 
-def _dump_polygon(obj, big_endian, meta):
+def _dump_polygon(obj, big_endian, meta, buf, offset):
     """
-    Dump a GeoJSON-like `dict` to a polygon WKB string.
+    Dump a GeoJSON-like `dict` as a polygon WKB into ``buf``.
 
-    Input parameters and output are similar to :funct:`_dump_point`.
+    Input parameters and output are similar to :func:`_dump_point`.
     """
     coords = obj['coordinates']
-    vertex = coords[0][0]
-    # Infer the number of dimensions from the first vertex
-    num_dims = len(vertex)
+    num_dims = _infer_num_dims(obj)
 
-    wkb_string, byte_fmt, byte_order = _header_bytefmt_byteorder(
+    header, _, byte_order = _header_bytefmt_byteorder(
         'Polygon', num_dims, big_endian, meta
     )
+    offset = _dump_bytes(header, buf, offset)
 
     # number of rings:
-    wkb_string += struct.pack('%sl' % byte_order, len(coords))
+    offset = _dump_count(byte_order, len(coords), buf, offset)
     for ring in coords:
-        # number of verts in this ring:
-        wkb_string += struct.pack('%sl' % byte_order, len(ring))
-        for vertex in ring:
-            wkb_string += struct.pack(byte_fmt, *vertex)
+        offset = _dump_vertices(byte_order, num_dims, ring, buf, offset)
 
-    return wkb_string
+    return offset
 
 
-def _dump_multipoint(obj, big_endian, meta):
+def _dump_multipoint(obj, big_endian, meta, buf, offset):
     """
-    Dump a GeoJSON-like `dict` to a multipoint WKB string.
+    Dump a GeoJSON-like `dict` as a multipoint WKB into ``buf``.
 
-    Input parameters and output are similar to :funct:`_dump_point`.
+    Input parameters and output are similar to :func:`_dump_point`.
     """
     coords = obj['coordinates']
-    vertex = coords[0]
-    num_dims = len(vertex)
+    num_dims = _infer_num_dims(obj)
 
-    wkb_string, byte_fmt, byte_order = _header_bytefmt_byteorder(
+    header, _, byte_order = _header_bytefmt_byteorder(
         'MultiPoint', num_dims, big_endian, meta
     )
+    offset = _dump_bytes(header, buf, offset)
 
-    point_type = _WKB[_INT_TO_DIM_LABEL.get(num_dims)]['Point']
-    if big_endian:
-        point_type = BIG_ENDIAN + point_type
-    else:
-        point_type = LITTLE_ENDIAN + point_type[::-1]
+    point_header = _part_header('Point', num_dims, False, big_endian)
+    point_struct = _coord_struct(byte_order, num_dims)
 
-    wkb_string += struct.pack('%sl' % byte_order, len(coords))
+    offset = _dump_count(byte_order, len(coords), buf, offset)
     for vertex in coords:
         # POINT type strings
-        wkb_string += point_type
-        wkb_string += struct.pack(byte_fmt, *vertex)
+        offset = _dump_bytes(point_header, buf, offset)
+        point_struct.pack_into(buf, offset, *vertex)
+        offset += point_struct.size
 
-    return wkb_string
+    return offset
 
 
-def _dump_multilinestring(obj, big_endian, meta):
+def _dump_multilinestring(obj, big_endian, meta, buf, offset):
     """
-    Dump a GeoJSON-like `dict` to a multilinestring WKB string.
+    Dump a GeoJSON-like `dict` as a multilinestring WKB into ``buf``.
 
-    Input parameters and output are similar to :funct:`_dump_point`.
+    Input parameters and output are similar to :func:`_dump_point`.
     """
     coords = obj['coordinates']
-    vertex = coords[0][0]
-    num_dims = len(vertex)
+    num_dims = _infer_num_dims(obj)
 
-    wkb_string, byte_fmt, byte_order = _header_bytefmt_byteorder(
+    header, _, byte_order = _header_bytefmt_byteorder(
         'MultiLineString', num_dims, big_endian, meta
     )
+    offset = _dump_bytes(header, buf, offset)
 
-    ls_type = _WKB[_INT_TO_DIM_LABEL.get(num_dims)]['LineString']
-    if big_endian:
-        ls_type = BIG_ENDIAN + ls_type
-    else:
-        ls_type = LITTLE_ENDIAN + ls_type[::-1]
+    ls_header = _part_header('LineString', num_dims, False, big_endian)
 
     # append the number of linestrings
-    wkb_string += struct.pack('%sl' % byte_order, len(coords))
+    offset = _dump_count(byte_order, len(coords), buf, offset)
 
     for linestring in coords:
-        wkb_string += ls_type
-        # append the number of vertices in each linestring
-        wkb_string += struct.pack('%sl' % byte_order, len(linestring))
-        for vertex in linestring:
-            wkb_string += struct.pack(byte_fmt, *vertex)
+        offset = _dump_bytes(ls_header, buf, offset)
+        offset = _dump_vertices(byte_order, num_dims, linestring, buf, offset)
 
-    return wkb_string
+    return offset
 
 
-def _dump_multipolygon(obj, big_endian, meta):
+def _dump_multipolygon(obj, big_endian, meta, buf, offset):
     """
-    Dump a GeoJSON-like `dict` to a multipolygon WKB string.
+    Dump a GeoJSON-like `dict` as a multipolygon WKB into ``buf``.
 
-    Input parameters and output are similar to :funct:`_dump_point`.
+    Input parameters and output are similar to :func:`_dump_point`.
     """
     coords = obj['coordinates']
-    vertex = coords[0][0][0]
-    num_dims = len(vertex)
+    num_dims = _infer_num_dims(obj)
 
-    wkb_string, byte_fmt, byte_order = _header_bytefmt_byteorder(
+    header, _, byte_order = _header_bytefmt_byteorder(
         'MultiPolygon', num_dims, big_endian, meta
     )
+    offset = _dump_bytes(header, buf, offset)
 
-    poly_type = _WKB[_INT_TO_DIM_LABEL.get(num_dims)]['Polygon']
-    if big_endian:
-        poly_type = BIG_ENDIAN + poly_type
-    else:
-        poly_type = LITTLE_ENDIAN + poly_type[::-1]
+    poly_header = _part_header('Polygon', num_dims, False, big_endian)
 
-    # apped the number of polygons
-    wkb_string += struct.pack('%sl' % byte_order, len(coords))
+    # append the number of polygons
+    offset = _dump_count(byte_order, len(coords), buf, offset)
 
     for polygon in coords:
         # append polygon header
-        wkb_string += poly_type
+        offset = _dump_bytes(poly_header, buf, offset)
         # append the number of rings in this polygon
-        wkb_string += struct.pack('%sl' % byte_order, len(polygon))
+        offset = _dump_count(byte_order, len(polygon), buf, offset)
         for ring in polygon:
-            # append the number of vertices in this ring
-            wkb_string += struct.pack('%sl' % byte_order, len(ring))
-            for vertex in ring:
-                wkb_string += struct.pack(byte_fmt, *vertex)
+            offset = _dump_vertices(byte_order, num_dims, ring, buf, offset)
+
+    return offset
 
-    return wkb_string
 
+def _dump_geometrycollection(obj, big_endian, meta, buf, offset):
+    """
+    Dump a GeoJSON-like `dict` as a geometrycollection WKB into ``buf``.
 
-def _dump_geometrycollection(obj, big_endian, meta):
+    The member geometries are written into the same buffer, each with its own
+    metadata.
+
+    Input parameters and output are similar to :func:`_dump_point`.
+    """
     # TODO: handle empty collections
     geoms = obj['geometries']
     # determine the dimensionality (2d, 3d, 4d) of the collection
     # by sampling the first geometry
-    first_geom = geoms[0]
-    rest = geoms[1:]
-
-    first_wkb = dumps(first_geom, big_endian=big_endian)
-    first_type = first_wkb[1:5]
-    if not big_endian:
-        first_type = first_type[::-1]
+    num_dims = _infer_num_dims(geoms[0])
 
-    if first_type in WKB_2D.values():
-        num_dims = 2
-    elif first_type in WKB_Z.values():
-        num_dims = 3
-    elif first_type in WKB_ZM.values():
-        num_dims = 4
-
-    wkb_string, byte_fmt, byte_order = _header_bytefmt_byteorder(
+    header, _, byte_order = _header_bytefmt_byteorder(
         'GeometryCollection', num_dims, big_endian, meta
     )
+    offset = _dump_bytes(header, buf, offset)
     # append the number of geometries
-    wkb_string += struct.pack('%sl' % byte_order, len(geoms))
+    offset = _dump_count(byte_order, len(geoms), buf, offset)
+
+    for geom in geoms:
+        offset = _dump(geom, big_endian, geom.get('meta', {}), buf, offset)
+
+    return offset
+
+
+def _dump_bytes(data, buf, offset):
+    """
+    Copy the binary string ``data`` into ``buf`` at ``offset``.
+
+    :returns:
+        The offset just past the end of the copied data.
+    """
+    end = offset + len(data)
+    buf[offset:end] = data
+    return end
+
+
+def _dump_count(byte_order, count, buf, offset):
+    """
+    Write a 4-byte integer count (of vertices, rings, parts, etc.) into
+    ``buf`` at ``offset``.
+
+    :returns:
+        The offset just past the end of the count.
+    """
+    _COUNT_STRUCTS[byte_order].pack_into(buf, offset, count)
+    return offset + 4
+
+
+def _dump_vertices(byte_order, num_dims, vertices, buf, offset):
+    """
+    Write a vertex count followed by the ``vertices``, as found in
+    LineStrings and Polygon rings, into ``buf`` at ``offset``. This is the
+    inverse of :func:`_load_vertices`.
+
+    All of the coordinate values are packed in a single call, using a cached
+    struct for the whole run of vertices. If ``vertices`` is a NumPy array,
+    its data is copied into ``buf`` directly instead (see
+    :func:`_dump_vertex_array`).
+
+    :returns:
+        The offset just past the end of the last vertex.
+    """
+    if hasattr(vertices, 'ndim'):
+        return _dump_vertex_array(byte_order, num_dims, vertices, buf, offset)
 
-    wkb_string += first_wkb
-    for geom in rest:
-        wkb_string += dumps(geom, big_endian=big_endian)
+    # The values are packed as one flat run, so vertices with the wrong
+    # number of values would shift all of the values after them.
+    if not set(map(len, vertices)) <= {num_dims}:
+        raise ValueError('Cannot mix dimensionality in a geometry')
 
-    return wkb_string
+    offset = _dump_count(byte_order, len(vertices), buf, offset)
+    run_struct = _coord_struct(byte_order, num_dims, len(vertices))
+    run_struct.pack_into(buf, offset, *chain.from_iterable(vertices))
+    return offset + run_struct.size
 
 
-def _load_point(big_endian, type_bytes, data_bytes):
+def _dump_vertex_array(byte_order, num_dims, vertices, buf, offset):
+    """
+    Write a vertex count followed by the ``vertices``, given as a NumPy array
+    of shape ``(n, num_dims)``, into ``buf`` at ``offset``.
+
+    The array is converted to float64 in the requested byte order (which is
+    a no-op for contiguous arrays already in that form) and its data is
+    copied into ``buf`` as a single block.
+
+    :returns:
+        The offset just past the end of the last vertex.
+    """
+    numpy = import_numpy()
+    if vertices.ndim != 2 or vertices.shape[1] != num_dims:
+        raise ValueError(
+            'Expected an array of vertices with shape (n, %s), but got an '
+            'array with shape %s' % (num_dims, vertices.shape)
+        )
+
+    offset = _dump_count(byte_order, len(vertices), buf, offset)
+    data = numpy.ascontiguousarray(vertices, dtype=byte_order + 'f8')
+    return _dump_bytes(memoryview(data).cast('B'), buf, offset)
+
+
+def _load_point(big_endian, type_bytes, data_bytes, offset,
+                as_numpy=False):
     """
     Convert byte data for a Point to a GeoJSON `dict`.
 
@@ -601,266 +1372,150 @@ def _load_point(big_endian, type_bytes, data_bytes):
         (Point) and the dimensions (2D, Z, M or ZM). For consistency, these
         bytes are expected to always be in big endian order, regardless of the
         value of ``big_endian``.
-    :param str data_bytes:
-        Coordinate data in a binary string.
+    :param data_bytes:
+        `memoryview` of the WKB data.
+    :param int offset:
+        Position in ``data_bytes`` at which the coordinate data starts.
+    :param bool as_numpy:
+        If `True`, give the coordinates as a NumPy array instead of a `list`.
 
     :returns:
-        GeoJSON `dict` representing the Point geometry.
+        2-tuple of the GeoJSON `dict` representing the Point geometry and the
+        offset just past the end of the Point data.
     """
     endian_token = '>' if big_endian else '<'
-
-    if type_bytes == WKB_2D['Point']:
-        coords = struct.unpack('%sdd' % endian_token,
-                               as_bin_str(take(16, data_bytes)))
-    elif type_bytes == WKB_Z['Point']:
-        coords = struct.unpack('%sddd' % endian_token,
-                               as_bin_str(take(24, data_bytes)))
-    elif type_bytes == WKB_M['Point']:
+    num_dims, is_m = _get_dims(type_bytes)
+    _check_size(data_bytes, offset, 8 * num_dims)
+
+    if as_numpy:
+        [coords] = _vertex_array(endian_token, num_dims, is_m, data_bytes,
+                                 offset, 1)
+        return dict(type='Point', coordinates=coords), offset + 8 * num_dims
+
+    coords = list(_coord_struct(endian_token, num_dims).unpack_from(
+        data_bytes, offset
+    ))
+    offset += 8 * num_dims
+    if is_m:
         # NOTE: The use of XYM types geometries is quite rare. In the interest
         # of removing ambiguity, we will treat all XYM geometries as XYZM when
         # generate the GeoJSON. A default Z value of `0.0` will be given in
         # this case.
-        coords = list(struct.unpack('%sddd' % endian_token,
-                                    as_bin_str(take(24, data_bytes))))
         coords.insert(2, 0.0)
-    elif type_bytes == WKB_ZM['Point']:
-        coords = struct.unpack('%sdddd' % endian_token,
-                               as_bin_str(take(32, data_bytes)))
 
-    return dict(type='Point', coordinates=list(coords))
+    return dict(type='Point', coordinates=coords), offset
 
 
-def _load_linestring(big_endian, type_bytes, data_bytes):
+def _load_linestring(big_endian, type_bytes, data_bytes, offset,
+                     as_numpy=False):
     endian_token = '>' if big_endian else '<'
+    num_dims, is_m = _get_dims(type_bytes)
 
-    is_m = False
-
-    if type_bytes in WKB_2D.values():
-        num_dims = 2
-    elif type_bytes in WKB_Z.values():
-        num_dims = 3
-    elif type_bytes in WKB_M.values():
-        num_dims = 3
-        is_m = True
-    elif type_bytes in WKB_ZM.values():
-        num_dims = 4
+    coords, offset = _load_vertices(endian_token, num_dims, is_m,
+                                    data_bytes, offset, as_numpy)
 
-    coords = []
-    [num_verts] = struct.unpack('%sl' % endian_token,
-                                as_bin_str(take(4, data_bytes)))
+    return dict(type='LineString', coordinates=coords), offset
 
-    while True:
-        vert_wkb = as_bin_str(take(8 * num_dims, data_bytes))
-        fmt = '%s' + 'd' * num_dims
-        vert = list(struct.unpack(fmt % endian_token, vert_wkb))
-        if is_m:
-            vert.insert(2, 0.0)
 
-        coords.append(vert)
-
-        if len(coords) == num_verts:
-            break
-
-    return dict(type='LineString', coordinates=list(coords))
-
-
-def _load_polygon(big_endian, type_bytes, data_bytes):
+def _load_polygon(big_endian, type_bytes, data_bytes, offset,
+                  as_numpy=False):
     endian_token = '>' if big_endian else '<'
-    data_bytes = iter(data_bytes)
-
-    is_m = False
-
-    if type_bytes in WKB_2D.values():
-        num_dims = 2
-    elif type_bytes in WKB_Z.values():
-        num_dims = 3
-    elif type_bytes in WKB_M.values():
-        num_dims = 3
-        is_m = True
-    elif type_bytes in WKB_ZM.values():
-        num_dims = 4
+    num_dims, is_m = _get_dims(type_bytes)
 
     coords = []
-    [num_rings] = struct.unpack('%sl' % endian_token,
-                                as_bin_str(take(4, data_bytes)))
+    num_rings = _unpack_count(endian_token, data_bytes, offset)
+    offset += 4
 
-    while True:
-        ring = []
-        [num_verts] = struct.unpack('%sl' % endian_token,
-                                    as_bin_str(take(4, data_bytes)))
-
-        verts_wkb = as_bin_str(take(8 * num_verts * num_dims, data_bytes))
-        verts = block_splitter(verts_wkb, 8)
-        verts = (b''.join(bytes([y]) for y in x) for x in verts)
-        for vert_wkb in block_splitter(verts, num_dims):
-            values = [struct.unpack('%sd' % endian_token, x)[0]
-                      for x in vert_wkb]
-            if is_m:
-                values.insert(2, 0.0)
-            ring.append(values)
+    for _ in range(num_rings):
+        ring, offset = _load_vertices(endian_token, num_dims, is_m,
+                                      data_bytes, offset, as_numpy)
         coords.append(ring)
-        if len(coords) == num_rings:
-            break
 
-    return dict(type='Polygon', coordinates=coords)
+    return dict(type='Polygon', coordinates=coords), offset
 
 
-def _load_multipoint(big_endian, type_bytes, data_bytes):
+def _load_multipoint(big_endian, type_bytes, data_bytes, offset,
+                     as_numpy=False):
     endian_token = '>' if big_endian else '<'
-    data_bytes = iter(data_bytes)
-
-    is_m = False
-
-    if type_bytes in WKB_2D.values():
-        num_dims = 2
-    elif type_bytes in WKB_Z.values():
-        num_dims = 3
-    elif type_bytes in WKB_M.values():
-        num_dims = 3
-        is_m = True
-    elif type_bytes in WKB_ZM.values():
-        num_dims = 4
-
-    if is_m:
-        dim = 'M'
-    else:
-        dim = _INT_TO_DIM_LABEL[num_dims]
+    num_dims, is_m = _get_dims(type_bytes)
+    point_header = _part_header('Point', num_dims, is_m, big_endian)
+    point_struct = _coord_struct(endian_token, num_dims)
 
     coords = []
-    [num_points] = struct.unpack('%sl' % endian_token,
-                                 as_bin_str(take(4, data_bytes)))
-
-    while True:
-        point_endian = as_bin_str(take(1, data_bytes))
-        point_type = as_bin_str(take(4, data_bytes))
-        values = struct.unpack('%s%s' % (endian_token, 'd' * num_dims),
-                               as_bin_str(take(8 * num_dims, data_bytes)))
-        values = list(values)
+    num_points = _unpack_count(endian_token, data_bytes, offset)
+    offset += 4
+
+    point_size = 5 + 8 * num_dims
+    _check_size(data_bytes, offset, num_points * point_size)
+
+    if as_numpy:
+        for i in range(num_points):
+            point_offset = offset + i * point_size
+            assert data_bytes[point_offset:point_offset + 5] == point_header
+        coords = _vertex_array(endian_token, num_dims, is_m, data_bytes,
+                               offset + 5, num_points, point_size)
+        offset += num_points * point_size
+        return dict(type='MultiPoint', coordinates=coords), offset
+
+    for _ in range(num_points):
+        assert data_bytes[offset:offset + 5] == point_header
+        offset += 5
+        values = list(point_struct.unpack_from(data_bytes, offset))
+        offset += 8 * num_dims
         if is_m:
             values.insert(2, 0.0)
 
-        if big_endian:
-            assert point_endian == BIG_ENDIAN
-            assert point_type == _WKB[dim]['Point']
-        else:
-            assert point_endian == LITTLE_ENDIAN
-            assert point_type[::-1] == _WKB[dim]['Point']
-
-        coords.append(list(values))
-        if len(coords) == num_points:
-            break
+        coords.append(values)
 
-    return dict(type='MultiPoint', coordinates=coords)
+    return dict(type='MultiPoint', coordinates=coords), offset
 
 
-def _load_multilinestring(big_endian, type_bytes, data_bytes):
+def _load_multilinestring(big_endian, type_bytes, data_bytes, offset,
+                          as_numpy=False):
     endian_token = '>' if big_endian else '<'
-    data_bytes = iter(data_bytes)
-
-    is_m = False
+    num_dims, is_m = _get_dims(type_bytes)
+    ls_header = _part_header('LineString', num_dims, is_m, big_endian)
 
-    if type_bytes in WKB_2D.values():
-        num_dims = 2
-    elif type_bytes in WKB_Z.values():
-        num_dims = 3
-    elif type_bytes in WKB_M.values():
-        num_dims = 3
-        is_m = True
-    elif type_bytes in WKB_ZM.values():
-        num_dims = 4
-
-    if is_m:
-        dim = 'M'
-    else:
-        dim = _INT_TO_DIM_LABEL[num_dims]
-
-    [num_ls] = struct.unpack('%sl' % endian_token,
-                             as_bin_str(take(4, data_bytes)))
+    num_ls = _unpack_count(endian_token, data_bytes, offset)
+    offset += 4
     coords = []
 
-    while True:
-        ls_endian = as_bin_str(take(1, data_bytes))
-        ls_type = as_bin_str(take(4, data_bytes))
-        if big_endian:
-            assert ls_endian == BIG_ENDIAN
-            assert ls_type == _WKB[dim]['LineString']
-        else:
-            assert ls_endian == LITTLE_ENDIAN
-            assert ls_type[::-1] == _WKB[dim]['LineString']
-
-        [num_verts] = struct.unpack('%sl' % endian_token,
-                                    as_bin_str(take(4, data_bytes)))
-        num_values = num_dims * num_verts
-        values = struct.unpack(endian_token + 'd' * num_values,
-                               as_bin_str(take(8 * num_values, data_bytes)))
-
-        values = list(block_splitter(values, num_dims))
-        if is_m:
-            for v in values:
-                v.insert(2, 0.0)
-        coords.append(values)
-        if len(coords) == num_ls:
-            break
+    for _ in range(num_ls):
+        _check_size(data_bytes, offset, 5)
+        assert data_bytes[offset:offset + 5] == ls_header
+        offset += 5
+        linestring, offset = _load_vertices(endian_token, num_dims, is_m,
+                                            data_bytes, offset, as_numpy)
+        coords.append(linestring)
 
-    return dict(type='MultiLineString', coordinates=coords)
+    return dict(type='MultiLineString', coordinates=coords), offset
 
 
-def _load_multipolygon(big_endian, type_bytes, data_bytes):
+def _load_multipolygon(big_endian, type_bytes, data_bytes, offset,
+                       as_numpy=False):
     endian_token = '>' if big_endian else '<'
+    num_dims, is_m = _get_dims(type_bytes)
+    poly_header = _part_header('Polygon', num_dims, is_m, big_endian)
 
-    is_m = False
-
-    if type_bytes in WKB_2D.values():
-        num_dims = 2
-    elif type_bytes in WKB_Z.values():
-        num_dims = 3
-    elif type_bytes in WKB_M.values():
-        num_dims = 3
-        is_m = True
-    elif type_bytes in WKB_ZM.values():
-        num_dims = 4
-
-    if is_m:
-        dim = 'M'
-    else:
-        dim = _INT_TO_DIM_LABEL[num_dims]
-
-    [num_polys] = struct.unpack('%sl' % endian_token,
-                                as_bin_str(take(4, data_bytes)))
+    num_polys = _unpack_count(endian_token, data_bytes, offset)
+    offset += 4
     coords = []
-    while True:
-        polygon = []
-        poly_endian = as_bin_str(take(1, data_bytes))
-        poly_type = as_bin_str(take(4, data_bytes))
-        if big_endian:
-            assert poly_endian == BIG_ENDIAN
-            assert poly_type == _WKB[dim]['Polygon']
-        else:
-            assert poly_endian == LITTLE_ENDIAN
-            assert poly_type[::-1] == _WKB[dim]['Polygon']
 
-        [num_rings] = struct.unpack('%sl' % endian_token,
-                                    as_bin_str(take(4, data_bytes)))
+    for _ in range(num_polys):
+        _check_size(data_bytes, offset, 5)
+        assert data_bytes[offset:offset + 5] == poly_header
+        offset += 5
+        polygon = []
+        num_rings = _unpack_count(endian_token, data_bytes, offset)
+        offset += 4
         for _ in range(num_rings):
-            ring = []
-            [num_verts] = struct.unpack('%sl' % endian_token,
-                                        as_bin_str(take(4, data_bytes)))
-            for _ in range(num_verts):
-                vert_wkb = as_bin_str(take(8 * num_dims, data_bytes))
-                fmt = '%s' + 'd' * num_dims
-                vert = list(struct.unpack(fmt % endian_token, vert_wkb))
-                if is_m:
-                    vert.insert(2, 0.0)
-                ring.append(vert)
-
+            ring, offset = _load_vertices(endian_token, num_dims, is_m,
+                                          data_bytes, offset, as_numpy)
             polygon.append(ring)
 
         coords.append(polygon)
 
-        if len(coords) == num_polys:
-            break
-
-    return dict(type='MultiPolygon', coordinates=coords)
+    return dict(type='MultiPolygon', coordinates=coords), offset
 
 
 def _check_dimensionality(geom, num_dims):
@@ -882,26 +1537,17 @@ def _check_dimensionality(geom, num_dims):
         raise Exception(error)
 
 
-def _load_geometrycollection(big_endian, type_bytes, data_bytes):
+def _load_geometrycollection(big_endian, type_bytes, data_bytes, offset,
+                             as_numpy=False):
     endian_token = '>' if big_endian else '<'
-
-    is_m = False
-
-    if type_bytes in WKB_2D.values():
-        num_dims = 2
-    elif type_bytes in WKB_Z.values():
-        num_dims = 3
-    elif type_bytes in WKB_M.values():
-        num_dims = 3
-        is_m = True
-    elif type_bytes in WKB_ZM.values():
-        num_dims = 4
+    num_dims, is_m = _get_dims(type_bytes)
 
     geometries = []
-    [num_geoms] = struct.unpack('%sl' % endian_token,
-                                as_bin_str(take(4, data_bytes)))
-    while True:
-        geometry = loads(data_bytes)
+    num_geoms = _unpack_count(endian_token, data_bytes, offset)
+    offset += 4
+
+    for _ in range(num_geoms):
+        geometry, offset = _loads(data_bytes, offset, as_numpy)
         if is_m:
             _check_dimensionality(geometry, 4)
         else:
@@ -909,10 +1555,70 @@ def _load_geometrycollection(big_endian, type_bytes, data_bytes):
         # TODO(LB): Add type assertions for the geometry; collections should
         # not mix 2d, 3d, 4d, etc.
         geometries.append(geometry)
-        if len(geometries) == num_geoms:
-            break
 
-    return dict(type='GeometryCollection', geometries=geometries)
+    return dict(type='GeometryCollection', geometries=geometries), offset
+
+
+def _load_vertices(endian_token, num_dims, is_m, data_bytes, offset,
+                   as_numpy=False):
+    """
+    Read a vertex count followed by that many vertices, as found in
+    LineStrings and Polygon rings.
+
+    All of the coordinate values are unpacked in a single call, using a cached
+    struct for the whole run of vertices.
+
+    :returns:
+        2-tuple of the list of vertices (each a `list` of floats), or a
+        NumPy array of them if ``as_numpy`` is `True`, and the offset just
+        past the end of the last vertex.
+    """
+    num_verts = _unpack_count(endian_token, data_bytes, offset)
+    offset += 4
+    _check_size(data_bytes, offset, 8 * num_dims * num_verts)
+
+    if as_numpy:
+        verts = _vertex_array(endian_token, num_dims, is_m, data_bytes,
+                              offset, num_verts)
+        return verts, offset + 8 * num_dims * num_verts
+
+    run_struct = _coord_struct(endian_token, num_dims, num_verts)
+    values = iter(run_struct.unpack_from(data_bytes, offset))
+    offset += run_struct.size
+
+    if is_m:
+        verts = [[x, y, 0.0, m] for x, y, m in zip(values, values, values)]
+    else:
+        verts = [list(vert) for vert in zip(*[values] * num_dims)]
+
+    return verts, offset
+
+
+def _vertex_array(endian_token, num_dims, is_m, data_bytes, offset,
+                  num_verts, vert_stride=None):
+    """
+    Copy a run of vertices from the WKB into a NumPy array of shape
+    ``(num_verts, num_dims)`` (or ``(num_verts, 4)`` for XYM geometries,
+    which are given a Z value of `0.0`, like the `list` vertices).
+
+    The coordinate values are read straight from the buffer, with the byte
+    order of the WKB, and converted to native float64 in one step.
+
+    :param int vert_stride:
+        Number of bytes from the start of one vertex to the next. Defaults to
+        the size of a vertex, for contiguous runs.
+    """
+    numpy = import_numpy()
+    if vert_stride is None:
+        vert_stride = 8 * num_dims
+
+    verts = numpy.ndarray(
+        shape=(num_verts, num_dims), dtype=endian_token + 'f8',
+        buffer=data_bytes, offset=offset, strides=(vert_stride, 8),
+    ).astype(numpy.float64)
+    if is_m:
+        verts = numpy.insert(verts, 2, 0.0, axis=1)
+    return verts
 
 
 _dumps_registry = {
@@ -11,9 +11,10 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import io
+import decimal
+import functools
 import itertools
-import tokenize
+import re
 
 import geomet
 from geomet import util
@@ -21,36 +22,172 @@ from geomet import util
 
 INVALID_WKT_FMT = 'Invalid WKT: `%s`'
 
+# Maximum number of vertices formatted into a single piece of WKT by
+# `iter_dumps`.
+_VERTICES_PER_CHUNK = 4096
+# Number of characters read at a time by `load` and `iter_load_parts`
+_STREAM_CHUNK_SIZE = 65536
+# Maximum length of the WKT shown in error messages for WKT read from a file
+_EXCERPT_LEN = 80
+_MIXED_DIMS_MSG = 'Cannot mix dimensionality in a geometry'
 
-def dump(obj, dest_file):
+
+def dump(obj, dest_file, decimals=16, preserve_ints=False):
     """
     Dump GeoJSON-like `dict` to WKT and write it to the `dest_file`.
 
+    The WKT is written in pieces as it is generated (see :func:`iter_dumps`),
+    rather than being built up as a single string first.
+
     :param dict obj:
         A GeoJSON-like dictionary. It must at least the keys 'type' and
         'coordinates'.
     :param dest_file:
         Open and writable file-like object.
+    :param int decimals:
+        See :func:`dumps`.
+    :param bool preserve_ints:
+        See :func:`dumps`.
     """
-    dest_file.write(dumps(obj))
+    for chunk in iter_dumps(obj, decimals, preserve_ints):
+        dest_file.write(chunk)
 
 
 def load(source_file):
     """
     Load a GeoJSON `dict` object from a ``source_file`` containing WKT.
 
+    The file is read and parsed in chunks, rather than being read into memory
+    in full before parsing, so only a small part of the WKT text is held in
+    memory at any time.
+
     :param source_file:
         Open and readable file-like object.
 
     :returns:
         A GeoJSON `dict` representing the geometry read from the file.
     """
-    return loads(source_file.read())
+    tokens = _WKTStreamScanner(source_file)
+    return _load(tokens, tokens.excerpt)
+
+
+def iter_load(source_file):
+    """
+    Load each of the WKT geometries in ``source_file``, one at a time.
+
+    The geometries may be separated by whitespace, such as one geometry per
+    line, or by semicolons, as in the dumps of some databases. EWKT is also
+    supported. The file is read in chunks by a single scanner, which carries
+    on from one geometry to the next.
+
+    >>> import io
+    >>> wkt_file = io.StringIO(
+    ...     'POINT (0 1)\\nSRID=4326;POINT (2 3);POINT EMPTY')
+    >>> for geom in iter_load(wkt_file):
+    ...     print(geom)
+    {'type': 'Point', 'coordinates': [0.0, 1.0]}
+    {'type': 'Point', 'coordinates': [2.0, 3.0], 'meta': {'srid': 4326}}
+    {'type': 'Point', 'coordinates': []}
+
+    :param source_file:
+        Open and readable file-like object.
+
+    :returns:
+        A generator of GeoJSON `dict` objects.
+    """
+    tokens = _WKTStreamScanner(source_file)
+    while tokens.skip_separators():
+        tokens.mark_start()
+        yield _load(tokens, tokens.excerpt)
+
+
+def iter_load_parts(source_file):
+    """
+    Load the WKT geometry in ``source_file`` one part at a time.
+
+    The parts of a multi-part geometry (the points of a MULTIPOINT, the
+    linestrings of a MULTILINESTRING, the polygons of a MULTIPOLYGON, or the
+    members of a GEOMETRYCOLLECTION) are each generated as their own GeoJSON
+    `dict` as soon as they have been parsed. Like :func:`load`, the file is
+    read in chunks, so only the part being parsed is held in memory.
+
+    If the geometry has an SRID, it is included in the `meta` of each part.
+    An empty geometry has no parts, and any other geometry is generated as a
+    single part.
+
+    >>> import io
+    >>> wkt_file = io.StringIO('SRID=4326;MULTIPOINT ((0 1), (2 3))')
+    >>> for pt in iter_load_parts(wkt_file):
+    ...     print(pt)
+    {'type': 'Point', 'coordinates': [0.0, 1.0], 'meta': {'srid': 4326}}
+    {'type': 'Point', 'coordinates': [2.0, 3.0], 'meta': {'srid': 4326}}
 
+    :param source_file:
+        Open and readable file-like object.
 
-def dumps(obj, decimals=16):
+    :returns:
+        A generator of GeoJSON `dict` objects.
+    """
+    tokens = _WKTStreamScanner(source_file)
+    srid, geom_type = _load_header(tokens)
+
+    if tokens.peek() == 'EMPTY':
+        return
+
+    iter_parts = _iter_parts_registry.get(geom_type)
+    if iter_parts is None:
+        parts = [_loads_registry[geom_type](tokens, tokens.excerpt)]
+    else:
+        parts = iter_parts(tokens, tokens.excerpt)
+
+    for part in parts:
+        if srid is not None:
+            part['meta'] = dict(srid=srid)
+        yield part
+
+
+def dumps(obj, decimals=16, preserve_ints=False):
     """
     Dump a GeoJSON-like `dict` to a WKT string.
+
+    :param dict obj:
+        A GeoJSON-like dictionary.
+    :param int decimals:
+        Number of digits to write after the decimal point for each coordinate
+        value. Values are rounded, or padded with zeros, to this many digits.
+        If `None`, each value is written with the fewest digits which read
+        back as the same float, without any padding.
+    :param bool preserve_ints:
+        If `True`, write `int` coordinate values without a decimal point,
+        regardless of ``decimals``.
+
+    :returns:
+        The WKT string.
+    """
+    return ''.join(iter_dumps(obj, decimals, preserve_ints))
+
+
+def iter_dumps(obj, decimals=16, preserve_ints=False):
+    """
+    Dump a GeoJSON-like `dict` to WKT, generating the WKT string in pieces.
+
+    The pieces are at most a ring, a LineString, or a run of a few thousand
+    vertices long, so that even a very large geometry can be written out
+    without building the whole WKT string in memory. Joining the pieces gives
+    the same string as :func:`dumps`.
+
+    The input is checked up front, so errors are raised by this function
+    rather than while iterating over the result.
+
+    :param dict obj:
+        A GeoJSON-like dictionary.
+    :param int decimals:
+        See :func:`dumps`.
+    :param bool preserve_ints:
+        See :func:`dumps`.
+
+    :returns:
+        An iterator of `str` pieces of the WKT.
     """
     try:
         geom_type = obj['type']
@@ -62,15 +199,15 @@ def dumps(obj, decimals=16):
         # Check for empty cases
         if geom_type == 'GeometryCollection':
             if len(obj['geometries']) == 0:
-                return 'GEOMETRYCOLLECTION EMPTY'
+                return iter(['GEOMETRYCOLLECTION EMPTY'])
         else:
             # Geom has no coordinate values at all, and must be empty.
-            if len(list(util.flatten_multi_dim(obj['coordinates']))) == 0:
-                return '%s EMPTY' % geom_type.upper()
+            if util.is_empty(obj['coordinates']):
+                return iter(['%s EMPTY' % geom_type.upper()])
     except KeyError:
         raise geomet.InvalidGeoJSONException('Invalid GeoJSON: %s' % obj)
 
-    result = exporter(obj, decimals)
+    result = exporter(obj, decimals, preserve_ints)
     # Try to get the SRID from `meta.srid`
     meta_srid = obj.get('meta', {}).get('srid')
     # Also try to get it from `crs.properties.name`:
@@ -90,7 +227,7 @@ def dumps(obj, decimals=16):
     # TODO: add tests for CRS input
     if srid is not None:
         # Prepend the SRID
-        result = 'SRID=%s;%s' % (srid, result)
+        result = itertools.chain(['SRID=%s;' % srid], result)
     return result
 
 
@@ -106,7 +243,42 @@ def loads(string):
     """
     Construct a GeoJSON `dict` from WKT (`string`).
     """
-    tokens = _tokenize_wkt(string)
+    return _load(_tokenize_wkt(string), string)
+
+
+def _load(tokens, string):
+    """
+    Construct a GeoJSON `dict` from the WKT read from ``tokens``.
+
+    :param tokens:
+        A :class:`_WKTScanner`, positioned at the start of the WKT.
+    :param str string:
+        The WKT, or an excerpt of it, for error messages.
+    """
+    srid, geom_type = _load_header(tokens)
+
+    if tokens.peek() == 'EMPTY':
+        next(tokens)
+        if geom_type == 'GEOMETRYCOLLECTION':
+            return dict(type='GeometryCollection', geometries=[])
+        else:
+            return dict(type=_type_map_caps_to_mixed[geom_type],
+                        coordinates=[])
+
+    result = _loads_registry[geom_type](tokens, string)
+    if srid is not None:
+        result['meta'] = dict(srid=srid)
+    return result
+
+
+def _load_header(tokens):
+    """
+    Read the optional EWKT SRID and the geometry type from ``tokens``.
+
+    :returns:
+        2-tuple of the SRID (or `None`) and the upper case geometry type, for
+        example ``(4326, 'POINT')``.
+    """
     geom_type_or_srid = next(tokens)
     srid = None
     geom_type = geom_type_or_srid
@@ -120,53 +292,284 @@ def loads(string):
     else:
         geom_type = geom_type_or_srid
 
-    importer = _loads_registry.get(geom_type)
-
-    if importer is None:
+    if geom_type not in _loads_registry:
         _unsupported_geom_type(geom_type)
 
-    peek = next(tokens)
-    if peek == 'EMPTY':
-        if geom_type == 'GEOMETRYCOLLECTION':
-            return dict(type='GeometryCollection', geometries=[])
-        else:
-            return dict(type=_type_map_caps_to_mixed[geom_type],
-                        coordinates=[])
-
-    # Put the peeked element back on the head of the token generator
-    tokens = itertools.chain([peek], tokens)
-    result = importer(tokens, string)
-    if srid is not None:
-        result['meta'] = dict(srid=srid)
-    return result
+    return srid, geom_type
 
 
 def _tokenize_wkt(string):
     """
-    Since the tokenizer treats "-" and numeric strings as separate values,
-    combine them and yield them as a single token. This utility encapsulates
-    parsing of negative numeric values from WKT can be used generically in all
-    parsers.
+    Split a WKT ``string`` into tokens: numbers (including their sign),
+    geometry type names and other keywords, and single punctuation
+    characters, such as parentheses, commas, ``=`` and ``;``.
+
+    >>> list(_tokenize_wkt('SRID=4326;POINT (-1.5 2e3)'))
+    ['SRID', '=', '4326', ';', 'POINT', '(', '-1.5', '2e3', ')']
+
+    :returns:
+        A :class:`_WKTScanner` over the tokens of ``string``.
     """
-    sio = io.StringIO(string)
-    # NOTE: This is not the intended purpose of `tokenize`, but it works.
-    tokens = (x[1] for x in tokenize.generate_tokens(sio.readline))
-    negative = False
-    for t in tokens:
-        if t == '-':
-            negative = True
-            continue
-        elif t == '':
-            # Ignore empty string tokens.
-            # This can happen in python3.12, seemingly due to
-            # https://peps.python.org/pep-0701/#changes-to-the-tokenize-module
-            continue
-        else:
-            if negative:
-                yield '-%s' % t
-            else:
-                yield t
-            negative = False
+    return _WKTScanner(string)
+
+
+# A token is a number, a name (geometry types, EMPTY, SRID, etc.), or any
+# other single non-whitespace character.
+_WKT_TOKEN_RE = re.compile(
+    r'\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[A-Za-z_]\w*|\S)'
+)
+
+
+# Whitespace and semicolons between the geometries read by `iter_load`
+_WKT_SEPARATORS_RE = re.compile(r'[\s;]*')
+
+
+class _WKTScanner(object):
+    """
+    Iterator over the tokens of a WKT string, which scans the string in place
+    with a precompiled regular expression.
+
+    ``pos`` is the index in ``string`` just past the last token consumed, and
+    ``excerpt`` is the WKT as it is shown in error messages.
+    """
+
+    def __init__(self, string):
+        self.string = string
+        self.excerpt = string
+        self.pos = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        match = _WKT_TOKEN_RE.match(self.string, self.pos)
+        if match is None:
+            # Only whitespace is left. Running out of tokens while there are
+            # still parentheses left open means the WKT is truncated.
+            if self.string.count('(') > self.string.count(')'):
+                raise ValueError(INVALID_WKT_FMT % self.excerpt)
+            raise StopIteration
+        self.pos = match.end()
+        return match.group(1)
+
+    def next_vertices(self):
+        """
+        Consume a run of vertices, such as a LineString or a Polygon ring,
+        up to and including the closing parenthesis. The opening parenthesis
+        must already have been consumed.
+
+        :returns:
+            The list of vertices, parsed by :func:`_parse_vertices`.
+        """
+        return _parse_vertices(self._next_run())
+
+    def next_values(self):
+        """
+        Consume a run of vertices like :meth:`next_vertices`, but give the
+        coordinate values as a flat list.
+
+        :returns:
+            2-tuple of the number of values per vertex and the list of values,
+            parsed by :func:`_parse_values`.
+        """
+        return _parse_values(self._next_run())
+
+    def _next_run(self):
+        """
+        Consume the text of a run of vertices, and the closing parenthesis.
+        """
+        end = self.string.find(')', self.pos)
+        if end == -1:
+            raise ValueError(INVALID_WKT_FMT % self.excerpt)
+        run = self.string[self.pos:end]
+        self.pos = end + 1
+        return run
+
+    def peek(self):
+        """
+        Return the next token without consuming it.
+        """
+        token = next(self)
+        # Step back to the start of the token.
+        self.pos -= len(token)
+        return token
+
+
+class _WKTStreamScanner(_WKTScanner):
+    """
+    Like :class:`_WKTScanner`, but reads the WKT from a text ``stream``,
+    ``chunk_size`` characters at a time.
+
+    ``string`` only holds the text which has been read but not consumed yet:
+    everything before ``pos`` is dropped whenever another chunk is read.
+
+    Tokens are only ever asked for in the middle of a geometry, so running out
+    of them always means that the WKT is truncated.
+    """
+
+    def __init__(self, stream, chunk_size=_STREAM_CHUNK_SIZE):
+        super(_WKTStreamScanner, self).__init__('')
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._eof = False
+        self._read_chunk()
+        self.mark_start()
+
+    def mark_start(self):
+        """
+        Mark the start of a geometry, by setting ``excerpt`` to the WKT from
+        here on, as it is shown in error messages.
+        """
+        self.excerpt = _Excerpt(self.string, self.pos)
+
+    def _read_chunk(self):
+        """
+        Append the next chunk of the stream to the unconsumed text.
+
+        :returns:
+            `False` if the end of the stream has been reached, else `True`.
+        """
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self.string = self.string[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def __next__(self):
+        match = _WKT_TOKEN_RE.match(self.string, self.pos)
+        # A token which runs up to the end of the text read so far may
+        # continue in the next chunk. So may a number followed by only part
+        # of an exponent, such as the '1' of '1e-'.
+        while ((match is None or match.end() > len(self.string) - 3) and
+               self._read_chunk()):
+            match = _WKT_TOKEN_RE.match(self.string, self.pos)
+
+        if match is None:
+            raise ValueError(INVALID_WKT_FMT % self.excerpt)
+        self.pos = match.end()
+        return match.group(1)
+
+    def skip_separators(self):
+        """
+        Skip any whitespace and semicolons separating one geometry from the
+        next.
+
+        :returns:
+            `False` if the end of the stream has been reached, else `True`.
+        """
+        while True:
+            self.pos = _WKT_SEPARATORS_RE.match(self.string, self.pos).end()
+            if self.pos < len(self.string):
+                return True
+            if not self._read_chunk():
+                return False
+
+    def next_vertices(self):
+        """
+        Consume a run of vertices, like :meth:`_WKTScanner.next_vertices`.
+
+        Runs which span several chunks are parsed as they are read, so the
+        text of a long run is never held in memory all at once.
+        """
+        vertices = []
+        end = self.string.find(')', self.pos)
+        while end == -1:
+            # Parse the vertices which are complete so far, and keep the text
+            # of the last one, which may continue in the next chunk.
+            head, comma, tail = self.string[self.pos:].rpartition(',')
+            if comma:
+                vertices.extend(_parse_vertices(head))
+                self.string = tail
+                self.pos = 0
+            if not self._read_chunk():
+                raise ValueError(INVALID_WKT_FMT % self.excerpt)
+            end = self.string.find(')', self.pos)
+
+        vertices.extend(_parse_vertices(self.string[self.pos:end]))
+        self.pos = end + 1
+        return vertices
+
+    def next_values(self):
+        """
+        Consume a run of vertices, like :meth:`_WKTScanner.next_values`.
+        """
+        vertices = self.next_vertices()
+        num_dims = len(vertices[0])
+        if any(len(vert) != num_dims for vert in vertices):
+            raise ValueError(_MIXED_DIMS_MSG)
+        return num_dims, list(itertools.chain.from_iterable(vertices))
+
+
+class _Excerpt(object):
+    """
+    The first few characters of a WKT geometry in a longer text, up to the end
+    of the line, as shown in error messages.
+
+    The excerpt is only cut out of the ``text`` when it is formatted, since it
+    is rarely needed.
+
+    >>> str(_Excerpt('POINT (0 1)\\nPOINT (2 3)', 12))
+    'POINT (2 3)'
+    """
+
+    def __init__(self, text, start):
+        self._text = text
+        self._start = start
+
+    def __str__(self):
+        text = self._text[self._start:self._start + 2 * _EXCERPT_LEN]
+        text = text.lstrip().split('\n', 1)[0].rstrip()
+        if len(text) > _EXCERPT_LEN:
+            text = text[:_EXCERPT_LEN] + '...'
+        return text
+
+
+def _parse_vertices(run):
+    """
+    Parse the text of a run of vertices into a list of vertices, each a
+    `list` of floats.
+
+    The text is split and converted in bulk, and then the flat list of values
+    is regrouped by the number of dimensions. If the vertices don't all have
+    the same number of values, each vertex is converted on its own instead.
+
+    >>> _parse_vertices('0 1, 2.5 -3')
+    [[0.0, 1.0], [2.5, -3.0]]
+    >>> _parse_vertices('0 1, 2 3 4')
+    [[0.0, 1.0], [2.0, 3.0, 4.0]]
+    """
+    vertices = list(map(str.split, run.split(',')))
+    num_dims = len(vertices[0])
+    if num_dims == 0 or len(set(map(len, vertices))) != 1:
+        return [list(map(float, vert)) for vert in vertices]
+
+    values = map(float, itertools.chain.from_iterable(vertices))
+    return list(map(list, zip(*[values] * num_dims)))
+
+
+def _parse_values(run):
+    """
+    Parse the text of a run of vertices like :func:`_parse_vertices`, but
+    into a flat list of all of the coordinate values, without grouping them
+    by vertex.
+
+    >>> _parse_values('0 1, 2.5 -3')
+    (2, [0.0, 1.0, 2.5, -3.0])
+
+    :returns:
+        2-tuple of the number of values per vertex and the list of values.
+    :raises ValueError:
+        If the vertices don't all have the same number of values.
+    """
+    vertices = list(map(str.split, run.split(',')))
+    num_dims = len(vertices[0])
+    if len(set(map(len, vertices))) != 1:
+        raise ValueError(_MIXED_DIMS_MSG)
+    return num_dims, list(map(float, itertools.chain.from_iterable(vertices)))
 
 
 def _unsupported_geom_type(geom_type):
@@ -185,26 +588,138 @@ def _round_and_pad(value, decimals):
     :return:
         str of the rounded value
     """
-    if isinstance(value, int) and decimals != 0:
-        # if we get an int coordinate and we have a non-zero value for
-        # `decimals`, we want to create a float to pad out.
-        value = float(value)
+    return _coord_formatter(decimals)(value)
 
-    elif decimals == 0:
-        # if get a `decimals` value of 0, we want to return an int.
-        return repr(int(round(value, decimals)))
 
-    rounded = round(value, decimals)
+@functools.lru_cache(maxsize=64)
+def _coord_formatter(decimals, preserve_ints=False):
+    """
+    Get a function which formats a single coordinate value for WKT.
+
+    If ``decimals`` is `None`, values are written in the shortest form which
+    reads back as the same float (see :func:`_format_shortest`). Otherwise,
+    they are rounded and padded to ``decimals`` places, as described in
+    :func:`_round_and_pad`. If ``preserve_ints`` is `True`, `int` values are
+    written as they are, without any decimal places.
 
-    if 'e' in repr(rounded):
-        rounded = format(rounded, '.{}f'.format(decimals))
+    >>> fmt = _coord_formatter(None, preserve_ints=True)
+    >>> fmt(1), fmt(1.0), fmt(0.1)
+    ('1', '1.0', '0.1')
+    """
+    if decimals is None:
+        fmt = _format_shortest
     else:
-        rounded = repr(rounded)
-    rounded += '0' * (decimals - len(rounded.split('.')[1]))
-    return rounded
+        fmt = _fixed_formatter(decimals)
+
+    if not preserve_ints:
+        return fmt
+
+    def int_or_float_fmt(value):
+        if isinstance(value, int):
+            return repr(int(value))
+        return fmt(value)
+    return int_or_float_fmt
+
+
+def _fixed_formatter(decimals):
+    """
+    Build a function which formats a single coordinate value the way
+    :func:`_round_and_pad` describes, for a fixed number of ``decimals``.
+
+    The format string and padding for ``decimals`` are prepared once, so that
+    each value is converted with a single `repr` and padded without any
+    intermediate lists or string formatting. Values which already fit in
+    ``decimals`` places (most of them, with the default of 16) skip the
+    rounding step, which would not change them.
+
+    >>> fmt = _fixed_formatter(4)
+    >>> fmt(1), fmt(-2.5), fmt(6e-6)
+    ('1.0000', '-2.5000', '0.0000')
+    """
+    if decimals == 0:
+        # if get a `decimals` value of 0, we want to return an int.
+        def fmt(value):
+            return repr(int(round(value, 0)))
+        return fmt
+
+    fixed_fmt = '.%sf' % decimals
+    pads = ['0' * num_zeros for num_zeros in range(max(decimals, 0) + 1)]
+
+    def fmt(value):
+        # Ints are converted to floats, so that they are padded out as well.
+        value = float(value)
+        text = repr(value)
+        if 'e' in text or len(text) - text.index('.') - 1 > decimals:
+            # Only values which don't already fit in `decimals` places need
+            # rounding: for any other value, `round` gives the same float.
+            rounded = round(value, decimals)
+            text = repr(rounded)
+            if 'e' in text:
+                text = format(rounded, fixed_fmt)
+        num_zeros = decimals - (len(text) - text.index('.') - 1)
+        if num_zeros > 0:
+            text += pads[num_zeros]
+        return text
+    return fmt
+
+
+def _format_shortest(value):
+    """
+    Format a coordinate value with the fewest digits which still read back as
+    exactly the same float, like `repr`. Unlike `repr`, very large and very
+    small values are written out in full rather than in exponent notation.
+
+    >>> _format_shortest(1), _format_shortest(0.1), _format_shortest(1e-07)
+    ('1.0', '0.1', '0.0000001')
+    """
+    text = repr(float(value))
+    if 'e' in text:
+        text = format(decimal.Decimal(text), 'f')
+        if '.' not in text:
+            text += '.0'
+    return text
+
+
+def _format_vertex(vertex, fmt):
+    """
+    Format the coordinate values of a single ``vertex`` with the coordinate
+    formatter ``fmt`` (see :func:`_coord_formatter`), for example
+    ``'0.0 1.0'``.
+    """
+    return ' '.join(map(fmt, vertex))
+
+
+def _format_vertices(vertices, fmt):
+    """
+    Format a run of ``vertices``, such as a LineString or a Polygon ring,
+    with the coordinate formatter ``fmt``, for example ``'0.0 1.0, 2.0 3.0'``.
+
+    All of the coordinate values of the run are formatted in one pass and then
+    regrouped by vertex, as long as the vertices all have the same number of
+    dimensions.
+    """
+    dims = set(map(len, vertices))
+    if len(dims) != 1 or 0 in dims:
+        return ', '.join(_format_vertex(vertex, fmt) for vertex in vertices)
+
+    [num_dims] = dims
+    values = map(fmt, itertools.chain.from_iterable(vertices))
+    return ', '.join(map(' '.join, zip(*[values] * num_dims)))
 
 
-def _dump_point(obj, decimals):
+def _iter_format_vertices(vertices, fmt):
+    """
+    Format a run of ``vertices`` like :func:`_format_vertices`, but generate
+    the text in chunks of at most ``_VERTICES_PER_CHUNK`` vertices, so that
+    the text for a very long run is never held in memory all at once.
+    """
+    for start in range(0, len(vertices), _VERTICES_PER_CHUNK):
+        chunk = vertices[start:start + _VERTICES_PER_CHUNK]
+        text = _format_vertices(chunk, fmt)
+        yield ', ' + text if start else text
+
+
+def _dump_point(obj, decimals, preserve_ints=False):
     """
     Dump a GeoJSON-like Point object to WKT.
 
@@ -212,24 +727,25 @@ def _dump_point(obj, decimals):
         A GeoJSON-like `dict` representing a Point.
     :param int decimals:
         int which indicates the number of digits to display after the
-        decimal point when formatting coordinates.
+        decimal point when formatting coordinates, or `None` for the shortest
+        representation of each value. See :func:`dumps`.
+    :param bool preserve_ints:
+        If `True`, format `int` coordinate values without a decimal point.
 
     :returns:
-        WKT representation of the input GeoJSON Point ``obj``.
+        A generator of the pieces of the WKT representation of the input
+        GeoJSON Point ``obj``.
     """
     coords = obj['coordinates']
 
     if not coords:
-        fmt = 'EMPTY'
+        yield 'POINT EMPTY'
     else:
-        fmt = '(%s)' % (
-            ' '.join(_round_and_pad(c, decimals) for c in coords)
-        )
-
-    return 'POINT %s' % fmt
+        coord_fmt = _coord_formatter(decimals, preserve_ints)
+        yield 'POINT (%s)' % _format_vertex(coords, coord_fmt)
 
 
-def _dump_linestring(obj, decimals):
+def _dump_linestring(obj, decimals, preserve_ints=False):
     """
     Dump a GeoJSON-like LineString object to WKT.
 
@@ -239,19 +755,16 @@ def _dump_linestring(obj, decimals):
     coords = obj['coordinates']
 
     if not coords:
-        fmt = 'EMPTY'
-    else:
-        fmt = '(%s)' % (
-            ', '.join(
-                ' '.join(_round_and_pad(c, decimals) for c in pt)
-                for pt in coords
-            )
-        )
+        yield 'LINESTRING EMPTY'
+        return
 
-    return 'LINESTRING %s' % fmt
+    coord_fmt = _coord_formatter(decimals, preserve_ints)
+    yield 'LINESTRING ('
+    yield from _iter_format_vertices(coords, coord_fmt)
+    yield ')'
 
 
-def _dump_polygon(obj, decimals):
+def _dump_polygon(obj, decimals, preserve_ints=False):
     """
     Dump a GeoJSON-like Polygon object to WKT.
 
@@ -261,18 +774,28 @@ def _dump_polygon(obj, decimals):
     coords = obj['coordinates']
 
     if not coords:
-        fmt = 'EMPTY'
-    else:
-        rings = (', '.join(' '.join(_round_and_pad(c, decimals)
-                                    for c in pt) for pt in ring)
-                 for ring in coords)
+        yield 'POLYGON EMPTY'
+        return
+
+    coord_fmt = _coord_formatter(decimals, preserve_ints)
+    yield 'POLYGON '
+    yield from _iter_format_rings(coords, coord_fmt)
 
-        fmt = '(%s)' % ', '.join('(%s)' % r for r in rings)
 
-    return 'POLYGON %s' % fmt
+def _iter_format_rings(rings, fmt):
+    """
+    Generate the WKT for the ``rings`` of a Polygon, or the LineStrings of a
+    MultiLineString, including the enclosing parentheses. For example,
+    ``'((0.0 0.0, 1.0 0.0, 0.0 1.0, 0.0 0.0))'``.
+    """
+    for i, ring in enumerate(rings):
+        yield ', (' if i else '(('
+        yield from _iter_format_vertices(ring, fmt)
+        yield ')'
+    yield ')'
 
 
-def _dump_multipoint(obj, decimals):
+def _dump_multipoint(obj, decimals, preserve_ints=False):
     """
     Dump a GeoJSON-like MultiPoint object to WKT.
 
@@ -282,17 +805,21 @@ def _dump_multipoint(obj, decimals):
     coords = obj['coordinates']
 
     if not coords:
-        fmt = "EMPTY"
-    else:
-        points = (' '.join(_round_and_pad(c, decimals)
-                           for c in pt) for pt in coords)
-        # Add parens around each point.
-        fmt = '(%s)' % ', '.join('(%s)' % pt for pt in points)
+        yield 'MULTIPOINT EMPTY'
+        return
 
-    return 'MULTIPOINT %s' % fmt
+    coord_fmt = _coord_formatter(decimals, preserve_ints)
+    yield 'MULTIPOINT ('
+    for start in range(0, len(coords), _VERTICES_PER_CHUNK):
+        chunk = coords[start:start + _VERTICES_PER_CHUNK]
+        # Add parens around each point.
+        text = ', '.join('(%s)' % _format_vertex(pt, coord_fmt)
+                         for pt in chunk)
+        yield ', ' + text if start else text
+    yield ')'
 
 
-def _dump_multilinestring(obj, decimals):
+def _dump_multilinestring(obj, decimals, preserve_ints=False):
     """
     Dump a GeoJSON-like MultiLineString object to WKT.
 
@@ -302,23 +829,15 @@ def _dump_multilinestring(obj, decimals):
     coords = obj['coordinates']
 
     if not coords:
-        fmt = 'EMPTY'
-    else:
-        linestrs = (
-            '(%s)' %
-            ', '.join(
-                ' '.join(
-                    _round_and_pad(
-                        c,
-                        decimals) for c in pt
-                ) for pt in linestr) for linestr in coords)
-
-        fmt = '(%s)' % ', '.join(ls for ls in linestrs)
+        yield 'MULTILINESTRING EMPTY'
+        return
 
-    return 'MULTILINESTRING %s' % fmt
+    coord_fmt = _coord_formatter(decimals, preserve_ints)
+    yield 'MULTILINESTRING '
+    yield from _iter_format_rings(coords, coord_fmt)
 
 
-def _dump_multipolygon(obj, decimals):
+def _dump_multipolygon(obj, decimals, preserve_ints=False):
     """
     Dump a GeoJSON-like MultiPolygon object to WKT.
 
@@ -326,29 +845,21 @@ def _dump_multipolygon(obj, decimals):
     :func:`_dump_point`.
     """
     coords = obj['coordinates']
+
     if not coords:
-        fmt = 'EMPTY'
-    else:
-        fmt = '(%s)' % (
-            # join the polygons in the multipolygon
-            ', '.join(
-                # join the rings in a polygon,
-                # and wrap in parens
-                '(%s)' % ', '.join(
-                    # join the points in a ring,
-                    # and wrap in parens
-                    '(%s)' % ', '.join(
-                        # join coordinate values of a vertex
-                        ' '.join(_round_and_pad(c, decimals) for c in pt)
-                        for pt in ring)
-                    for ring in poly)
-                for poly in coords)
-        )
+        yield 'MULTIPOLYGON EMPTY'
+        return
 
-    return 'MULTIPOLYGON %s' % fmt
+    coord_fmt = _coord_formatter(decimals, preserve_ints)
+    yield 'MULTIPOLYGON ('
+    for i, poly in enumerate(coords):
+        if i:
+            yield ', '
+        yield from _iter_format_rings(poly, coord_fmt)
+    yield ')'
 
 
-def _dump_geometrycollection(obj, decimals):
+def _dump_geometrycollection(obj, decimals, preserve_ints=False):
     """
     Dump a GeoJSON-like GeometryCollection object to WKT.
 
@@ -359,21 +870,24 @@ def _dump_geometrycollection(obj, decimals):
     their respective functions.
     """
     geoms = obj['geometries']
+
     if not geoms:
-        fmt = 'EMPTY'
-    else:
-        geoms_wkt = []
-        for geom in geoms:
-            geom_type = geom['type']
-            geoms_wkt.append(_dumps_registry.get(geom_type)(geom, decimals))
-        fmt = '(%s)' % ','.join(geoms_wkt)
-    return 'GEOMETRYCOLLECTION %s' % fmt
+        yield 'GEOMETRYCOLLECTION EMPTY'
+        return
+
+    yield 'GEOMETRYCOLLECTION ('
+    for i, geom in enumerate(geoms):
+        if i:
+            yield ','
+        exporter = _dumps_registry.get(geom['type'])
+        yield from exporter(geom, decimals, preserve_ints)
+    yield ')'
 
 
 def _load_point(tokens, string):
     """
     :param tokens:
-        A generator of string tokens for the input WKT, beginning just after
+        A :class:`_WKTScanner` of the input WKT, positioned just after
         the geometry type. The geometry type is consumed before we get to
         here. For example, if :func:`loads` is called with the input
         'POINT(0.0 1.0)', ``tokens`` would generate the following values:
@@ -394,14 +908,11 @@ def _load_point(tokens, string):
         raise ValueError(INVALID_WKT_FMT % string)
 
     coords = []
-    try:
-        for t in tokens:
-            if t == ')':
-                break
-            else:
-                coords.append(float(t))
-    except tokenize.TokenError:
-        raise ValueError(INVALID_WKT_FMT % string)
+    for t in tokens:
+        if t == ')':
+            break
+        else:
+            coords.append(float(t))
 
     return dict(type='Point', coordinates=coords)
 
@@ -423,22 +934,7 @@ def _load_linestring(tokens, string):
 
     # a list of lists
     # each member list represents a point
-    coords = []
-    try:
-        pt = []
-        for t in tokens:
-            if t == ')':
-                coords.append(pt)
-                break
-            elif t == ',':
-                # it's the end of the point
-                coords.append(pt)
-                pt = []
-            else:
-                pt.append(float(t))
-    except tokenize.TokenError:
-        raise ValueError(INVALID_WKT_FMT % string)
-
+    coords = tokens.next_vertices()
     return dict(type='LineString', coordinates=coords)
 
 
@@ -461,38 +957,26 @@ def _load_polygon(tokens, string):
     # coords contains a list of rings
     # each ring contains a list of points
     # each point is a list of 2-4 values
-    coords = []
+    if tokens.peek() == '(':
+        # Each ring is wrapped in an extra pair of parentheses, so there is no
+        # ring here yet. Be lenient, and read the rings in the loop below.
+        coords = []
+    else:
+        coords = [tokens.next_vertices()]
 
-    ring = []
-    on_ring = True
-    try:
-        pt = []
-        for t in tokens:
-            if t == ')' and on_ring:
-                # The ring is finished
-                ring.append(pt)
-                coords.append(ring)
-                on_ring = False
-            elif t == ')' and not on_ring:
-                # it's the end of the polygon
-                break
-            elif t == '(':
-                # it's a new ring
-                ring = []
-                pt = []
-                on_ring = True
-            elif t == ',' and on_ring:
-                # it's the end of a point
-                ring.append(pt)
-                pt = []
-            elif t == ',' and not on_ring:
-                # there's another ring.
-                # do nothing
-                pass
-            else:
-                pt.append(float(t))
-    except tokenize.TokenError:
-        raise ValueError(INVALID_WKT_FMT % string)
+    for t in tokens:
+        if t == ')':
+            # it's the end of the polygon
+            break
+        elif t == '(':
+            # it's a new ring
+            coords.append(tokens.next_vertices())
+        elif t == ',':
+            # there's another ring.
+            # do nothing
+            pass
+        else:
+            raise ValueError(INVALID_WKT_FMT % string)
 
     return dict(type='Polygon', coordinates=coords)
 
@@ -505,40 +989,44 @@ def _load_multipoint(tokens, string):
     :returns:
         A GeoJSON `dict` MultiPoint representation of the WKT ``string``.
     """
+    coords = [pt['coordinates'] for pt in _iter_multipoint(tokens, string)]
+    return dict(type='MultiPoint', coordinates=coords)
+
+
+def _iter_multipoint(tokens, string):
+    """
+    Generate the points of a MULTIPOINT, each as a GeoJSON Point `dict`.
+
+    Inputs are similar to :func:`_load_point`.
+    """
     next_token = next(tokens)
 
     if next_token == 'EMPTY':
-        return dict(type='MultiPoint', coordinates=[])
+        return
     elif not next_token == '(':
         raise ValueError(INVALID_WKT_FMT % string)
 
-    coords = []
     pt = []
 
     paren_depth = 1
-    try:
-        for t in tokens:
-            if t == '(':
-                paren_depth += 1
-            elif t == ')':
-                paren_depth -= 1
-                if paren_depth == 0:
-                    break
-            elif t == ',':
-                # the point is done
-                coords.append(pt)
-                pt = []
-            else:
-                pt.append(float(t))
-    except tokenize.TokenError:
-        raise ValueError(INVALID_WKT_FMT % string)
+    for t in tokens:
+        if t == '(':
+            paren_depth += 1
+        elif t == ')':
+            paren_depth -= 1
+            if paren_depth == 0:
+                break
+        elif t == ',':
+            # the point is done
+            yield dict(type='Point', coordinates=pt)
+            pt = []
+        else:
+            pt.append(float(t))
 
     # Given the way we're parsing, we'll probably have to deal with the last
     # point after the loop
     if len(pt) > 0:
-        coords.append(pt)
-
-    return dict(type='MultiPoint', coordinates=coords)
+        yield dict(type='Point', coordinates=pt)
 
 
 def _load_multipolygon(tokens, string):
@@ -549,28 +1037,36 @@ def _load_multipolygon(tokens, string):
     :returns:
         A GeoJSON `dict` MultiPolygon representation of the WKT ``string``.
     """
+    polygons = [poly['coordinates']
+                for poly in _iter_multipolygon(tokens, string)]
+    return dict(type='MultiPolygon', coordinates=polygons)
+
+
+def _iter_multipolygon(tokens, string):
+    """
+    Generate the polygons of a MULTIPOLYGON, each as a GeoJSON Polygon
+    `dict`.
+
+    Inputs are similar to :func:`_load_point`.
+    """
     next_token = next(tokens)
 
     if next_token == 'EMPTY':
-        return dict(type='MultiPolygon', coordinates=[])
+        return
     elif not next_token == '(':
         raise ValueError(INVALID_WKT_FMT % string)
 
-    polygons = []
     while True:
         try:
-            poly = _load_polygon(tokens, string)
-            polygons.append(poly['coordinates'])
+            yield _load_polygon(tokens, string)
             t = next(tokens)
             if t == ')':
                 # we're done; no more polygons.
                 break
-        except (StopIteration, tokenize.TokenError):
+        except StopIteration:
             # If we reach this, the WKT is not valid.
             raise ValueError(INVALID_WKT_FMT % string)
 
-    return dict(type='MultiPolygon', coordinates=polygons)
-
 
 def _load_multilinestring(tokens, string):
     """
@@ -580,28 +1076,36 @@ def _load_multilinestring(tokens, string):
     :returns:
         A GeoJSON `dict` MultiLineString representation of the WKT ``string``.
     """
+    linestrs = [linestr['coordinates']
+                for linestr in _iter_multilinestring(tokens, string)]
+    return dict(type='MultiLineString', coordinates=linestrs)
+
+
+def _iter_multilinestring(tokens, string):
+    """
+    Generate the linestrings of a MULTILINESTRING, each as a GeoJSON
+    LineString `dict`.
+
+    Inputs are similar to :func:`_load_point`.
+    """
     next_token = next(tokens)
 
     if next_token == 'EMPTY':
-        return dict(type='MultiLineString', coordinates=[])
+        return
     elif not next_token == '(':
         raise ValueError(INVALID_WKT_FMT % string)
 
-    linestrs = []
     while True:
         try:
-            linestr = _load_linestring(tokens, string)
-            linestrs.append(linestr['coordinates'])
+            yield _load_linestring(tokens, string)
             t = next(tokens)
             if t == ')':
                 # we're done; no more linestrings.
                 break
-        except (StopIteration, tokenize.TokenError):
+        except StopIteration:
             # If we reach this, the WKT is not valid.
             raise ValueError(INVALID_WKT_FMT % string)
 
-    return dict(type='MultiLineString', coordinates=linestrs)
-
 
 def _load_geometrycollection(tokens, string):
     """
@@ -614,15 +1118,24 @@ def _load_geometrycollection(tokens, string):
         A GeoJSON `dict` GeometryCollection representation of the WKT
         ``string``.
     """
+    geoms = list(_iter_geometrycollection(tokens, string))
+    return dict(type='GeometryCollection', geometries=geoms)
+
+
+def _iter_geometrycollection(tokens, string):
+    """
+    Generate the member geometries of a GEOMETRYCOLLECTION, each as a GeoJSON
+    `dict`.
+
+    Inputs are similar to :func:`_load_point`.
+    """
     next_token = next(tokens)
 
     if next_token == 'EMPTY':
-        return dict(type='GeometryCollection', geometries=[])
+        return
     elif not next_token == '(':
         raise ValueError(INVALID_WKT_FMT % string)
 
-    geoms = []
-    result = dict(type='GeometryCollection', geometries=geoms)
     while True:
         try:
             t = next(tokens)
@@ -634,11 +1147,9 @@ def _load_geometrycollection(tokens, string):
             else:
                 geom_type = t
                 load_func = _loads_registry.get(geom_type)
-                geom = load_func(tokens, string)
-                geoms.append(geom)
-        except (StopIteration, tokenize.TokenError):
+                yield load_func(tokens, string)
+        except StopIteration:
             raise ValueError(INVALID_WKT_FMT % string)
-    return result
 
 
 _dumps_registry = {
@@ -662,6 +1173,14 @@ _loads_registry = {
     'GEOMETRYCOLLECTION': _load_geometrycollection,
 }
 
+# Generators of the parts of multi-part geometries, for `iter_load_parts`.
+_iter_parts_registry = {
+    'MULTIPOINT': _iter_multipoint,
+    'MULTILINESTRING': _iter_multilinestring,
+    'MULTIPOLYGON': _iter_multipolygon,
+    'GEOMETRYCOLLECTION': _iter_geometrycollection,
+}
+
 _type_map_caps_to_mixed = dict(
     POINT='Point',
     LINESTRING='LineString',